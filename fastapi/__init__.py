@@ -68,4 +68,15 @@ class Response:
         self.headers = headers or {}
 
 
-from .responses import JSONResponse, StreamingResponse  # noqa: E402
+from .responses import JSONResponse, PlainTextResponse, StreamingResponse  # noqa: E402
+
+__all__ = [
+    "FastAPI",
+    "Header",
+    "HTTPException",
+    "JSONResponse",
+    "PlainTextResponse",
+    "Response",
+    "SimpleRequest",
+    "StreamingResponse",
+]
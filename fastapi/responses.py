@@ -10,6 +10,14 @@ class JSONResponse:
         self.headers = headers or {}
 
 
+class PlainTextResponse:
+    def __init__(self, content: str, status_code: int = 200, media_type: str = "text/plain"):
+        self.content = content
+        self.status_code = status_code
+        self.media_type = media_type
+        self.headers: Dict[str, str] = {"content-type": media_type}
+
+
 class StreamingResponse:
     def __init__(self, iterator: AsyncIterator[bytes], media_type: str = "text/plain"):
         self.iterator = iterator
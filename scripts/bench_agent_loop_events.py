@@ -0,0 +1,82 @@
+"""Micro-benchmark: per-event cost of AgentLoop stream decoding, full AgentState validation vs. projection.
+
+Builds ``stream_mode="updates"`` payloads the size of a long-running task (many stored variables, a long
+message history) and times decoding one event both ways.
+
+Usage:
+    python scripts/bench_agent_loop_events.py --variables 10 100 1000 --messages 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from langchain_core.messages import AIMessage
+
+from cuga.backend.cuga_graph.state.agent_state import AgentState
+from cuga.backend.cuga_graph.utils import event_projection
+
+
+def _update(variables: int, messages: int) -> dict:
+    return {
+        "input": "benchmark task",
+        "url": "http://localhost",
+        "variables_storage": {
+            f"var_{i}": {
+                "value": [{"id": j, "name": f"item {j}", "tags": ["a", "b"]} for j in range(20)],
+                "description": f"variable {i}",
+                "type": "list",
+                "count_items": 20,
+            }
+            for i in range(variables)
+        },
+        "variable_creation_order": [f"var_{i}" for i in range(variables)],
+        "messages": [
+            AIMessage(content=f"message {i}", tool_calls=[{"name": "t", "args": {"i": i}, "id": str(i)}])
+            for i in range(messages)
+        ],
+        "stm_steps_history": [f"step {i}" for i in range(messages)],
+        "final_answer": "done",
+    }
+
+
+def _full_state(node: str, update: dict) -> str:
+    """The pre-projection decoding: validate the whole state, then read the last message."""
+    state = AgentState(**update)
+    value = state.messages[-1].content if state.messages else None
+    if node == "ActionAgent":
+        value = json.dumps(state.messages[-1].tool_calls)
+    return value or ""
+
+
+def _timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variables", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    for variables in args.variables:
+        update = _update(variables, args.messages)
+        for node in ("CugaLite", "ActionAgent"):
+            assert _full_state(node, update) == event_projection.event_data(node, update)
+            full_us = _timeit(lambda: _full_state(node, update), args.repeat)
+            projected_us = _timeit(lambda: event_projection.event_data(node, update), args.repeat)
+            print(
+                f"variables={variables:>6,} node={node:<12} "
+                f"full={full_us:10.1f} us/event projected={projected_us:8.1f} us/event "
+                f"speedup={full_us / projected_us:8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
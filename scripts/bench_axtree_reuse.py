@@ -0,0 +1,129 @@
+"""Micro-benchmark: PageUnderstandingCached vs. PageUnderstandingV1 per browser step.
+
+Simulates a session on one large page where some steps change a few nodes (a text value, a visibility flip)
+and the others leave the page as it was, each step being a fresh extraction. Changed steps cost a flatten
+plus one tree comparison; unchanged steps cost only the comparison. Both transformers send the same text.
+
+Usage:
+    python scripts/bench_axtree_reuse.py --sections 50 --items 40 --steps 20 --changes 3 --unchanged 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import random
+import time
+
+from cuga.backend.browser_env.page_understanding.pu_extractor import PUExtracted
+from cuga.backend.browser_env.page_understanding.pu_transform import (
+    PageUnderstandingCached,
+    PageUnderstandingV1,
+)
+
+
+def build_page(sections: int, items: int):
+    """A product listing: sections of lists of items, each a link, a button and a price."""
+    nodes, extra = [], {}
+
+    def add(role, name, bid=None, properties=(), parent=None):
+        node = {
+            "nodeId": str(len(nodes)),
+            "role": {"value": role},
+            "childIds": [],
+            "properties": [{"name": k, "value": {"value": v}} for k, v in properties],
+        }
+        if name is not None:
+            node["name"] = {"value": name}
+        if bid is not None:
+            node["browsergym_id"] = bid
+            extra[bid] = {"visibility": 1.0, "bbox": [0, 0, 10, 10], "clickable": True, "set_of_marks": True}
+        if parent is not None:
+            parent["childIds"].append(node["nodeId"])
+        nodes.append(node)
+        return node
+
+    root = add("RootWebArea", "Shop", "r")
+    for s in range(sections):
+        section = add("region", f"Section {s}", f"s{s}", parent=root)
+        listing = add("list", "", f"l{s}", parent=section)
+        for i in range(items):
+            item = add("listitem", "", f"i{s}.{i}", parent=listing)
+            wrapper = add("generic", None, parent=item)
+            link = add(
+                "link",
+                f"Product {s}-{i}",
+                f"a{s}.{i}",
+                [("focusable", True), ("url", f"https://shop.example/p/{s}/{i}")],
+                parent=wrapper,
+            )
+            add("StaticText", f"Product {s}-{i}", parent=link)
+            add(
+                "button",
+                "Add to cart",
+                f"b{s}.{i}",
+                [("focusable", True), ("describedby", f"Product {s}-{i}"), ("haspopup", "dialog")],
+                parent=wrapper,
+            )
+            add("StaticText", f"${i}.99", parent=wrapper)
+    return {"nodes": nodes}, extra
+
+
+def mutate(tree, extra, changes: int, rng: random.Random):
+    tree, extra = copy.deepcopy(tree), copy.deepcopy(extra)
+    texts = [node for node in tree["nodes"] if node["role"]["value"] == "StaticText"]
+    for node in rng.sample(texts, changes):
+        node["name"]["value"] = f"${rng.randint(1, 99)}.{rng.randint(0, 99):02d}"
+    bid = rng.choice(list(extra))
+    extra[bid]["visibility"] = 1.0 - extra[bid]["visibility"]
+    return tree, extra
+
+
+async def run(transformer, extractions) -> float:
+    start = time.perf_counter()
+    for extracted in extractions:
+        await transformer.transform(extracted)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--changes", type=int, default=3)
+    parser.add_argument(
+        "--unchanged", type=float, default=0.5, help="fraction of steps that leave the page as is"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tree, extra = build_page(args.sections, args.items)
+    extractions = []
+    for _ in range(args.steps):
+        if rng.random() >= args.unchanged:
+            tree, extra = mutate(tree, extra, args.changes, rng)
+        # every step is a fresh extraction, equal to the previous one when the page did not change
+        extractions.append(
+            PUExtracted(
+                accessibility_tree=copy.deepcopy(tree),
+                extra_properties=copy.deepcopy(extra),
+                screenshot="",
+                page_content_as_str="",
+            )
+        )
+
+    per_step = 1000 / args.steps
+    full_s = asyncio.run(run(PageUnderstandingV1(), extractions))
+    cached_s = asyncio.run(run(PageUnderstandingCached(), extractions))
+    print(
+        f"nodes={len(tree['nodes']):>7,} steps={args.steps} unchanged={args.unchanged:.0%} "
+        f"v1={full_s * per_step:7.1f} ms/step cached={cached_s * per_step:7.1f} ms/step "
+        f"({full_s / cached_s:4.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
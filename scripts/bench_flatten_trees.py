@@ -0,0 +1,172 @@
+"""Micro-benchmark: flatten_axtree_to_str and flatten_domtree_to_str on large pages.
+
+Times both flatteners on synthetic pages of 10k-100k nodes, or on recorded trees: a JSON file holding a
+browsergym observation (``axtree_object`` and optionally ``extra_element_properties``) or a bare AX tree
+(``{"nodes": [...]}``) for --ax-tree, and a Chrome extension ``DomTreeResult`` dump for --dom-tree.
+``--depth`` controls how deeply the synthetic content is nested (wrapper elements per item).
+
+Usage:
+    python scripts/bench_flatten_trees.py --nodes 10000 30000 100000 --depth 4 20
+    python scripts/bench_flatten_trees.py --ax-tree obs.json --dom-tree dom_tree.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from cuga.backend.browser_env.page_understanding.tranformer_utils.dom_transform_utils import (
+    flatten_domtree_to_str,
+)
+from cuga.backend.browser_env.page_understanding.tranformer_utils.transform_utils import flatten_axtree_to_str
+from cuga.backend.browser_env.page_understanding.types.dom_tree_types import DomTreeResult
+
+
+def build_axtree(nodes: int, depth: int):
+    """Sections of items, each item wrapped ``depth`` levels deep: a link, a button and a price."""
+    ax_nodes, extra = [], {}
+
+    def add(role, name, parent, bid=None, properties=()):
+        node = {
+            "nodeId": str(len(ax_nodes)),
+            "role": {"value": role},
+            "childIds": [],
+            "properties": [{"name": k, "value": {"value": v}} for k, v in properties],
+        }
+        if name is not None:
+            node["name"] = {"value": name}
+        if bid is not None:
+            node["browsergym_id"] = bid
+            extra[bid] = {"visibility": 1.0, "bbox": [0, 0, 10, 10], "clickable": True, "set_of_marks": True}
+        if parent is not None:
+            parent["childIds"].append(node["nodeId"])
+        ax_nodes.append(node)
+        return node
+
+    root = add("RootWebArea", "Shop", None, "root")
+    section = None
+    while len(ax_nodes) < nodes:
+        i = len(ax_nodes)
+        if section is None or len(section["childIds"]) >= 50:
+            section = add("region", f"Section {i}", root, f"s{i}")
+        parent = section
+        for level in range(depth):
+            parent = add("generic", None, parent, properties=[("level", level)])
+        link = add("link", f"Product {i}", parent, f"a{i}", [("focusable", True), ("url", f"/p/{i}")])
+        add("StaticText", f"Product {i}", link)
+        add("button", "Add to cart", parent, f"b{i}", [("focusable", True), ("describedby", f"Product {i}")])
+        add("StaticText", f"${i % 100}.99", parent)
+    return {"nodes": ax_nodes}, extra
+
+
+def build_domtree(nodes: int, depth: int) -> DomTreeResult:
+    """The same page as ``build_axtree``, as a Chrome extension DOM tree."""
+    node_map = {}
+
+    def add(tag, parent, attributes=None, text=None, highlight=True):
+        node_id = str(len(node_map))
+        if text is not None:
+            node_map[node_id] = {"type": "TEXT_NODE", "text": text, "isVisible": True}
+        else:
+            node_map[node_id] = {
+                "tagName": tag,
+                "attributes": attributes or {},
+                "xpath": f"/html/body/{tag}[{node_id}]",
+                "domTreeId": int(node_id),
+                "children": [],
+                "isVisible": True,
+                "isInteractive": tag in ("a", "button"),
+                "highlightIndex": int(node_id) if highlight else None,
+            }
+        if parent is not None:
+            node_map[parent]["children"].append(node_id)
+        return node_id
+
+    root = add("body", None)
+    section = None
+    while len(node_map) < nodes:
+        i = len(node_map)
+        if section is None or len(node_map[section]["children"]) >= 50:
+            section = add("section", root, {"aria-label": f"Section {i}"})
+        parent = section
+        for _ in range(depth):
+            parent = add("div", parent, {"class": "wrapper"}, highlight=False)
+        link = add("a", parent, {"href": f"/p/{i}", "title": f"Product {i}"})
+        add(None, link, text=f"Product {i}")
+        add("button", parent, {"aria-label": "Add to cart", "data-testid": "add"})
+        add(None, parent, text=f"${i % 100}.99")
+    return DomTreeResult.model_validate({"rootId": root, "map": node_map})
+
+
+def load_axtree(path: str):
+    with open(path) as f:
+        data = json.load(f)
+    if "axtree_object" in data:
+        return data["axtree_object"], data.get("extra_element_properties") or {}
+    return data, {}
+
+
+def load_domtree(path: str) -> DomTreeResult:
+    with open(path) as f:
+        return DomTreeResult.model_validate(json.load(f))
+
+
+def timed(fn, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+def report(label: str, nodes: int, seconds: float, text: str) -> None:
+    print(
+        f"{label:<28} nodes={nodes:>8,} {seconds * 1000:8.1f} ms {nodes / seconds:>11,.0f} nodes/s "
+        f"lines={text.count(chr(10)) + 1:>7,} chars={len(text):>10,}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10000, 30000, 100000])
+    parser.add_argument("--depth", type=int, nargs="+", default=[4, 20])
+    parser.add_argument("--ax-tree", help="Recorded browsergym observation or AX tree (JSON)")
+    parser.add_argument("--dom-tree", help="Recorded DomTreeResult (JSON)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # the recursive flatteners stopped at the default recursion limit; make sure deep pages are covered
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+    if args.ax_tree or args.dom_tree:
+        if args.ax_tree:
+            tree, extra = load_axtree(args.ax_tree)
+            seconds, text = timed(lambda: flatten_axtree_to_str(tree, extra), args.repeat)
+            report(f"axtree {args.ax_tree}", len(tree["nodes"]), seconds, text)
+        if args.dom_tree:
+            dom_tree = load_domtree(args.dom_tree)
+            seconds, text = timed(lambda: flatten_domtree_to_str(dom_tree, {}), args.repeat)
+            report(f"domtree {args.dom_tree}", len(dom_tree.map), seconds, text)
+        return
+
+    for nodes in args.nodes:
+        for depth in args.depth:
+            tree, extra = build_axtree(nodes, depth)
+            seconds, text = timed(lambda: flatten_axtree_to_str(tree, extra), args.repeat)
+            report(f"axtree depth={depth}", len(tree["nodes"]), seconds, text)
+            dom_tree = build_domtree(nodes, depth)
+            seconds, text = timed(lambda: flatten_domtree_to_str(dom_tree, {}), args.repeat)
+            report(f"domtree depth={depth}", len(dom_tree.map), seconds, text)
+    for depth in (2000, 5000):
+        tree, extra = build_axtree(depth, depth)
+        seconds, text = timed(lambda: flatten_axtree_to_str(tree, extra), args.repeat)
+        report(f"axtree depth={depth}", len(tree["nodes"]), seconds, text)
+        dom_tree = build_domtree(depth, depth)
+        seconds, text = timed(lambda: flatten_domtree_to_str(dom_tree, {}), args.repeat)
+        report(f"domtree depth={depth}", len(dom_tree.map), seconds, text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Micro-benchmark: VectorMemory inverted-index search vs. the previous linear scan.
+
+Usage:
+    python scripts/bench_memory_local_search.py --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import List
+
+from cuga.modular.memory import VectorMemory
+from cuga.modular.types import MemoryRecord
+
+VOCABULARY = [f"term{i}" for i in range(5000)]
+
+
+def _linear_scan(store: List[MemoryRecord], query: str, top_k: int) -> List[MemoryRecord]:
+    """The pre-index implementation: re-tokenize every record on every query."""
+    query_terms = set(re.findall(r"[a-z0-9]+", query.lower()))
+    scored = []
+    for record in store:
+        record_terms = set(re.findall(r"[a-z0-9]+", record.text.lower()))
+        overlap = len(query_terms & record_terms)
+        if overlap:
+            scored.append((overlap / len(query_terms), record))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [record for _, record in scored[:top_k]]
+
+
+def _timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000.0
+
+
+def run(size: int, queries: int, scan_queries: int, top_k: int, rng: random.Random) -> None:
+    memory = VectorMemory(profile="bench", backend_name="local")
+    start = time.perf_counter()
+    for _ in range(size):
+        memory.remember(" ".join(rng.choices(VOCABULARY, k=12)))
+    ingest_s = time.perf_counter() - start
+
+    query_texts = [" ".join(rng.choices(VOCABULARY, k=3)) for _ in range(max(queries, scan_queries))]
+    index_ms = _timeit(lambda: [memory.search(q, top_k=top_k) for q in query_texts[:queries]], 1) / queries
+    scan_ms = (
+        _timeit(lambda: [_linear_scan(memory.store, q, top_k) for q in query_texts[:scan_queries]], 1)
+        / scan_queries
+    )
+    print(
+        f"records={size:>9,} ingest={ingest_s:7.2f}s "
+        f"index={index_ms:9.3f} ms/query scan={scan_ms:10.3f} ms/query speedup={scan_ms / index_ms:8.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=5, help="The scan is slow; keep this small")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    for size in args.sizes:
+        run(size, args.queries, args.scan_queries, args.top_k, rng)
+
+
+if __name__ == "__main__":
+    main()
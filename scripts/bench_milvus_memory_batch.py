@@ -0,0 +1,100 @@
+"""Micro-benchmark: MilvusMemoryBackend single-fact inserts vs. the batched create_and_store_facts path.
+
+Runs against a throwaway Milvus Lite database. The memory settings must be loaded, e.g. with
+DYNACONF_ADVANCED_FEATURES__ENABLE_MEMORY=true DYNACONF_FEATURES__MEMORY_PROVIDER=milvus.
+
+Usage:
+    python scripts/bench_milvus_memory_batch.py --facts 2000 --batch-size 64
+    python scripts/bench_milvus_memory_batch.py --hash-embeddings  # skip the model, measure Milvus only
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+VOCABULARY = [f"term{i}" for i in range(5000)]
+EMBEDDING_DIM = 384  # fact_schema's vector size (all-MiniLM-L6-v2)
+
+
+class HashEncoder:
+    """Deterministic stand-in for SentenceTransformer.encode with no model cost."""
+
+    def _vector(self, text: str) -> np.ndarray:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(EMBEDDING_DIM).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def encode(self, sentences, batch_size: int = 32, **_):
+        if isinstance(sentences, str):
+            return self._vector(sentences)
+        return np.stack([self._vector(text) for text in sentences])
+
+
+def _new_collection(backend, fact_schema, name: str) -> str:
+    backend.milvus.create_collection(collection_name=name, schema=fact_schema)
+    return name
+
+
+def run(backend, fact_schema, Fact, facts: int, batch_size: int, rng: random.Random) -> None:
+    contents = [" ".join(rng.choices(VOCABULARY, k=12)) for _ in range(facts)]
+    batch = [Fact(content=text, metadata={"bench": True}) for text in contents]
+
+    single_ns = _new_collection(backend, fact_schema, f"bench_single_{facts}")
+    start = time.perf_counter()
+    for fact in batch:
+        backend.create_and_store_fact(single_ns, fact)
+    single_s = time.perf_counter() - start
+
+    batched_ns = _new_collection(backend, fact_schema, f"bench_batched_{facts}")
+    start = time.perf_counter()
+    for i in range(0, facts, batch_size):
+        backend.create_and_store_facts(batched_ns, batch[i : i + batch_size], batch_size=batch_size)
+    batched_s = time.perf_counter() - start
+
+    assert backend.milvus.get_collection_stats(batched_ns)["row_count"] == facts
+    print(
+        f"facts={facts:>7,} batch={batch_size:>4} "
+        f"single={facts / single_s:9.1f} facts/s batched={facts / batched_s:9.1f} facts/s "
+        f"speedup={single_s / batched_s:6.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument(
+        "--hash-embeddings", action="store_true", help="Use a hashing encoder instead of the model"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The backend opens ./memory.db when its module is imported; keep it out of the checkout.
+        os.chdir(workdir)
+        from pymilvus import MilvusClient
+
+        from cuga.backend.memory.agentic_memory.backend.milvus import MilvusMemoryBackend
+        from cuga.backend.memory.agentic_memory.schema import Fact, fact_schema
+
+        backend = MilvusMemoryBackend()
+        backend.milvus = MilvusClient(os.path.join(workdir, "bench.db"))
+        if args.hash_embeddings:
+            backend.embedding_model = HashEncoder()
+        backend.embedding_model.encode(["warm up"])
+
+        rng = random.Random(args.seed)
+        for facts in args.facts:
+            run(backend, fact_schema, Fact, facts, args.batch_size, rng)
+        backend.milvus.close()
+
+
+if __name__ == "__main__":
+    main()
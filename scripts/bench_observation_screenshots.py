@@ -0,0 +1,84 @@
+"""Micro-benchmark: per-step screenshot cost of the browser observation, three captures vs. one shared capture.
+
+Before, one ``BrowserEnvGymAsync._get_obs`` step took a CDP screenshot decoded to an array, then
+``PageUnderstandingExtractor.extract`` took two more (``img`` and ``screenshot``). Now the step captures once
+and decodes the array only if a consumer reads it. Needs Playwright with Chromium installed
+(``playwright install chromium``).
+
+Usage:
+    python scripts/bench_observation_screenshots.py --steps 20 --width 1280 --height 720
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+from playwright.async_api import async_playwright
+
+from cuga.backend.browser_env.page_understanding.extractor_utils.extract_async import (
+    PageScreenshot,
+    extract_screenshot,
+    extract_screenshot_base64,
+)
+
+
+def _page_html(rows: int) -> str:
+    cells = "".join(
+        f"<tr><td>row {i}</td><td><input value='{i}'></td><td><button>go {i}</button></td></tr>"
+        for i in range(rows)
+    )
+    return f"<html><body><h1>Benchmark</h1><table>{cells}</table></body></html>"
+
+
+async def _three_captures(page) -> None:
+    """The previous pipeline: gym array, PU ``img`` and PU ``screenshot``."""
+    await extract_screenshot(page)
+    await extract_screenshot_base64(page)
+    await extract_screenshot_base64(page)
+
+
+async def _single_capture(page, decode: bool) -> None:
+    shot = await PageScreenshot.capture(page)
+    if decode:
+        np.asarray(shot)
+
+
+async def _time_steps(step, steps: int) -> float:
+    start = time.perf_counter()
+    for _ in range(steps):
+        await step()
+    return (time.perf_counter() - start) / steps * 1000.0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(viewport={"width": args.width, "height": args.height})
+        page = await context.new_page()
+        await page.set_content(_page_html(args.rows))
+        await _single_capture(page, decode=True)  # warm up
+
+        before_ms = await _time_steps(lambda: _three_captures(page), args.steps)
+        lazy_ms = await _time_steps(lambda: _single_capture(page, decode=False), args.steps)
+        decoded_ms = await _time_steps(lambda: _single_capture(page, decode=True), args.steps)
+        print(
+            f"viewport={args.width}x{args.height} steps={args.steps} "
+            f"three_captures={before_ms:8.1f} ms/step "
+            f"single_capture={lazy_ms:8.1f} ms/step ({before_ms / lazy_ms:4.1f}x) "
+            f"single_capture+array={decoded_ms:8.1f} ms/step ({before_ms / decoded_ms:4.1f}x)"
+        )
+        await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
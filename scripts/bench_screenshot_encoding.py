@@ -0,0 +1,125 @@
+"""Micro-benchmark: observation screenshot size and cost per ScreenshotOptions configuration.
+
+Runs offline on a recorded screenshot (--image) or on a synthetic page-like frame, so no browser is needed.
+Each configuration's frame is first encoded the way CDP would return it (format and quality) and then passed
+through ``ScreenshotEncoder.encode`` (downscaling, dedup by hash and low-resolution pixel diff). The report shows the base64 payload stored in
+``PuAnswer.img`` and in every tracker step, an estimate of the image tokens a multimodal model bills
+(width * height / 750), and the encoder's own time per frame. CDP's encoding time is not included.
+
+Usage:
+    python scripts/bench_screenshot_encoding.py --width 1280 --height 720
+    python scripts/bench_screenshot_encoding.py --image screenshot.png --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import time
+
+import numpy as np
+import PIL.Image
+import PIL.ImageDraw
+import PIL.ImageFont
+
+from cuga.backend.browser_env.page_understanding.extractor_utils.screenshot_encoding import (
+    SCREENSHOT_FORMATS,
+    ScreenshotEncoder,
+    ScreenshotOptions,
+    difference_hash,
+)
+
+CONFIGURATIONS = [
+    ScreenshotOptions(),
+    ScreenshotOptions(format="webp", quality=80),
+    ScreenshotOptions(format="jpeg", quality=80),
+    ScreenshotOptions(format="jpeg", quality=80, max_width=1024, max_height=1024),
+    ScreenshotOptions(format="webp", quality=70, max_width=768, max_height=768),
+]
+
+
+def synthetic_page(width: int, height: int, seed: int) -> PIL.Image.Image:
+    """A product listing: header bar, cards with photo-like gradients and rows of anti-aliased text."""
+    rng = np.random.default_rng(seed)
+    page = PIL.Image.new("RGB", (width, height), "white")
+    draw = PIL.ImageDraw.Draw(page)
+    font = PIL.ImageFont.load_default(size=14)
+    draw.rectangle((0, 0, width, height // 12), fill=(33, 37, 41))
+    draw.text((16, height // 40), "Shop  Deals  Orders  Account", fill="white", font=font)
+    yy, xx = np.mgrid[0:120, 0:160]
+    for top in range(height // 10, height - 180, 190):
+        for left in range(16, width - 200, 210):
+            base = rng.integers(0, 255, 3)
+            photo = (
+                base + 0.6 * xx[..., None] + 0.4 * yy[..., None] + rng.normal(0, 12, (120, 160, 3))
+            ) % 256
+            page.paste(PIL.Image.fromarray(photo.astype(np.uint8)), (left, top))
+            draw.text((left, top + 128), f"Product {int(rng.integers(1000))}", fill=(20, 20, 20), font=font)
+            draw.text((left, top + 148), f"${rng.integers(5, 500)}.99", fill=(180, 30, 30), font=font)
+    return page
+
+
+def cdp_frame(image: PIL.Image.Image, options: ScreenshotOptions) -> str:
+    """The base64 frame ``Page.captureScreenshot`` returns for the options' format and quality."""
+    params = {"format": SCREENSHOT_FORMATS[options.format]}
+    if options.format != "png":
+        params["quality"] = options.quality
+    with io.BytesIO() as f:
+        image.convert("RGB").save(f, **params)
+        return base64.b64encode(f.getvalue()).decode()
+
+
+def describe(options: ScreenshotOptions) -> str:
+    label = options.format if options.format == "png" else f"{options.format} q{options.quality}"
+    if options.max_width or options.max_height:
+        label += f" max {options.max_width or '-'}x{options.max_height or '-'}"
+    return label
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--image", help="Recorded screenshot to encode instead of a synthetic page")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    image = PIL.Image.open(args.image) if args.image else synthetic_page(args.width, args.height, args.seed)
+    image.load()
+    print(f"frame {image.width}x{image.height}")
+
+    baseline = None
+    for options in CONFIGURATIONS:
+        frame = cdp_frame(image, options)
+        encoder = ScreenshotEncoder(options)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            shot = encoder.encode(frame)
+        encode_ms = (time.perf_counter() - start) * 1000 / args.repeat
+        height, width = shot.array.shape[:2]
+        baseline = baseline or len(shot.base64)
+        print(
+            f"{describe(options):<28} {width:>5}x{height:<5} base64={len(shot.base64):>10,} chars "
+            f"({baseline / len(shot.base64):5.1f}x smaller) ~{width * height / 750:6,.0f} image tokens "
+            f"encoder={encode_ms:7.1f} ms/frame"
+        )
+
+    # an unchanged step: the hash and pixel checks replace storing and sending a new frame
+    frame = cdp_frame(image, CONFIGURATIONS[0])
+    encoder = ScreenshotEncoder(ScreenshotOptions(dedup_distance=4))
+    first = encoder.encode(frame)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        assert encoder.encode(frame).duplicate
+    dedup_ms = (time.perf_counter() - start) * 1000 / args.repeat
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        difference_hash(image)
+    hash_ms = (time.perf_counter() - start) * 1000 / args.repeat
+    print(f"dedup of an unchanged png frame: {dedup_ms:6.1f} ms/frame (difference_hash {hash_ms:5.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,16 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Load documents into the configured vector backend")
     parser.add_argument("--source", default="rag/sources", help="Directory containing text/markdown files")
     parser.add_argument("--backend", default=None, help="Override vector backend")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to read/chunk/embed files")
+    parser.add_argument("--batch-size", type=int, default=64, help="Records per backend upsert")
+    parser.add_argument(
+        "--manifest", default=None, help="Content-hash manifest enabling incremental re-ingest"
+    )
     args = parser.parse_args()
 
-    loader = RagLoader(backend=args.backend)
+    loader = RagLoader(
+        backend=args.backend, batch_size=args.batch_size, workers=args.workers, manifest_path=args.manifest
+    )
     files = list(Path(args.source).glob("**/*"))
     added = loader.ingest(files)
     print(f"Loaded {added} documents from {args.source}")
@@ -0,0 +1,243 @@
+"""Background ingestion of tracker steps into the memory service.
+
+``ActivityTracker.collect_step`` used to call ``Memory.add_step`` inline. That
+is an HTTP round trip to the memory service, which runs an LLM extraction and
+an embedding call before it answers, so every collected step stalled the agent
+loop. ``MemoryIngestQueue`` takes those calls off the critical path:
+
+- ``submit_step``/``submit_end_run`` only enqueue. A daemon thread drains the
+  queue in submission order, so a run's ``end_run`` is always sent after its
+  steps. Consecutive steps of the same run, up to ``batch_size`` of them, go
+  out in one ``Memory.add_steps`` request.
+- The queue is bounded. When it is full the job is dropped at once (counted
+  in ``stats()["dropped"]``): producers run on the event loop and must never
+  wait.
+- Failed requests are retried with exponential backoff. ``APIRequestException``
+  and transport errors are retried; client errors such as a missing
+  namespace are not.
+- ``flush`` waits for everything submitted so far. ``close`` (registered with
+  ``atexit``) drains the queue before the process exits.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+_STOP = object()
+
+
+def _is_retryable(error: Exception) -> bool:
+    # Imported lazily: the memory client is an optional extra, and this module is loaded by the tracker.
+    try:
+        from cuga.backend.memory.agentic_memory.client.exceptions import (
+            APIRequestException,
+            MemoryClientException,
+        )
+    except Exception:
+        return True
+    return isinstance(error, APIRequestException) or not isinstance(error, MemoryClientException)
+
+
+@dataclass
+class _Job:
+    kind: str  # "step" or "end_run"
+    namespace_id: str
+    run_id: Optional[str]
+    step: Optional[Dict[str, Any]] = None
+    prompt: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class MemoryIngestQueue:
+    """
+    Bounded queue feeding memory writes to a background worker.
+
+    Args:
+        memory: Object exposing ``add_steps(namespace_id, run_id, steps)``, with ``steps`` a list of
+            ``{"step": ..., "prompt": ...}``, and ``end_run(namespace_id, run_id)`` (normally
+            ``cuga.backend.memory.Memory``).
+        max_queue_size (int): Jobs held before new ones are dropped.
+        batch_size (int): Most steps sent in one ``add_steps`` request.
+        max_retries (int): Extra attempts for a failing request.
+        retry_backoff_s (float): Delay before the first retry, doubled on each further attempt.
+    """
+
+    def __init__(
+        self,
+        memory: Any,
+        max_queue_size: int = 1000,
+        batch_size: int = 16,
+        max_retries: int = 3,
+        retry_backoff_s: float = 0.5,
+    ):
+        self.memory = memory
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.retry_backoff_s = retry_backoff_s
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "retries": 0,
+            "batches": 0,
+            "last_lag_s": 0.0,
+            "max_lag_s": 0.0,
+        }
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="memory-ingest", daemon=True)
+                self._thread.start()
+
+    def _submit(self, job: _Job) -> bool:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+                dropped = self._stats["dropped"]
+            logger.warning(
+                f"Memory ingest queue full ({self._queue.maxsize}); dropped {job.kind} for run {job.run_id} "
+                f"({dropped} dropped so far)"
+            )
+            return False
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def submit_step(
+        self, namespace_id: str, run_id: Optional[str], step: Dict[str, Any], prompt: str
+    ) -> bool:
+        """Queue ``Memory.add_step``; returns ``False`` if the job was dropped."""
+        return self._submit(_Job("step", namespace_id, run_id, step=step, prompt=prompt))
+
+    def submit_end_run(self, namespace_id: str, run_id: Optional[str]) -> bool:
+        """Queue ``Memory.end_run``; it is sent after every step submitted before it."""
+        return self._submit(_Job("end_run", namespace_id, run_id))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus the current queue depth and the enqueue-to-done lag of recent jobs."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["depth"] = self._queue.qsize()
+        return stats
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every job submitted so far has been sent (or given up on)."""
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Drain the queue and stop the worker."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _send(self, jobs: List[_Job]) -> None:
+        first = jobs[0]
+        if first.kind == "step":
+            self.memory.add_steps(
+                namespace_id=first.namespace_id,
+                run_id=first.run_id,
+                steps=[{"step": job.step, "prompt": job.prompt} for job in jobs],
+            )
+        else:
+            self.memory.end_run(namespace_id=first.namespace_id, run_id=first.run_id)
+
+    def _process(self, jobs: List[_Job]) -> None:
+        first = jobs[0]
+        attempt = 0
+        while True:
+            try:
+                self._send(jobs)
+                outcome = "processed"
+                break
+            except Exception as e:
+                if not _is_retryable(e) or attempt >= self.max_retries:
+                    logger.error(
+                        f"Memory {first.kind} ({len(jobs)} jobs) for run {first.run_id} failed after "
+                        f"{attempt + 1} attempts: {e}"
+                    )
+                    outcome = "failed"
+                    break
+                delay = self.retry_backoff_s * (2**attempt)
+                attempt += 1
+                with self._lock:
+                    self._stats["retries"] += 1
+                logger.debug(f"Retrying memory {first.kind} for run {first.run_id} in {delay:.2f}s: {e}")
+                time.sleep(delay)
+
+        lag = time.monotonic() - first.enqueued_at
+        with self._lock:
+            self._stats[outcome] += len(jobs)
+            self._stats["batches"] += 1
+            self._stats["last_lag_s"] = lag
+            self._stats["max_lag_s"] = max(self._stats["max_lag_s"], lag)
+
+    def _take_available(self) -> List[Any]:
+        items = [self._queue.get()]
+        while items[-1] is not _STOP:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self) -> None:
+        while True:
+            batch: List[_Job] = []
+            for item in self._take_available():
+                if isinstance(item, _Job) and item.kind == "step":
+                    if batch and (
+                        len(batch) >= self.batch_size
+                        or (item.namespace_id, item.run_id) != (batch[0].namespace_id, batch[0].run_id)
+                    ):
+                        self._process(batch)
+                        batch = []
+                    batch.append(item)
+                    continue
+                # anything else keeps its place behind the steps submitted before it
+                if batch:
+                    self._process(batch)
+                    batch = []
+                if item is _STOP:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()
+                else:
+                    self._process([item])
+            if batch:
+                self._process(batch)
+
+
+_ingest_queue: Optional[MemoryIngestQueue] = None
+
+
+def get_ingest_queue(memory: Any, **kwargs) -> MemoryIngestQueue:
+    """Return the process-wide ingest queue, creating it on first use."""
+    global _ingest_queue
+    if _ingest_queue is None:
+        _ingest_queue = MemoryIngestQueue(memory, **kwargs)
+        atexit.register(_ingest_queue.close)
+    return _ingest_queue
+
+
+def shutdown_ingest_queue(timeout: Optional[float] = None) -> None:
+    """Drain and stop the process-wide ingest queue, if one was started."""
+    if _ingest_queue is not None:
+        _ingest_queue.close(timeout)
@@ -3,12 +3,20 @@ import json
 import os
 import shutil
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import time
 
 import pandas as pd
 
 
+from cuga.backend.activity_tracker.trajectory_log import (
+    append_record,
+    compact_journal,
+    encode_record,
+    get_journal_writer,
+    journal_path_for,
+    read_journal,
+)
 from cuga.backend.cuga_graph.nodes.api.code_agent.model import CodeAgentOutput
 
 from cuga.backend.tools_env.registry.utils.types import AppDefinition
@@ -19,6 +27,9 @@ from loguru import logger
 from mcp.types import CallToolResult, TextContent
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from cuga.backend.activity_tracker.memory_ingest import MemoryIngestQueue
+
 AGENT_ANALYTICS = True
 try:
     from agent_analytics.instrumentation.utils import AIEventRecorder
@@ -95,6 +106,8 @@ class ActivityTracker(object):
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
             cls._instance = super(ActivityTracker, cls).__new__(cls)
+            # journals that already got their meta record, per tracker
+            cls._instance._journaled_meta = set()
         return cls._instance
 
     async def invoke_tool(self, server_name: str, tool_name: str, args: dict):
@@ -379,6 +392,15 @@ class ActivityTracker(object):
         self.task_id = task_id
         self.intent = intent
         self.user_id = None
+        self._journaled_meta = set()
+        if settings.advanced_features.tracker_enabled:
+            # A rerun of the same task starts fresh, like the old full rewrite did: drop the previous
+            # run's journal and its compacted JSON so nothing reads stale steps before the next flush
+            trajectory_path = self._trajectory_file_path(create=False)
+            get_journal_writer().flush()
+            for path in (journal_path_for(trajectory_path), trajectory_path):
+                if os.path.exists(path):
+                    os.remove(path)
 
     def reload_steps(self, task_id: Optional[str] = None) -> bool:
         """
@@ -405,17 +427,21 @@ class ActivityTracker(object):
             logger.error(f"No trajectory path found for task_id: {target_task_id}")
             return False
 
-        if not os.path.exists(trajectory_path):
+        journal_path = journal_path_for(trajectory_path)
+        get_journal_writer().flush()
+
+        if not os.path.exists(trajectory_path) and not os.path.exists(journal_path):
             logger.error(f"Trajectory file does not exist: {trajectory_path}")
             return False
 
         try:
-            # Read the JSON file
-            with open(trajectory_path, 'r', encoding='utf-8') as f:
-                trajectory_data = json.load(f)
-
-            # Extract steps from the JSON
-            steps_data = trajectory_data.get('steps', [])
+            if os.path.exists(journal_path):
+                # The journal is the source of truth while a task is running
+                steps_data, _ = read_journal(journal_path)
+            else:
+                with open(trajectory_path, 'r', encoding='utf-8') as f:
+                    trajectory_data = json.load(f)
+                steps_data = trajectory_data.get('steps', [])
 
             # Convert dictionaries back to Step objects
             reloaded_steps = []
@@ -539,9 +565,12 @@ class ActivityTracker(object):
         """
         self.token_usage += count
 
-    def collect_image(self, img: str) -> None:
+    def collect_image(self, img: str, duplicate: bool = False) -> None:
         if not img:
             return
+        # A frame deduplicated by the screenshot encoder (PuAnswer.img_duplicate) is already the last one.
+        if duplicate and self.images:
+            return
         # Ensure the image string is compatible with OpenAI vision API: must be a valid URL or a data URL.
         if img.startswith("data:image") or img.startswith("http://") or img.startswith("https://"):
             self.images.append(img)
@@ -553,6 +582,11 @@ class ActivityTracker(object):
         """
         Collects a step, adding it to the steps list.
 
+        With the tracker enabled the step is appended to the task's ``.jsonl`` journal. The ``.json``
+        trajectory file is only rewritten at flush points: the ``FinalAnswerAgent`` step and ``to_file``
+        (called by ``finish_task`` and ``collect_score``). Readers that need the steps of a running task use
+        ``reload_steps`` or ``read_journal``.
+
         Args:
             step (Step): The description of the step to collect.
         """
@@ -652,24 +686,52 @@ class ActivityTracker(object):
             # Include intent in step metadata so it's available during tip extraction
             step_data = step.model_dump()
             step_data['intent'] = self.intent  # Add the user's task intent
-            self.memory.add_step(
-                namespace_id='memory',
-                run_id=self.experiment_folder,
-                step=step_data,
-                prompt=prompts[step.name],
-            )
+            ingest_queue = self._memory_ingest_queue()
+            if ingest_queue is not None:
+                ingest_queue.submit_step(
+                    namespace_id='memory',
+                    run_id=self.experiment_folder,
+                    step=step_data,
+                    prompt=prompts[step.name],
+                )
+            else:
+                self.memory.add_step(
+                    namespace_id='memory',
+                    run_id=self.experiment_folder,
+                    step=step_data,
+                    prompt=prompts[step.name],
+                )
         step.prompts = copy.deepcopy(self.prompts)
         self.prompts = []
         self.steps.append(step)
 
         if settings.advanced_features.enable_memory and step.name == "FinalAnswerAgent":
             # End run and execute any background processing.
-            self.memory.end_run(namespace_id="memory", run_id=self.experiment_folder)
+            ingest_queue = self._memory_ingest_queue()
+            if ingest_queue is not None:
+                ingest_queue.submit_end_run(namespace_id="memory", run_id=self.experiment_folder)
+            else:
+                self.memory.end_run(namespace_id="memory", run_id=self.experiment_folder)
 
         if settings.advanced_features.tracker_enabled:
-            self.to_file()
+            self._journal_step(step)
+            if step.name == "FinalAnswerAgent":
+                self.to_file()
         self.prompts = []
 
+    def _memory_ingest_queue(self) -> Optional["MemoryIngestQueue"]:
+        """Return the background queue for memory writes, or ``None`` when they are sent inline."""
+        if not settings.advanced_features.memory_ingest_async:
+            return None
+        from cuga.backend.activity_tracker.memory_ingest import get_ingest_queue
+
+        return get_ingest_queue(
+            self.memory,
+            max_queue_size=settings.advanced_features.memory_ingest_queue_size,
+            batch_size=settings.advanced_features.memory_ingest_batch_size,
+            max_retries=settings.advanced_features.memory_ingest_max_retries,
+        )
+
     def collect_step_external(self, step: Step, full_path: Optional[str] = None) -> None:
         """
         Collects a step and saves it to a separate log file in a directory
@@ -711,66 +773,19 @@ class ActivityTracker(object):
 
     def _to_file_external_append(self, full_path: str, new_step: Step):
         """
-        Append a new step to an existing JSON file or create a new file if it doesn't exist.
+        Append a new step to the journal of an externally owned trajectory file.
 
-        This method reads the existing file, appends the new step, and saves it back.
+        The step is written as a single line to the ``.jsonl`` journal next to
+        ``full_path``; the owning process folds it into the JSON file when it
+        compacts the journal. The write is synchronous but O(1) in the
+        trajectory length.
 
         Args:
-            full_path (str): The full file path to save/append to.
+            full_path (str): The trajectory JSON path provided by the caller.
             new_step (Step): The new step to append.
         """
         try:
-            # Check if file exists and read existing data
-            if os.path.exists(full_path):
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    try:
-                        existing_data = json.load(f)
-                        # Ensure the existing data has the expected structure
-                        if not isinstance(existing_data, dict) or 'steps' not in existing_data:
-                            logger.warning(f"Invalid JSON structure in {full_path}, creating new file")
-                            existing_data = None
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON in {full_path}, creating new file: {e}")
-                        existing_data = None
-            else:
-                existing_data = None
-
-            # If no valid existing data, create new structure
-            if existing_data is None:
-                data_to_save = {
-                    "intent": self.intent,
-                    "dataset_name": self.dataset_name,
-                    "actions_count": self.actions_count,
-                    "task_id": self.task_id,
-                    "eval": self.eval,
-                    "steps": [new_step.model_dump()],
-                    "score": self.score,
-                }
-            else:
-                # Update existing data with new step
-                existing_data["steps"].append(new_step.model_dump())
-                # Update other fields that might have changed
-                existing_data.update(
-                    {
-                        "intent": self.intent,
-                        "dataset_name": self.dataset_name,
-                        "actions_count": self.actions_count,
-                        "task_id": self.task_id,
-                        "eval": self.eval,
-                        "score": self.score,
-                    }
-                )
-                data_to_save = existing_data
-
-            # Write the updated data back to file
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(
-                    data_to_save,
-                    f,
-                    ensure_ascii=False,
-                    indent=4,
-                )
-
+            append_record(journal_path_for(full_path), encode_record("step", {"step": new_step.model_dump()}))
         except Exception as e:
             logger.error(f"Failed to append step to file {full_path}: {e}")
             raise
@@ -792,8 +807,8 @@ class ActivityTracker(object):
         """
         pass
 
-    def to_file(self):
-        """Save current task data to file in the experiment directory."""
+    def _trajectory_file_path(self, create: bool = True) -> str:
+        """Return the ``.json`` trajectory path of the current task."""
         if self.experiment_folder:
             # Save to experiment directory
             source_dir = os.path.join(self._base_dir, self.experiment_folder)
@@ -801,10 +816,47 @@ class ActivityTracker(object):
             # Fallback to original behavior
             source_dir = "logging{}".format("_" + self.dataset_name if self.dataset_name else "")
 
-        os.makedirs(source_dir, exist_ok=True)
+        if create:
+            os.makedirs(source_dir, exist_ok=True)
 
         filename = self.task_id if self.task_id != "default" else self.session_id
-        filepath = os.path.join(source_dir, f"{filename}.json")
+        return os.path.join(source_dir, f"{filename}.json")
+
+    def _task_meta(self) -> Dict[str, Any]:
+        return {
+            "intent": self.intent,
+            "dataset_name": self.dataset_name,
+            "actions_count": self.actions_count,
+            "task_id": self.task_id,
+            "eval": self.eval,
+            "score": self.score,
+        }
+
+    def _journal_step(self, step: Step) -> None:
+        """Queue a step for the background journal writer."""
+        journal_path = journal_path_for(self._trajectory_file_path())
+        writer = get_journal_writer(settings.advanced_features.tracker_fsync_interval)
+        if journal_path not in self._journaled_meta:
+            writer.submit(journal_path, "meta", self._task_meta())
+            self._journaled_meta.add(journal_path)
+        writer.submit(journal_path, "step", {"step": step.model_dump()})
+
+    def to_file(self):
+        """
+        Export the current task to its JSON file in the experiment directory.
+
+        Pending journal records are flushed first and the journal is compacted
+        into the classic JSON layout. Without a journal the in-memory steps are
+        written directly.
+        """
+        filepath = self._trajectory_file_path()
+        journal_path = journal_path_for(filepath)
+        writer = get_journal_writer()
+        if journal_path in self._journaled_meta or os.path.exists(journal_path):
+            writer.submit(journal_path, "meta", self._task_meta())
+            writer.flush()
+            compact_journal(journal_path, filepath, meta=self._task_meta())
+            return
 
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(
@@ -884,6 +936,7 @@ class ActivityTracker(object):
 
         # Update result files only if tracker is enabled
         if settings.advanced_features.tracker_enabled:
+            self.to_file()
             self._update_result_files()
             self._add_to_progress_file(task_id)
 
@@ -0,0 +1,227 @@
+"""Append-only trajectory journal used by the ActivityTracker.
+
+Steps are appended as one JSON object per line to ``<task>.jsonl`` next to the
+classic ``<task>.json`` trajectory file. Appends happen on a background writer
+thread so the agent loop never waits on disk I/O, and the journal is fsynced
+periodically rather than on every record. ``compact_journal`` rebuilds the
+original JSON layout (``intent``, ``dataset_name``, ``steps``, ...) from the
+journal; the tracker calls it when a task finishes.
+
+Record layout (one per line)::
+
+    {"kind": "step", "ts": 1718000000.1, "step": {...Step.model_dump()...}}
+    {"kind": "meta", "ts": 1718000000.2, "intent": "...", "score": 1.0, ...}
+
+Records may come from several processes (the registry appends ``api_call``
+steps to the same journal), so readers order them by ``ts``.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+JOURNAL_SUFFIX = ".jsonl"
+
+_STOP = object()
+
+
+def journal_path_for(trajectory_path: str) -> str:
+    """Return the journal path that belongs to a ``<task>.json`` trajectory file."""
+    root, ext = os.path.splitext(trajectory_path)
+    if ext == JOURNAL_SUFFIX:
+        return trajectory_path
+    return root + JOURNAL_SUFFIX
+
+
+def encode_record(kind: str, payload: Dict[str, Any], ts: Optional[float] = None) -> bytes:
+    record = {"kind": kind, "ts": ts if ts is not None else time.time()}
+    record.update(payload)
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def append_record(path: str, data: bytes) -> None:
+    """Append one encoded record with a single ``write`` on an ``O_APPEND`` descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def read_journal(path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Read a journal and return ``(steps, meta)``.
+
+    Steps are ordered by their timestamp; ``meta`` is the merge of all meta
+    records in timestamp order. A truncated trailing line (e.g. after a crash)
+    is skipped.
+    """
+    step_records = []
+    meta_records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt journal line {index} in {path}")
+                continue
+            if record.get("kind") == "step":
+                step_records.append((record.get("ts", 0.0), index, record.get("step", {})))
+            elif record.get("kind") == "meta":
+                meta_records.append((record.get("ts", 0.0), index, record))
+
+    step_records.sort(key=lambda item: (item[0], item[1]))
+    meta_records.sort(key=lambda item: (item[0], item[1]))
+
+    meta: Dict[str, Any] = {}
+    for _, _, record in meta_records:
+        meta.update({k: v for k, v in record.items() if k not in ("kind", "ts")})
+    return [step for _, _, step in step_records], meta
+
+
+def compact_journal(journal_path: str, output_path: str, meta: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Export a journal to the classic trajectory JSON layout.
+
+    The output is written to a temporary file and atomically renamed into
+    place, so readers never observe a half-written trajectory.
+
+    Args:
+        journal_path (str): Path of the ``.jsonl`` journal.
+        output_path (str): Path of the ``.json`` file to produce.
+        meta (dict, optional): Values overriding the journal's meta records.
+
+    Returns:
+        int: Number of steps written.
+    """
+    steps, journal_meta = read_journal(journal_path)
+    journal_meta.update(meta or {})
+    data = {
+        "intent": journal_meta.get("intent"),
+        "dataset_name": journal_meta.get("dataset_name"),
+        "actions_count": journal_meta.get("actions_count"),
+        "task_id": journal_meta.get("task_id"),
+        "eval": journal_meta.get("eval"),
+        "steps": steps,
+        "score": journal_meta.get("score"),
+    }
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, output_path)
+    return len(steps)
+
+
+class TrajectoryJournalWriter:
+    """
+    Background writer appending encoded records to journal files.
+
+    ``submit`` only serializes and enqueues; a daemon thread performs the
+    appends and fsyncs every ``fsync_interval`` seconds. ``flush`` blocks
+    until everything submitted so far is on disk, and is called before the
+    journal is read back or compacted.
+    """
+
+    def __init__(self, fsync_interval: float = 1.0, max_queue_size: int = 10000):
+        self.fsync_interval = fsync_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._files: Dict[str, Any] = {}
+        self._dirty: set = set()
+        self._last_fsync = time.monotonic()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trajectory-journal", daemon=True)
+                self._thread.start()
+
+    def submit(self, path: str, kind: str, payload: Dict[str, Any]) -> None:
+        self._ensure_thread()
+        self._queue.put((path, encode_record(kind, payload)))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all submitted records are written and fsynced."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+
+    def _handle(self, path: str):
+        handle = self._files.get(path)
+        if handle is None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            handle = open(path, "ab", buffering=0)
+            self._files[path] = handle
+        return handle
+
+    def _sync(self, close: bool = False) -> None:
+        for path in list(self._dirty):
+            try:
+                os.fsync(self._files[path].fileno())
+            except (OSError, KeyError) as e:
+                logger.warning(f"Failed to fsync trajectory journal {path}: {e}")
+        self._dirty.clear()
+        self._last_fsync = time.monotonic()
+        if close:
+            for handle in self._files.values():
+                handle.close()
+            self._files.clear()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                if self._dirty:
+                    self._sync()
+                continue
+
+            if item is _STOP:
+                self._sync(close=True)
+                return
+            if isinstance(item, threading.Event):
+                # Journals are shared with other processes; release handles so a
+                # compaction or external append sees a consistent file.
+                self._sync(close=True)
+                item.set()
+                continue
+
+            path, data = item
+            try:
+                self._handle(path).write(data)
+                self._dirty.add(path)
+            except OSError as e:
+                logger.error(f"Failed to append to trajectory journal {path}: {e}")
+
+            if self._dirty and time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self._sync()
+
+
+_writer: Optional[TrajectoryJournalWriter] = None
+
+
+def get_journal_writer(fsync_interval: float = 1.0) -> TrajectoryJournalWriter:
+    """Return the process-wide journal writer, creating it on first use."""
+    global _writer
+    if _writer is None:
+        _writer = TrajectoryJournalWriter(fsync_interval=fsync_interval)
+        atexit.register(_writer.close)
+    return _writer
@@ -3,12 +3,13 @@ from __future__ import annotations
 import os
 import secrets
 from fastapi import FastAPI, Header, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from cuga.planner.core import Planner
 from cuga.coordinator.core import Coordinator
 from cuga.workers.base import Worker
 from cuga.registry.loader import Registry
 from cuga.observability import propagate_trace
+from cuga.mcp.telemetry.metrics import metrics
 from pathlib import Path
 
 registry_path = Path("docs/mcp/registry.yaml")
@@ -44,6 +45,11 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/plan")
 async def plan(payload: dict, x_trace_id: str | None = Header(default=None)):
     propagate_trace(x_trace_id or "api")
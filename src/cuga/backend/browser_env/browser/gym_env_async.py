@@ -22,12 +22,10 @@ from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import Page, Playwright
 
 from cuga.backend.browser_env.browser.chat_async import Chat
-from cuga.backend.browser_env.browser.gym_obs.obs_async import (
-    _post_extract,
-    extract_screenshot,
-)
+from cuga.backend.browser_env.browser.gym_obs.obs_async import _post_extract
 from cuga.backend.browser_env.browser.open_ended_async import AbstractBrowserTask
 from cuga.backend.browser_env.browser.utils_async import _get_global_playwright_async
+from cuga.backend.browser_env.page_understanding.extractor_utils.extract_async import PageScreenshot
 from cuga.backend.browser_env.page_understanding.pu_extractor import PageUnderstandingExtractor
 from cuga.backend.browser_env.page_understanding.pu_processor import PageUnderstandingProcessor
 from cuga.backend.browser_env.tools.providers import BrowserToolImplProvider, PlaywrightToolImplProvider
@@ -665,9 +663,10 @@ class BrowserEnvGymAsync(gym.Env, ABC):
             # post-extraction cleanup of temporary info in dom
             await _post_extract(self.page)
 
-            # Get browser-specific information
-            screenshot = await extract_screenshot(self.page)
+            # Get browser-specific information. The page understanding capture is the only screenshot
+            # of the step; the gym observation shares it and decodes it to an array on demand.
             pu_output = await self.pu_processor.extract(page=self.page, context=self.context)
+            screenshot = PageScreenshot(pu_output.screenshot, pu_output.img_mime_type)
             url = self.page.url
             open_pages_urls = [page.url for page in self.context.pages]
             open_pages_titles = [await page.title() for page in self.context.pages]
@@ -0,0 +1,106 @@
+"""
+Per-page Chrome DevTools Protocol sessions shared by the observation extractors.
+
+Opening a CDP session is a round trip to the browser (``Target.attachToTarget``) and detaching is another,
+and every extractor used to pay both on each call, several times per step. ``CDPSessionManager`` keeps one
+session per page open for the page's lifetime. A session is dropped when the page closes or the browser
+reports it detached (``Inspector.detached``, e.g. after a cross-process navigation), and a command that fails
+because its session went away is retried once on a fresh session. CDP multiplexes commands over a session,
+so callers can issue several ``send`` calls concurrently with ``asyncio.gather``.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import playwright.async_api
+from loguru import logger
+from playwright.async_api import Error as PlaywrightError
+
+# Only errors about the session or its target going away. Frame-level ones ("Frame has been detached", ...)
+# fail the same way on a fresh session and are retried by the extractors.
+_DETACHED_MESSAGES = (
+    "Target closed",
+    "Target page, context or browser has been closed",
+    "Session closed",
+    "Session with given id not found",
+)
+
+
+def _is_detached(error: Exception) -> bool:
+    message = str(error)
+    return any(text in message for text in _DETACHED_MESSAGES)
+
+
+class CDPSessionManager:
+    """Keeps one open CDP session per Playwright page."""
+
+    def __init__(self):
+        self._sessions: Dict[playwright.async_api.Page, playwright.async_api.CDPSession] = {}
+        self._locks: Dict[playwright.async_api.Page, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def session(self, page: playwright.async_api.Page) -> playwright.async_api.CDPSession:
+        """Return the page's session, attaching a new one if there is none."""
+        cdp = self._sessions.get(page)
+        if cdp is not None:
+            return cdp
+        lock = self._locks.get(page)
+        if lock is None:
+            lock = self._locks[page] = asyncio.Lock()
+            page.once("close", lambda _: self._forget(page))
+        async with lock:
+            cdp = self._sessions.get(page)
+            if cdp is None:
+                cdp = await page.context.new_cdp_session(page)
+                cdp.on("Inspector.detached", lambda _: self._forget(page, cdp))
+                self._sessions[page] = cdp
+        return cdp
+
+    async def send(
+        self, page: playwright.async_api.Page, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send one CDP command on the page's session, reattaching once if the session was detached."""
+        cdp = await self.session(page)
+        try:
+            return await cdp.send(method, params or {})
+        except PlaywrightError as e:
+            if page.is_closed() or not _is_detached(e):
+                raise
+            logger.debug(f"CDP session for {page.url} was detached, reattaching: {e}")
+            self._forget(page, cdp)
+            try:
+                # usually gone already; if not, don't leave it attached in the browser
+                await cdp.detach()
+            except PlaywrightError:
+                pass
+            cdp = await self.session(page)
+            return await cdp.send(method, params or {})
+
+    def _forget(
+        self, page: playwright.async_api.Page, cdp: Optional[playwright.async_api.CDPSession] = None
+    ) -> None:
+        # A late event from an already-replaced session must not drop its successor.
+        if cdp is None or self._sessions.get(page) is cdp:
+            self._sessions.pop(page, None)
+        if cdp is None:
+            self._locks.pop(page, None)
+
+    async def detach(self, page: playwright.async_api.Page) -> None:
+        """Detach the page's session, if any."""
+        cdp = self._sessions.pop(page, None)
+        self._locks.pop(page, None)
+        if cdp is not None and not page.is_closed():
+            try:
+                await cdp.detach()
+            except PlaywrightError as e:
+                logger.debug(f"Ignoring error while detaching CDP session: {e}")
+
+    async def close(self) -> None:
+        """Detach every session (e.g. before closing the browser context)."""
+        for page in list(self._sessions):
+            await self.detach(page)
+
+
+cdp_sessions = CDPSessionManager()
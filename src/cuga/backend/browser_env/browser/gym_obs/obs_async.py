@@ -2,6 +2,7 @@
 # Modifications Copyright 2025 CUGA
 # Licensed under the Apache License, Version 2.0
 
+import asyncio
 import base64
 import io
 import logging
@@ -18,6 +19,7 @@ from browsergym.core.observation import (
     pop_bids_from_attribute,
 )
 from loguru import logger
+from cuga.backend.browser_env.browser.gym_obs.cdp_sessions import cdp_sessions
 
 EXTRACT_OBS_MAX_TRIES = 5
 BID_ATTR = "bid"
@@ -134,13 +136,8 @@ async def extract_all_frame_axtrees(page: playwright.async_api.Page):
         A dictionnary of AXTrees (as returned by Chrome DevTools Protocol) indexed by frame IDs.
 
     """
-    cdp = await page.context.new_cdp_session(page)
-
     # extract the frame tree
-    frame_tree = await cdp.send(
-        "Page.getFrameTree",
-        {},
-    )
+    frame_tree = await cdp_sessions.send(page, "Page.getFrameTree")
 
     # extract all frame IDs into a list
     # (breadth-first-search through the frame tree)
@@ -154,16 +151,14 @@ async def extract_all_frame_axtrees(page: playwright.async_api.Page):
         frame_id = frame["frame"]["id"]
         frame_ids.append(frame_id)
 
-    # extract the AXTree of each frame
-    frame_axtrees = {
-        frame_id: await cdp.send(
-            "Accessibility.getFullAXTree",
-            {"frameId": frame_id},
+    # extract the AXTree of each frame, concurrently
+    axtrees = await asyncio.gather(
+        *(
+            cdp_sessions.send(page, "Accessibility.getFullAXTree", {"frameId": frame_id})
+            for frame_id in frame_ids
         )
-        for frame_id in frame_ids
-    }
-
-    await cdp.detach()
+    )
+    frame_axtrees = dict(zip(frame_ids, axtrees))
 
     # extract browsergym data from ARIA attributes
     for ax_tree in frame_axtrees.values():
@@ -218,8 +213,8 @@ async def extract_dom_snapshot(
         DOM tree is flattened.
 
     """
-    cdp = await page.context.new_cdp_session(page)
-    dom_snapshot = await cdp.send(
+    dom_snapshot = await cdp_sessions.send(
+        page,
         "DOMSnapshot.captureSnapshot",
         {
             "computedStyles": computed_styles,
@@ -227,7 +222,6 @@ async def extract_dom_snapshot(
             "includePaintOrder": include_paint_order,
         },
     )
-    await cdp.detach()
 
     # if requested, remove temporary data stored in the ARIA attributes of each node
     if temp_data_cleanup:
@@ -249,14 +243,7 @@ async def extract_screenshot(page: playwright.async_api.Page):
 
     """
 
-    cdp = await page.context.new_cdp_session(page)
-    cdp_answer = await cdp.send(
-        "Page.captureScreenshot",
-        {
-            "format": "png",
-        },
-    )
-    await cdp.detach()
+    cdp_answer = await cdp_sessions.send(page, "Page.captureScreenshot", {"format": "png"})
 
     # bytes of a png file
     png_base64 = cdp_answer["data"]
@@ -284,14 +271,7 @@ async def extract_screenshot_base64(page: playwright.async_api.Page):
 
     """
 
-    cdp = await page.context.new_cdp_session(page)
-    cdp_answer = await cdp.send(
-        "Page.captureScreenshot",
-        {
-            "format": "png",
-        },
-    )
-    await cdp.detach()
+    cdp_answer = await cdp_sessions.send(page, "Page.captureScreenshot", {"format": "png"})
 
     # bytes of a png file
     png_base64 = cdp_answer["data"]
@@ -346,36 +326,41 @@ async def extract_merged_axtree(page: playwright.async_api.Page):
     """
     frame_axtrees = await extract_all_frame_axtrees(page)
 
-    cdp = await page.context.new_cdp_session(page)
+    # resolve the frame of every iframe node, concurrently
+    iframe_nodes = [
+        node
+        for ax_tree in frame_axtrees.values()
+        for node in ax_tree["nodes"]
+        if node["role"]["value"] == "Iframe"
+    ]
+    descriptions = await asyncio.gather(
+        *(
+            cdp_sessions.send(page, "DOM.describeNode", {"backendNodeId": node["backendDOMNodeId"]})
+            for node in iframe_nodes
+        )
+    )
 
     # merge all AXTrees into one
     merged_axtree = {"nodes": []}
     for ax_tree in frame_axtrees.values():
         merged_axtree["nodes"].extend(ax_tree["nodes"])
-        # connect each iframe node to the corresponding AXTree root node
-        for node in ax_tree["nodes"]:
-            if node["role"]["value"] == "Iframe":
-                frame_id = (
-                    cdp.send("DOM.describeNode", {"backendNodeId": node["backendDOMNodeId"]})
-                    .get("node", {})
-                    .get("frameId", None)
-                )
-                if not frame_id:
-                    logger.warning(
-                        f"AXTree merging: unable to recover frameId of node with backendDOMNodeId {repr(node['backendDOMNodeId'])}, skipping"
-                    )
-                # it seems Page.getFrameTree() from CDP omits certain Frames (empty frames?)
-                # if a frame is not found in the extracted AXTrees, we just ignore it
-                elif frame_id in frame_axtrees:
-                    # root node should always be the first node in the AXTree
-                    frame_root_node = frame_axtrees[frame_id]["nodes"][0]
-                    assert frame_root_node["frameId"] == frame_id
-                    node["childIds"].append(frame_root_node["nodeId"])
-                else:
-                    logger.warning(
-                        f"AXTree merging: extracted AXTree does not contain frameId '{frame_id}', skipping"
-                    )
-
-    await cdp.detach()
+    # connect each iframe node to the corresponding AXTree root node
+    for node, description in zip(iframe_nodes, descriptions):
+        frame_id = description.get("node", {}).get("frameId", None)
+        if not frame_id:
+            logger.warning(
+                f"AXTree merging: unable to recover frameId of node with backendDOMNodeId {repr(node['backendDOMNodeId'])}, skipping"
+            )
+        # it seems Page.getFrameTree() from CDP omits certain Frames (empty frames?)
+        # if a frame is not found in the extracted AXTrees, we just ignore it
+        elif frame_id in frame_axtrees:
+            # root node should always be the first node in the AXTree
+            frame_root_node = frame_axtrees[frame_id]["nodes"][0]
+            assert frame_root_node["frameId"] == frame_id
+            node["childIds"].append(frame_root_node["nodeId"])
+        else:
+            logger.warning(
+                f"AXTree merging: extracted AXTree does not contain frameId '{frame_id}', skipping"
+            )
 
     return merged_axtree
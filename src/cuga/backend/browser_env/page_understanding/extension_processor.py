@@ -35,6 +35,9 @@ class ExtensionProcessor:
 
         return getattr(pu_extracted, "page_title", None)
 
+    def reset(self) -> None:
+        """Nothing is kept between tasks; present for parity with ``PageUnderstandingProcessor``."""
+
     async def transform(self, **kwargs) -> PuAnswer:
         pu_extracted = self._data
         if pu_extracted is None:
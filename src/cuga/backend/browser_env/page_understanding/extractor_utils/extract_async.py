@@ -1,14 +1,16 @@
+import asyncio
 import base64
 import io
 import logging
 import pkgutil
 import re
-from typing import Literal
+from typing import Literal, Optional
 
 import numpy as np
 import PIL.Image
 import playwright
 from loguru import logger
+from cuga.backend.browser_env.browser.gym_obs.cdp_sessions import cdp_sessions
 from cuga.backend.utils.consts import BROWSERGYM_ID_ATTRIBUTE as BID_ATTR
 from cuga.backend.utils.consts import BROWSERGYM_SETOFMARKS_ATTRIBUTE as SOM_ATTR
 from cuga.backend.utils.consts import BROWSERGYM_VISIBILITY_ATTRIBUTE as VIS_ATTR
@@ -171,13 +173,8 @@ async def extract_all_frame_axtrees(page: playwright.async_api.Page):
         A dictionnary of AXTrees (as returned by Chrome DevTools Protocol) indexed by frame IDs.
 
     """
-    cdp = await page.context.new_cdp_session(page)
-
     # extract the frame tree
-    frame_tree = await cdp.send(
-        "Page.getFrameTree",
-        {},
-    )
+    frame_tree = await cdp_sessions.send(page, "Page.getFrameTree")
 
     # extract all frame IDs into a list
     # (breadth-first-search through the frame tree)
@@ -191,16 +188,14 @@ async def extract_all_frame_axtrees(page: playwright.async_api.Page):
         frame_id = frame["frame"]["id"]
         frame_ids.append(frame_id)
 
-    # extract the AXTree of each frame
-    frame_axtrees = {
-        frame_id: await cdp.send(
-            "Accessibility.getFullAXTree",
-            {"frameId": frame_id},
+    # extract the AXTree of each frame, concurrently
+    axtrees = await asyncio.gather(
+        *(
+            cdp_sessions.send(page, "Accessibility.getFullAXTree", {"frameId": frame_id})
+            for frame_id in frame_ids
         )
-        for frame_id in frame_ids
-    }
-
-    await cdp.detach()
+    )
+    frame_axtrees = dict(zip(frame_ids, axtrees))
 
     # extract browsergym data from ARIA attributes
     for ax_tree in frame_axtrees.values():
@@ -255,8 +250,8 @@ async def extract_dom_snapshot(
         DOM tree is flattened.
 
     """
-    cdp = await page.context.new_cdp_session(page)
-    dom_snapshot = await cdp.send(
+    dom_snapshot = await cdp_sessions.send(
+        page,
         "DOMSnapshot.captureSnapshot",
         {
             "computedStyles": computed_styles,
@@ -264,7 +259,6 @@ async def extract_dom_snapshot(
             "includePaintOrder": include_paint_order,
         },
     )
-    await cdp.detach()
 
     # if requested, remove temporary data stored in the ARIA attributes of each node
     if temp_data_cleanup:
@@ -286,14 +280,7 @@ async def extract_screenshot(page: playwright.async_api.Page):
 
     """
 
-    cdp = await page.context.new_cdp_session(page)
-    cdp_answer = await cdp.send(
-        "Page.captureScreenshot",
-        {
-            "format": "png",
-        },
-    )
-    await cdp.detach()
+    cdp_answer = await cdp_sessions.send(page, "Page.captureScreenshot", {"format": "png"})
 
     # bytes of a png file
     png_base64 = cdp_answer["data"]
@@ -325,6 +312,63 @@ async def extract_screenshot_base64(page: playwright.async_api.Page):
     return png_base64
 
 
+class PageScreenshot:
+    """
+    A single viewport capture shared by every consumer of one observation step.
+
+    The browser hands back a base64 image (PNG unless another format was requested), which is what the page
+    understanding output and the tracker store; the raw bytes and the RGB array gym observations use are only
+    decoded on first access. ``np.asarray(shot)`` works, so the object can stand in for the array in an
+    observation dict.
+
+    Args:
+        image_base64 (str): The encoded screenshot, base64-encoded.
+        mime_type (str): The image's MIME type.
+        duplicate (bool): The screenshot encoder found the page unchanged and handed back the previous frame;
+            consumers that already hold that frame can skip storing or sending it again.
+    """
+
+    __slots__ = ("base64", "mime_type", "duplicate", "_image_bytes", "_array")
+
+    def __init__(self, image_base64: str, mime_type: str = "image/png", duplicate: bool = False):
+        self.base64 = image_base64
+        self.mime_type = mime_type
+        self.duplicate = duplicate
+        self._image_bytes = None
+        self._array = None
+
+    @classmethod
+    async def capture(
+        cls, page: playwright.async_api.Page, params: Optional[dict] = None
+    ) -> "PageScreenshot":
+        """Capture the viewport over the page's shared CDP session, with ``Page.captureScreenshot`` params."""
+        params = params or {"format": "png"}
+        cdp_answer = await cdp_sessions.send(page, "Page.captureScreenshot", params)
+        return cls(cdp_answer["data"], f"image/{params.get('format', 'png')}")
+
+    @property
+    def image_bytes(self) -> bytes:
+        if self._image_bytes is None:
+            self._image_bytes = base64.b64decode(self.base64)
+        return self._image_bytes
+
+    @property
+    def data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{self.base64}"
+
+    @property
+    def array(self) -> np.ndarray:
+        """The screenshot as a 3D array (height, width, rgb), decoded once."""
+        if self._array is None:
+            with io.BytesIO(self.image_bytes) as f:
+                self._array = np.array(PIL.Image.open(f).convert(mode="RGB"))
+        return self._array
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.array
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+
 async def extract_focused_element_bid(page: playwright.async_api.Page):
     # this JS code will dive through ShadowDOMs
     extract_focused_element_with_bid_script = """\
@@ -373,37 +417,42 @@ async def extract_merged_axtree(page: playwright.async_api.Page):
     """
     frame_axtrees = await extract_all_frame_axtrees(page)
 
-    cdp = await page.context.new_cdp_session(page)
+    # resolve the frame of every iframe node, concurrently
+    iframe_nodes = [
+        node
+        for ax_tree in frame_axtrees.values()
+        for node in ax_tree["nodes"]
+        if node["role"]["value"] == "Iframe"
+    ]
+    descriptions = await asyncio.gather(
+        *(
+            cdp_sessions.send(page, "DOM.describeNode", {"backendNodeId": node["backendDOMNodeId"]})
+            for node in iframe_nodes
+        )
+    )
 
     # merge all AXTrees into one
     merged_axtree = {"nodes": []}
     for ax_tree in frame_axtrees.values():
         merged_axtree["nodes"].extend(ax_tree["nodes"])
-        # connect each iframe node to the corresponding AXTree root node
-        for node in ax_tree["nodes"]:
-            if node["role"]["value"] == "Iframe":
-                frame_id = (
-                    (await cdp.send("DOM.describeNode", {"backendNodeId": node["backendDOMNodeId"]}))
-                    .get("node", {})
-                    .get("frameId", None)
-                )
-                if not frame_id:
-                    logger.warning(
-                        f"AXTree merging: unable to recover frameId of node with backendDOMNodeId {repr(node['backendDOMNodeId'])}, skipping"
-                    )
-                # it seems Page.getFrameTree() from CDP omits certain Frames (empty frames?)
-                # if a frame is not found in the extracted AXTrees, we just ignore it
-                elif frame_id in frame_axtrees:
-                    # root node should always be the first node in the AXTree
-                    frame_root_node = frame_axtrees[frame_id]["nodes"][0]
-                    assert frame_root_node["frameId"] == frame_id
-                    node["childIds"].append(frame_root_node["nodeId"])
-                else:
-                    logger.warning(
-                        f"AXTree merging: extracted AXTree does not contain frameId '{frame_id}', skipping"
-                    )
-
-    await cdp.detach()
+    # connect each iframe node to the corresponding AXTree root node
+    for node, description in zip(iframe_nodes, descriptions):
+        frame_id = description.get("node", {}).get("frameId", None)
+        if not frame_id:
+            logger.warning(
+                f"AXTree merging: unable to recover frameId of node with backendDOMNodeId {repr(node['backendDOMNodeId'])}, skipping"
+            )
+        # it seems Page.getFrameTree() from CDP omits certain Frames (empty frames?)
+        # if a frame is not found in the extracted AXTrees, we just ignore it
+        elif frame_id in frame_axtrees:
+            # root node should always be the first node in the AXTree
+            frame_root_node = frame_axtrees[frame_id]["nodes"][0]
+            assert frame_root_node["frameId"] == frame_id
+            node["childIds"].append(frame_root_node["nodeId"])
+        else:
+            logger.warning(
+                f"AXTree merging: extracted AXTree does not contain frameId '{frame_id}', skipping"
+            )
 
     return merged_axtree
 
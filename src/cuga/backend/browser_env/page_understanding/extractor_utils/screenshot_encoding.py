@@ -0,0 +1,168 @@
+"""
+Screenshot encoding for browser observations.
+
+Each step's screenshot is base64-embedded in ``PuAnswer.img``, stored in the tracker's ``Step.image_before``
+and sent to multimodal LLMs, so its size matters three times over. ``ScreenshotEncoder`` captures it in the
+configured format and quality (CDP encodes JPEG and WebP natively), downscales frames larger than the
+configured maximum and, when deduplication is on, hands back the previous frame marked ``duplicate`` if the new
+one looks the same
+(difference hash within ``dedup_distance`` bits, confirmed by a pixel diff of quarter-scale grayscale copies,
+since the 64-bit hash alone misses a typed character or a ticked checkbox). Options come from the ``page_understanding.screenshot_*``
+settings; the defaults keep full-resolution PNG captures of the viewport.
+"""
+
+import base64
+import io
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import PIL.Image
+import playwright.async_api
+
+from cuga.backend.browser_env.browser.gym_obs.cdp_sessions import cdp_sessions
+from cuga.backend.browser_env.page_understanding.extractor_utils.extract_async import PageScreenshot
+from cuga.config import settings
+
+# CDP format name -> PIL format name
+SCREENSHOT_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+
+# Dedup compares grayscale frames shrunk by this factor (box filter) and needs every pixel to match within this
+# many gray levels: enough for compression noise, not for a one-pixel-wide caret or a typed character.
+DEDUP_REDUCE_FACTOR = 4
+DEDUP_PIXEL_TOLERANCE = 8
+
+
+@dataclass
+class ScreenshotOptions:
+    """
+    How observation screenshots are captured and encoded.
+
+    Args:
+        format: "png", "jpeg" or "webp".
+        quality: Compression quality (0-100) for JPEG and WebP.
+        max_width: Largest width in pixels, larger frames are downscaled (0 = no limit).
+        max_height: Largest height in pixels (0 = no limit).
+        clip_to_viewport: Capture the viewport only; otherwise the whole page.
+        dedup_distance: Reuse the previous frame when the difference hashes differ by at most this many of
+            their 64 bits and no pixel of the quarter-scale grayscale copies differs by more than
+            ``DEDUP_PIXEL_TOLERANCE`` (-1 = off). The hash is only a quick pre-check: small edits such as
+            a typed character barely move it, so the pixel diff decides.
+    """
+
+    format: str = "png"
+    quality: int = 80
+    max_width: int = 0
+    max_height: int = 0
+    clip_to_viewport: bool = True
+    dedup_distance: int = -1
+
+    def __post_init__(self):
+        self.format = self.format.lower()
+        if self.format == "jpg":
+            self.format = "jpeg"
+        if self.format not in SCREENSHOT_FORMATS:
+            raise ValueError(
+                f"Unsupported screenshot format {self.format!r}, expected one of {list(SCREENSHOT_FORMATS)}"
+            )
+
+    @classmethod
+    def from_settings(cls) -> "ScreenshotOptions":
+        page_understanding = settings.page_understanding
+        return cls(
+            format=page_understanding.screenshot_format,
+            quality=page_understanding.screenshot_quality,
+            max_width=page_understanding.screenshot_max_width,
+            max_height=page_understanding.screenshot_max_height,
+            clip_to_viewport=page_understanding.screenshot_clip_to_viewport,
+            dedup_distance=page_understanding.screenshot_dedup_distance,
+        )
+
+    @property
+    def mime_type(self) -> str:
+        return f"image/{self.format}"
+
+    def cdp_params(self) -> dict:
+        """``Page.captureScreenshot`` params for the format and quality."""
+        params = {"format": self.format}
+        if self.format != "png":
+            params["quality"] = self.quality
+        return params
+
+
+def difference_hash(image: PIL.Image.Image, hash_size: int = 8) -> int:
+    """
+    Perceptual difference hash (dHash) of an image.
+
+    The image is shrunk to a grayscale ``(hash_size + 1) x hash_size`` thumbnail and each bit records whether
+    a pixel is brighter than its right neighbour, so re-encoding and small scaling differences barely move the
+    hash while layout changes do. Changes much smaller than a thumbnail pixel may not move it at all.
+    """
+    thumbnail = image.convert("L").resize((hash_size + 1, hash_size), PIL.Image.Resampling.BILINEAR)
+    pixels = np.asarray(thumbnail, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class ScreenshotEncoder:
+    """Captures observation screenshots according to ``ScreenshotOptions``, one encoder per browser env."""
+
+    def __init__(self, options: Optional[ScreenshotOptions] = None):
+        self.options = options or ScreenshotOptions.from_settings()
+        self._previous: Optional[Tuple[int, np.ndarray, PageScreenshot]] = None
+
+    def reset(self) -> None:
+        """Forget the previous frame, so the first frame of a new task is never deduplicated."""
+        self._previous = None
+
+    async def capture(self, page: playwright.async_api.Page) -> PageScreenshot:
+        params = self.options.cdp_params()
+        if not self.options.clip_to_viewport:
+            metrics = await cdp_sessions.send(page, "Page.getLayoutMetrics")
+            content = metrics["cssContentSize"]
+            params["captureBeyondViewport"] = True
+            params["clip"] = {
+                "x": 0,
+                "y": 0,
+                "width": content["width"],
+                "height": content["height"],
+                "scale": 1,
+            }
+        cdp_answer = await cdp_sessions.send(page, "Page.captureScreenshot", params)
+        return self.encode(cdp_answer["data"])
+
+    def encode(self, image_base64: str) -> PageScreenshot:
+        """Downscale and deduplicate one frame captured with ``options.cdp_params()``."""
+        options = self.options
+        dedup = options.dedup_distance >= 0
+        if not (dedup or options.max_width or options.max_height):
+            return PageScreenshot(image_base64, options.mime_type)
+
+        image = PIL.Image.open(io.BytesIO(base64.b64decode(image_base64)))
+        frame_hash = thumbnail = None
+        if dedup:
+            frame_hash = difference_hash(image)
+            thumbnail = np.asarray(image.convert("L").reduce(DEDUP_REDUCE_FACTOR), dtype=np.int16)
+            if self._previous is not None:
+                previous_hash, previous_thumbnail, previous_shot = self._previous
+                if (
+                    bin(frame_hash ^ previous_hash).count("1") <= options.dedup_distance
+                    and thumbnail.shape == previous_thumbnail.shape
+                    and np.abs(thumbnail - previous_thumbnail).max() <= DEDUP_PIXEL_TOLERANCE
+                ):
+                    return PageScreenshot(previous_shot.base64, previous_shot.mime_type, duplicate=True)
+
+        max_size = (options.max_width or image.width, options.max_height or image.height)
+        if image.width > max_size[0] or image.height > max_size[1]:
+            image.thumbnail(max_size, PIL.Image.Resampling.LANCZOS)
+            save_params = {"format": SCREENSHOT_FORMATS[options.format]}
+            if options.format != "png":
+                save_params["quality"] = options.quality
+            with io.BytesIO() as f:
+                image.save(f, **save_params)
+                image_base64 = base64.b64encode(f.getvalue()).decode()
+
+        shot = PageScreenshot(image_base64, options.mime_type)
+        if dedup:
+            self._previous = (frame_hash, thumbnail, shot)
+        return shot
@@ -17,8 +17,8 @@ from cuga.backend.browser_env.page_understanding.extractor_utils.extract_async i
     extract_dom_snapshot,
     extract_focused_element_bid,
     extract_merged_axtree,
-    extract_screenshot_base64,
 )
+from cuga.backend.browser_env.page_understanding.extractor_utils.screenshot_encoding import ScreenshotEncoder
 from cuga.backend.browser_env.page_understanding.nocodeui_pu_utils.model import AnalyzePageResponse
 from cuga.backend.browser_env.page_understanding.nocodeui_pu_utils.nocode_utils import (
     analyze_current_page_async,
@@ -30,6 +30,8 @@ class PUExtracted(BaseModel):
     dom_object: Optional[Dict] = None
     focused_element_bid: Optional[str] = None
     img: Optional[str] = None
+    img_mime_type: str = "image/png"
+    img_duplicate: bool = False  # the screenshot encoder reused the previous step's frame
     extra_properties: Optional[Dict] = None
     nocodeui_pu: Optional[AnalyzePageResponse] = None
     page_content_as_str: Optional[str] = None
@@ -42,6 +44,11 @@ class PageUnderstandingExtractor:
     ):
         self.tags_to_mark = tags_to_mark
         self.lenient = lenient
+        self.screenshot_encoder = ScreenshotEncoder()
+
+    def reset(self) -> None:
+        """Forget the previous task's screenshot."""
+        self.screenshot_encoder.reset()
 
     async def extract(self, context: BrowserContext, page: Page, nocodeui_pu: bool = False) -> PUExtracted:
         dom = None
@@ -49,18 +56,23 @@ class PageUnderstandingExtractor:
         extra_properties = None
         nocodeui_pu = None
         focused_element_bid = None
-        img = None
         page_content = None
+        screenshot = None
         for retries_left in reversed(range(EXTRACT_OBS_MAX_TRIES)):
             try:
                 # pre-extraction, mark dom elements (set bid, set dynamic attributes like value and checked)
                 await _pre_extract(page, tags_to_mark=self.tags_to_mark, lenient=(retries_left == 0))
-                dom = await extract_dom_snapshot(page)
-                axtree = await extract_merged_axtree(page)
-                focused_element_bid = await extract_focused_element_bid(page)
+                # The CDP reads share one session per page and run concurrently. The single screenshot of
+                # the step is taken alongside them: the marking attributes are invisible, so the image the
+                # model sees (img) and the one recorded (screenshot) match what a post-cleanup capture shows.
+                dom, axtree, focused_element_bid, screenshot = await asyncio.gather(
+                    extract_dom_snapshot(page),
+                    extract_merged_axtree(page),
+                    extract_focused_element_bid(page),
+                    self.screenshot_encoder.capture(page),
+                )
                 extra_properties = extract_dom_extra_properties(dom)
                 h = html2text.HTML2Text()
-                img = await extract_screenshot_base64(page)
                 page_content = h.handle(await page.inner_html("body"))
                 if nocodeui_pu:
                     nocodeui_pu = await analyze_current_page_async(context)
@@ -85,13 +97,14 @@ class PageUnderstandingExtractor:
                     raise e
             break
         await _post_extract(page)
-        screenshot = await extract_screenshot_base64(page)
         return PUExtracted(
-            screenshot=screenshot,
+            screenshot=screenshot.base64,
             dom_object=dom,
             focused_element_bid=focused_element_bid,
             extra_properties=extra_properties,
-            img=img,
+            img=screenshot.base64,
+            img_mime_type=screenshot.mime_type,
+            img_duplicate=screenshot.duplicate,
             page_content_as_str=page_content,
             nocodeui_pu=nocodeui_pu,
             accessibility_tree=axtree,
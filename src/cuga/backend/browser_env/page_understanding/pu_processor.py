@@ -30,6 +30,12 @@ class PageUnderstandingProcessor:
         except (ImportError, AttributeError) as e:
             raise ImportError(f"Could not import transformer '{transformer_path}': {e}")
 
+    def reset(self) -> None:
+        """Forget the extractor's and the transformer's state from the previous task."""
+        self.extractor.reset()
+        if self.transformer is not None:
+            self.transformer.reset()
+
     async def transform(self, transformer_params: Dict = {}) -> PuAnswer:
         """Transform the previously extracted data."""
         if self._data is None:
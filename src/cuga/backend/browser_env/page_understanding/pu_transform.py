@@ -12,6 +12,7 @@ class PuAnswer(BaseModel):
     key_value_map: dict
     focused_element_bid: Optional[str] = None
     img: str
+    img_duplicate: bool = False  # img is the previous step's frame, the page looked the same
     page_content: str
 
 
@@ -19,6 +20,9 @@ class PageUnderstandingV1:
     def __init__(self):
         pass
 
+    def reset(self) -> None:
+        """Forget any state kept between the steps of a task."""
+
     async def transform(self, pu_extracted: PUExtracted, filter_visible_only=True) -> PuAnswer:
         if pu_extracted is None:
             err_msg = "Extracted pu is None please call `.extract()` first"
@@ -32,6 +36,49 @@ class PageUnderstandingV1:
             ),
             focused_element_bid=pu_extracted.focused_element_bid,
             page_content=pu_extracted.page_content_as_str,
-            img="data:image/png;base64,{}".format(pu_extracted.img),
+            img="data:{};base64,{}".format(pu_extracted.img_mime_type, pu_extracted.img),
+            img_duplicate=pu_extracted.img_duplicate,
+            key_value_map={},
+        )
+
+
+class PageUnderstandingCached(PageUnderstandingV1):
+    """
+    PageUnderstandingV1 that skips flattening a step which left the AX tree and bid properties untouched.
+
+    The previous extraction is compared with the new one and, when they are equal, its flattened text is reused.
+    Comparing is several times cheaper than flattening, so steps that did not change the page (waiting, scrolling
+    within a loaded list, reading) get cheaper while every other step costs one extra comparison. Call
+    ``reset()`` when a new task starts.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._previous = None  # (AX tree, extra properties, filter flag, flattened text)
+
+    def reset(self) -> None:
+        self._previous = None
+
+    async def transform(self, pu_extracted: PUExtracted, filter_visible_only=True) -> PuAnswer:
+        if pu_extracted is None:
+            err_msg = "Extracted pu is None please call `.extract()` first"
+            logging.error(err_msg)
+            raise Exception(err_msg)
+        key = (pu_extracted.accessibility_tree, pu_extracted.extra_properties, filter_visible_only)
+        if self._previous is not None and self._previous[:3] == key:
+            string_representation = self._previous[3]
+        else:
+            string_representation = flatten_axtree_to_str(
+                AX_tree=pu_extracted.accessibility_tree,
+                extra_properties=pu_extracted.extra_properties,
+                filter_visible_only=filter_visible_only,
+            )
+            self._previous = (*key, string_representation)
+        return PuAnswer(
+            string_representation=string_representation,
+            focused_element_bid=pu_extracted.focused_element_bid,
+            page_content=pu_extracted.page_content_as_str,
+            img="data:{};base64,{}".format(pu_extracted.img_mime_type, pu_extracted.img),
+            img_duplicate=pu_extracted.img_duplicate,
             key_value_map={},
         )
@@ -4,6 +4,7 @@
 
 import ast
 from ..types.dom_tree_types import DomTreeResult, NodeData, TextNodeData
+from .transform_utils import _IndentTable
 
 IGNORED_DOM_TAGS = ["br"]
 
@@ -16,6 +17,9 @@ IGNORED_DOM_ATTRIBUTES = (
 
 REMOVE_ATTRIBUTES = True
 
+# attributes a node's name is taken from, in order of preference
+_NAME_ATTRIBUTES = ("title", "alt", "placeholder", "value", "aria-label", "id", "class")
+
 
 def flatten_domtree_to_str(
     dom_tree: DomTreeResult,
@@ -38,15 +42,27 @@ def flatten_domtree_to_str(
     hide_all_bids: bool = False,
     include_xpath: bool = False,
 ) -> str:
-    """Formats the DOM tree into a string text similar to accessibility tree format"""
+    """
+    Formats the DOM tree into a string text similar to accessibility tree format.
 
-    def dfs(node_id: str, depth: int, parent_node_filtered: bool, parent_node_name: str) -> str:
-        tree_str = ""
-        node = dom_tree.get_node(node_id)
+    Like ``flatten_axtree_to_str``, the tree is walked with an explicit stack and printed nodes are collected
+    as lines joined once at the end.
+    """
+    node_map = dom_tree.map
+    ignored_tags = frozenset(ignored_tags)
+    ignored_attributes = frozenset(ignored_attributes)
+    print_attributes = not REMOVE_ATTRIBUTES
+    indents = _IndentTable()
+    lines = []
+
+    # (node id, depth, parent node filtered, parent node name)
+    stack = [(dom_tree.root_id, 0, False, "")]
+    while stack:
+        node_id, depth, parent_node_filtered, parent_node_name = stack.pop()
+        node = node_map.get(node_id)
         if node is None:
-            return tree_str
+            continue
 
-        indent = "\t" * depth
         skip_node = False  # node will not be printed, with no effect on children nodes
         filter_node = False  # node will not be printed, possibly along with its children nodes
 
@@ -63,134 +79,117 @@ def flatten_domtree_to_str(
                 skip_node = True
 
             if not skip_node:
-                tree_str += f'{indent}text "{node_text}"'
-            return tree_str
+                lines.append(f'{indents[depth]}text "{node_text}"')
+            continue
 
         # Handle element nodes
-        elif isinstance(node, NodeData):
-            node_tag = node.tag_name.lower()
+        if not isinstance(node, NodeData):
+            continue
+
+        node_tag = node.tag_name.lower()
+        node_attributes = node.attributes
+        node_value = None
+
+        # Extract name from various attributes
+        for name_attribute in _NAME_ATTRIBUTES:
+            node_name = node_attributes.get(name_attribute)
+            if node_name:
+                if name_attribute == "value":
+                    node_value = node_name
+                break
+        else:
             node_name = ""
-            node_value = None
-
-            # Extract name from various attributes
-            if "title" in node.attributes and node.attributes["title"]:
-                node_name = node.attributes["title"]
-            elif "alt" in node.attributes and node.attributes["alt"]:
-                node_name = node.attributes["alt"]
-            elif "placeholder" in node.attributes and node.attributes["placeholder"]:
-                node_name = node.attributes["placeholder"]
-            elif "value" in node.attributes and node.attributes["value"]:
-                node_value = node.attributes["value"]
-                node_name = node_value
-            elif "aria-label" in node.attributes and node.attributes["aria-label"]:
-                node_name = node.attributes["aria-label"]
-            elif "id" in node.attributes and node.attributes["id"]:
-                node_name = node.attributes["id"]
-            elif "class" in node.attributes and node.attributes["class"]:
-                node_name = node.attributes["class"]
-
-            # Check if we should skip this tag
-            if node_tag in ignored_tags:
-                skip_node = True
-
-            # Extract bid (assuming it might be in attributes or highlight_index)
-            bid = node.dom_tree_id if node.dom_tree_id is not None else None
-
-            # Extract node attributes
-            attributes = []
-            for attr_name, attr_value in node.attributes.items():
-                if attr_name in ignored_attributes or attr_value is None:
-                    continue
-                elif attr_name in ("required", "disabled", "checked", "selected"):
-                    if attr_value == "true" or attr_value == attr_name:
-                        attributes.append(attr_name)
-                elif attr_name not in ("title", "alt", "placeholder", "value", "aria-label", "id", "class"):
-                    # Only include non-name attributes
-                    attributes.append(f"{attr_name}={repr(attr_value)}")
-
-            # Add DOM-specific attributes
-            if node.is_interactive:
-                attributes.append("interactive")
-            if include_xpath:
-                attributes.append(f'xpath="{node.xpath}"')
-
-            if not node.highlight_index:
-                skip_node = True
-
-            if skip_generic and node_tag == "div" and not attributes and not node_name:
-                skip_node = True
-
-            if hide_all_children and parent_node_filtered:
-                skip_node = True
-
-            # Process bid-related filtering and attributes
-            filter_node, extra_attributes_to_print = _process_bid_dom(
-                bid,
-                node,
-                extra_properties=extra_properties,
-                with_visible=with_visible,
-                with_clickable=with_clickable,
-                with_center_coords=with_center_coords,
-                with_bounding_box_coords=with_bounding_box_coords,
-                with_som=with_som,
-                filter_visible_only=filter_visible_only,
-                filter_with_bid_only=filter_with_bid_only,
-                filter_som_only=filter_som_only,
-                coord_decimals=coord_decimals,
-            )
 
-            # if either is True, skip the node
-            skip_node = skip_node or filter_node
+        # Check if we should skip this tag
+        if node_tag in ignored_tags:
+            skip_node = True
+
+        # Extract bid (assuming it might be in attributes or highlight_index)
+        bid = node.dom_tree_id
+
+        # Extract node attributes; only their presence matters unless attributes are printed
+        attributes = []
+        for attr_name, attr_value in node_attributes.items():
+            if attr_name in ignored_attributes or attr_value is None:
+                continue
+            elif attr_name in ("required", "disabled", "checked", "selected"):
+                if attr_value == "true" or attr_value == attr_name:
+                    attributes.append(attr_name)
+            elif attr_name not in _NAME_ATTRIBUTES:
+                # Only include non-name attributes
+                attributes.append(f"{attr_name}={repr(attr_value)}" if print_attributes else attr_name)
+
+        # Add DOM-specific attributes
+        if node.is_interactive:
+            attributes.append("interactive")
+        if include_xpath:
+            attributes.append(f'xpath="{node.xpath}"')
+
+        if not node.highlight_index:
+            skip_node = True
+
+        if skip_generic and node_tag == "div" and not attributes and not node_name:
+            skip_node = True
+
+        if hide_all_children and parent_node_filtered:
+            skip_node = True
+
+        # Process bid-related filtering and attributes
+        filter_node, extra_attributes_to_print = _process_bid_dom(
+            bid,
+            node,
+            extra_properties=extra_properties,
+            with_visible=with_visible,
+            with_clickable=with_clickable,
+            with_center_coords=with_center_coords,
+            with_bounding_box_coords=with_bounding_box_coords,
+            with_som=with_som,
+            filter_visible_only=filter_visible_only,
+            filter_with_bid_only=filter_with_bid_only,
+            filter_som_only=filter_som_only,
+            coord_decimals=coord_decimals,
+        )
+
+        # if either is True, skip the node
+        skip_node = skip_node or filter_node
+
+        # actually print the node string
+        if not skip_node:
+            if not node_name:
+                node_str = f"{node_tag}"
+            else:
+                node_str = f"{node_tag} {repr(node_name.strip())}"
+
+            if not (
+                hide_all_bids
+                or bid is None
+                or (
+                    hide_bid_if_invisible
+                    and extra_properties
+                    and extra_properties.get(bid, {}).get("visibility", 0) < 0.5
+                )
+            ):
+                node_str = f"[{bid}] " + node_str
 
-            # insert extra attributes before regular attributes
-            attributes = extra_attributes_to_print + attributes
+            if node_value is not None and node_value != node_name:
+                node_str += f' value={repr(node_value)}'
 
-            # actually print the node string
-            if not skip_node:
-                if not node_name:
-                    node_str = f"{node_tag}"
-                else:
-                    node_str = f"{node_tag} {repr(node_name.strip())}"
-
-                if not (
-                    hide_all_bids
-                    or bid is None
-                    or (
-                        hide_bid_if_invisible
-                        and extra_properties
-                        and extra_properties.get(bid, {}).get("visibility", 0) < 0.5
-                    )
-                ):
-                    node_str = f"[{bid}] " + node_str
-
-                if node_value is not None and node_value != node_name:
-                    node_str += f' value={repr(node_value)}'
-
-                if not REMOVE_ATTRIBUTES and attributes:
+            if print_attributes:
+                # insert extra attributes before regular attributes
+                attributes = extra_attributes_to_print + attributes
+                if attributes:
                     node_str += ", ".join([""] + attributes)
 
-                tree_str += f"{indent}{node_str}"
-
-            # Process children
-            for child_id in node.children:
-                if child_id == node_id:  # avoid self-reference
-                    continue
-                child_depth = depth if skip_node else (depth + 1)
-                child_str = dfs(
-                    child_id,
-                    child_depth,
-                    parent_node_filtered=filter_node,
-                    parent_node_name=node_name,
-                )
-                if child_str:
-                    if tree_str:
-                        tree_str += "\n"
-                    tree_str += child_str
+            lines.append(indents[depth] + node_str)
 
-        return tree_str
+        # Process children
+        child_depth = depth if skip_node else (depth + 1)
+        for child_id in reversed(node.children):
+            if child_id == node_id:  # avoid self-reference
+                continue
+            stack.append((child_id, child_depth, filter_node, node_name))
 
-    tree_str = dfs(dom_tree.root_id, 0, False, "")
-    return tree_str
+    return "\n".join(lines)
 
 
 def _process_bid_dom(
@@ -17,6 +17,14 @@ IGNORED_AXTREE_PROPERTIES = (
 )
 
 
+class _IndentTable(dict):
+    """``depth -> "\\t" * depth``, built once per depth."""
+
+    def __missing__(self, depth: int) -> str:
+        indent = self[depth] = "\t" * depth
+        return indent
+
+
 def flatten_axtree_to_str(
     AX_tree,
     extra_properties: dict = None,
@@ -37,50 +45,53 @@ def flatten_axtree_to_str(
     hide_all_children: bool = False,
     hide_all_bids: bool = False,
 ) -> str:
-    """Formats the accessibility tree into a string text"""
-    node_id_to_idx = {}
-    for idx, node in enumerate(AX_tree["nodes"]):
-        node_id_to_idx[node["nodeId"]] = idx
-
-    def dfs(node_idx: int, depth: int, parent_node_filtered: bool, parent_node_name: str) -> str:
-        tree_str = ""
-        node = AX_tree["nodes"][node_idx]
-        indent = "\t" * depth
+    """
+    Formats the accessibility tree into a string text.
+
+    The tree is walked depth-first with an explicit stack, so deeply nested pages cannot hit the recursion
+    limit, and printed nodes are collected as lines joined once at the end.
+    """
+    nodes = AX_tree["nodes"]
+    node_id_to_idx = {node["nodeId"]: idx for idx, node in enumerate(nodes)}
+    ignored_roles = frozenset(ignored_roles)
+    ignored_properties = frozenset(ignored_properties)
+    indents = _IndentTable()
+    lines = []
+
+    # nodes without a bid all get the same extra attributes and filters
+    no_bid_result = None
+
+    # (node index, depth, parent node filtered, parent node name)
+    stack = [(0, 0, False, "")]
+    while stack:
+        node_idx, depth, parent_node_filtered, parent_node_name = stack.pop()
+        node = nodes[node_idx]
         skip_node = False  # node will not be printed, with no effect on children nodes
         filter_node = False  # node will not be printed, possibly along with its children nodes
         node_role = node["role"]["value"]
         node_name = ""
 
-        if node_role in ignored_roles:
+        if node_role in ignored_roles or "name" not in node:
             skip_node = True
-            pass
-        elif "name" not in node:
-            skip_node = True
-            pass
         else:
             node_name = node["name"]["value"]
-            if "value" in node and "value" in node["value"]:
-                node_value = node["value"]["value"]
-            else:
-                node_value = None
+            node_value = node["value"].get("value") if "value" in node else None
 
             # extract bid
             bid = node.get("browsergym_id", None)
 
             # extract node attributes
             attributes = []
-            for property in node.get("properties", []):
-                if "value" not in property:
-                    continue
-                if "value" not in property["value"]:
+            for property in node.get("properties", ()):
+                property_value = property.get("value")
+                if property_value is None or "value" not in property_value:
                     continue
 
                 prop_name = property["name"]
-                prop_value = property["value"]["value"]
-
                 if prop_name in ignored_properties:
                     continue
-                elif prop_name in ("required", "focused", "atomic"):
+                prop_value = property_value["value"]
+                if prop_name in ("required", "focused", "atomic"):
                     if prop_value:
                         attributes.append(prop_name)
                 else:
@@ -98,25 +109,31 @@ def flatten_axtree_to_str(
                 elif remove_redundant_static_text and node_name in parent_node_name:
                     skip_node = True
             else:
-                filter_node, extra_attributes_to_print = _process_bid(
-                    bid,
-                    extra_properties=extra_properties,
-                    with_visible=with_visible,
-                    with_clickable=with_clickable,
-                    with_center_coords=with_center_coords,
-                    with_bounding_box_coords=with_bounding_box_coords,
-                    with_som=with_som,
-                    filter_visible_only=filter_visible_only,
-                    filter_with_bid_only=filter_with_bid_only,
-                    filter_som_only=filter_som_only,
-                    coord_decimals=coord_decimals,
-                )
+                bid_result = no_bid_result if bid is None else None
+                if bid_result is None:
+                    bid_result = _process_bid(
+                        bid,
+                        extra_properties=extra_properties,
+                        with_visible=with_visible,
+                        with_clickable=with_clickable,
+                        with_center_coords=with_center_coords,
+                        with_bounding_box_coords=with_bounding_box_coords,
+                        with_som=with_som,
+                        filter_visible_only=filter_visible_only,
+                        filter_with_bid_only=filter_with_bid_only,
+                        filter_som_only=filter_som_only,
+                        coord_decimals=coord_decimals,
+                    )
+                    if bid is None:
+                        no_bid_result = bid_result
+                filter_node, extra_attributes_to_print = bid_result
 
                 # if either is True, skip the node
                 skip_node = skip_node or filter_node
 
                 # insert extra attributes before regular attributes
-                attributes = extra_attributes_to_print + attributes
+                if extra_attributes_to_print:
+                    attributes = extra_attributes_to_print + attributes
 
             # actually print the node string
             if not skip_node:
@@ -133,33 +150,23 @@ def flatten_axtree_to_str(
                     node_str = f"[{bid}] " + node_str
 
                 if node_value is not None:
-                    node_str += f' value={repr(node["value"]["value"])}'
+                    node_str += f" value={repr(node_value)}"
 
                 if attributes:
                     node_str += ", ".join([""] + attributes)
 
-                tree_str += f"{indent}{node_str}"
+                lines.append(indents[depth] + node_str)
 
-        for child_node_id in node["childIds"]:
-            if child_node_id not in node_id_to_idx or child_node_id == node["nodeId"]:
+        # mark this to save some tokens
+        child_depth = depth if skip_node else (depth + 1)
+        node_id = node["nodeId"]
+        for child_node_id in reversed(node["childIds"]):
+            child_idx = node_id_to_idx.get(child_node_id)
+            if child_idx is None or child_node_id == node_id:
                 continue
-            # mark this to save some tokens
-            child_depth = depth if skip_node else (depth + 1)
-            child_str = dfs(
-                node_id_to_idx[child_node_id],
-                child_depth,
-                parent_node_filtered=filter_node,
-                parent_node_name=node_name,
-            )
-            if child_str:
-                if tree_str:
-                    tree_str += "\n"
-                tree_str += child_str
-
-        return tree_str
+            stack.append((child_idx, child_depth, filter_node, node_name))
 
-    tree_str = dfs(0, 0, False, "")
-    return tree_str
+    return "\n".join(lines)
 
 
 def _process_bid(
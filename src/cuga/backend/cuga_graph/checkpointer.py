@@ -0,0 +1,555 @@
+"""
+Durable LangGraph checkpointers for the agent graph.
+
+``create_checkpointer`` builds the saver selected by
+``advanced_features.checkpointer`` (``memory``, ``sqlite`` or ``postgres``).
+The SQL savers keep thread state outside the worker process, so any uvicorn
+worker behind a load balancer can resume a thread started by another one.
+
+Storage layout mirrors LangGraph's ``InMemorySaver``: channel values are
+stored once per channel version (unchanged ``AgentState`` fields are not
+re-written on every step), large payloads are zlib-compressed, and threads
+that have not been written to for ``ttl_s`` seconds are evicted.
+
+SQL savers are opened once per process and shared by every graph built with the
+same settings; ``close_checkpointers`` closes them on shutdown.
+"""
+
+import asyncio
+import importlib
+import os
+import random
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from loguru import logger
+
+try:
+    from langgraph.checkpoint.base import writes_sort_key
+except ImportError:  # older langgraph-checkpoint
+
+    def writes_sort_key(task_path: str, task_id: str, idx: int):
+        return (task_id, idx)
+
+
+COMPRESSED_SUFFIX = "+zlib"
+
+# (backend, location, ttl_s) -> saver shared by every graph in this process
+_shared_savers: Dict[Tuple[str, str, Optional[float]], "SQLCheckpointSaver"] = {}
+_shared_savers_lock = threading.Lock()
+
+_DIALECTS = {
+    "sqlite": {"param": "?", "blob": "BLOB"},
+    "postgres": {"param": "%s", "blob": "BYTEA"},
+}
+
+
+def _schema(blob: str) -> List[str]:
+    return [
+        "CREATE TABLE IF NOT EXISTS checkpoint_threads (thread_id TEXT PRIMARY KEY, updated_at REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS checkpoints ("
+        "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, checkpoint_id TEXT NOT NULL, "
+        f"parent_checkpoint_id TEXT, type TEXT NOT NULL, checkpoint {blob} NOT NULL, "
+        f"metadata_type TEXT NOT NULL, metadata {blob} NOT NULL, "
+        "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))",
+        "CREATE TABLE IF NOT EXISTS checkpoint_blobs ("
+        "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, channel TEXT NOT NULL, version TEXT NOT NULL, "
+        f"type TEXT NOT NULL, value {blob}, "
+        "PRIMARY KEY (thread_id, checkpoint_ns, channel, version))",
+        "CREATE TABLE IF NOT EXISTS checkpoint_writes ("
+        "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, checkpoint_id TEXT NOT NULL, "
+        "task_id TEXT NOT NULL, idx INTEGER NOT NULL, channel TEXT NOT NULL, "
+        f"type TEXT NOT NULL, value {blob}, task_path TEXT NOT NULL, "
+        "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))",
+        "CREATE INDEX IF NOT EXISTS idx_checkpoint_threads_updated ON checkpoint_threads (updated_at)",
+    ]
+
+
+class SQLCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    LangGraph checkpoint saver over a DB-API connection.
+
+    The SQL is portable between SQLite and PostgreSQL; ``dialect`` only selects
+    the parameter style and binary column type. All statements run under a
+    lock on a single connection, and the async API delegates to a thread so
+    the event loop never blocks on the database.
+
+    Args:
+        connection: Open DB-API connection in autocommit mode.
+        dialect (str): ``sqlite`` or ``postgres``.
+        ttl_s (float, optional): Evict threads idle for longer than this.
+        evict_interval_s (float): Minimum seconds between eviction sweeps.
+        compress_min_bytes (int): Compress serialized values at least this large.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        dialect: str = "sqlite",
+        ttl_s: Optional[float] = None,
+        evict_interval_s: float = 60.0,
+        compress_min_bytes: int = 1024,
+        serde: Any = None,
+    ):
+        super().__init__(serde=serde)
+        if dialect not in _DIALECTS:
+            raise ValueError(f"Unsupported checkpointer dialect {dialect}")
+        self.conn = connection
+        self.dialect = dialect
+        self.ttl_s = ttl_s
+        self.evict_interval_s = evict_interval_s
+        self.compress_min_bytes = compress_min_bytes
+        self._param = _DIALECTS[dialect]["param"]
+        self._lock = threading.RLock()
+        self._last_eviction = 0.0
+        with self._lock:
+            for statement in _schema(_DIALECTS[dialect]["blob"]):
+                self._execute(statement)
+
+    @classmethod
+    def from_sqlite(cls, path: str, **kwargs) -> "SQLCheckpointSaver":
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return cls(conn, dialect="sqlite", **kwargs)
+
+    @classmethod
+    def from_postgres(cls, url: str, **kwargs) -> "SQLCheckpointSaver":
+        psycopg = importlib.import_module("psycopg")
+        return cls(psycopg.connect(url, autocommit=True), dialect="postgres", **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    # -- SQL helpers ---------------------------------------------------------------------
+
+    def _sql(self, statement: str) -> str:
+        return statement.replace("?", self._param) if self._param != "?" else statement
+
+    def _execute(self, statement: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(self._sql(statement), tuple(params))
+            return list(cursor.fetchall()) if cursor.description else []
+        finally:
+            cursor.close()
+
+    def _transaction(self, statements: List[Tuple[str, Sequence[Any]]]) -> None:
+        with self._lock:
+            self._execute("BEGIN")
+            try:
+                for statement, params in statements:
+                    self._execute(statement, params)
+                self._execute("COMMIT")
+            except Exception:
+                self._execute("ROLLBACK")
+                raise
+
+    # -- serialization -------------------------------------------------------------------
+
+    def _dumps(self, value: Any) -> Tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(value)
+        if data and len(data) >= self.compress_min_bytes:
+            return type_ + COMPRESSED_SUFFIX, zlib.compress(data)
+        return type_, data
+
+    def _loads(self, type_: str, data: Optional[bytes]) -> Any:
+        data = bytes(data) if data is not None else b""
+        if type_.endswith(COMPRESSED_SUFFIX):
+            type_, data = type_[: -len(COMPRESSED_SUFFIX)], zlib.decompress(data)
+        return self.serde.loads_typed((type_, data))
+
+    # -- reads ---------------------------------------------------------------------------
+
+    def _load_blobs(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> Dict[str, Any]:
+        if not versions:
+            return {}
+        pairs = " OR ".join("(channel = ? AND version = ?)" for _ in versions)
+        params: List[Any] = [thread_id, checkpoint_ns]
+        for channel, version in versions.items():
+            params.extend((channel, str(version)))
+        rows = self._execute(
+            "SELECT channel, type, value FROM checkpoint_blobs "
+            f"WHERE thread_id = ? AND checkpoint_ns = ? AND ({pairs})",
+            params,
+        )
+        return {channel: self._loads(type_, value) for channel, type_, value in rows if type_ != "empty"}
+
+    def _load_writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> List[Tuple[str, str, Any]]:
+        rows = self._execute(
+            "SELECT task_id, idx, channel, type, value, task_path FROM checkpoint_writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        )
+        rows.sort(key=lambda row: writes_sort_key(row[5], row[0], row[1]))
+        return [
+            (task_id, channel, self._loads(type_, value)) for task_id, _, channel, type_, value, _ in rows
+        ]
+
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row: Tuple) -> CheckpointTuple:
+        checkpoint_id, parent_id, type_, checkpoint_blob, metadata_type, metadata_blob = row
+        checkpoint: Checkpoint = self._loads(type_, checkpoint_blob)
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_blobs(thread_id, checkpoint_ns, checkpoint["channel_versions"]),
+            },
+            metadata=self._loads(metadata_type, metadata_blob),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = "checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata"
+        with self._lock:
+            if checkpoint_id := get_checkpoint_id(config):
+                rows = self._execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                )
+            else:
+                rows = self._execute(
+                    f"SELECT {columns} FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                )
+            if not rows:
+                return None
+            return self._to_tuple(thread_id, checkpoint_ns, rows[0])
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, "
+                f"metadata_type, metadata FROM checkpoints {where} ORDER BY thread_id, checkpoint_ns, checkpoint_id DESC",
+                params,
+            )
+            results = []
+            for thread_id, checkpoint_ns, *row in rows:
+                if filter:
+                    metadata = self._loads(row[4], row[5])
+                    if not all(metadata.get(key) == value for key, value in filter.items()):
+                        continue
+                if limit is not None and len(results) >= limit:
+                    break
+                results.append(self._to_tuple(thread_id, checkpoint_ns, tuple(row)))
+        yield from results
+
+    # -- writes --------------------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        c = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        values: Dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        statements = []
+        for channel, version in new_versions.items():
+            type_, value = self._dumps(values[channel]) if channel in values else ("empty", b"")
+            statements.append(
+                (
+                    "INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING",
+                    (thread_id, checkpoint_ns, channel, str(version), type_, value),
+                )
+            )
+        type_, checkpoint_blob = self._dumps(c)
+        metadata_type, metadata_blob = self._dumps(get_checkpoint_metadata(config, metadata))
+        statements.append(
+            (
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+                "type, checkpoint, metadata_type, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id) DO UPDATE SET "
+                "parent_checkpoint_id = excluded.parent_checkpoint_id, type = excluded.type, "
+                "checkpoint = excluded.checkpoint, metadata_type = excluded.metadata_type, "
+                "metadata = excluded.metadata",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    checkpoint_blob,
+                    metadata_type,
+                    metadata_blob,
+                ),
+            )
+        )
+        statements.append(self._touch(thread_id))
+        self._transaction(statements)
+        self._maybe_evict()
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        statements = []
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            type_, blob = self._dumps(value)
+            # Regular writes are idempotent per (task, idx); special writes (errors, interrupts) overwrite.
+            on_conflict = (
+                "DO NOTHING"
+                if write_idx >= 0
+                else "DO UPDATE SET channel = excluded.channel, type = excluded.type, "
+                "value = excluded.value, task_path = excluded.task_path"
+            )
+            statements.append(
+                (
+                    "INSERT INTO checkpoint_writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, "
+                    "channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    f"ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) {on_conflict}",
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                        task_id,
+                        write_idx,
+                        channel,
+                        type_,
+                        blob,
+                        task_path,
+                    ),
+                )
+            )
+        if statements:
+            self._transaction(statements)
+
+    def _touch(self, thread_id: str) -> Tuple[str, Sequence[Any]]:
+        return (
+            "INSERT INTO checkpoint_threads (thread_id, updated_at) VALUES (?, ?) "
+            "ON CONFLICT (thread_id) DO UPDATE SET updated_at = excluded.updated_at",
+            (thread_id, time.time()),
+        )
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._transaction(
+            [
+                (f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+                for table in ("checkpoint_writes", "checkpoint_blobs", "checkpoints", "checkpoint_threads")
+            ]
+        )
+
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """Delete every thread that has not been written to within ``ttl_s`` seconds."""
+        if not self.ttl_s:
+            return 0
+        cutoff = (now if now is not None else time.time()) - self.ttl_s
+        with self._lock:
+            expired = [
+                row[0]
+                for row in self._execute(
+                    "SELECT thread_id FROM checkpoint_threads WHERE updated_at < ?", (cutoff,)
+                )
+            ]
+            for thread_id in expired:
+                self.delete_thread(thread_id)
+        if expired:
+            logger.info(f"Evicted {len(expired)} expired checkpoint threads")
+        return len(expired)
+
+    def _maybe_evict(self) -> None:
+        now = time.monotonic()
+        if self.ttl_s and now - self._last_eviction >= self.evict_interval_s:
+            self._last_eviction = now
+            try:
+                self.evict_expired()
+            except Exception as e:
+                logger.warning(f"Checkpoint eviction failed: {e}")
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # Same scheme as InMemorySaver: sortable across processes sharing the database.
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # -- async API -----------------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        results = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in results:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def create_checkpointer(
+    backend: Optional[str] = None,
+    path: Optional[str] = None,
+    url: Optional[str] = None,
+    ttl_s: Optional[float] = None,
+) -> BaseCheckpointSaver:
+    """
+    Build the graph checkpointer selected in settings.
+
+    Args:
+        backend (str, optional): ``memory``, ``sqlite`` or ``postgres``.
+            Defaults to ``advanced_features.checkpointer``.
+        path (str, optional): SQLite database file. Defaults to
+            ``advanced_features.checkpointer_path`` (relative to ``DBS_DIR``).
+        url (str, optional): PostgreSQL URL. Defaults to ``CUGA_CHECKPOINTER_URL``.
+        ttl_s (float, optional): Thread TTL in seconds (``0`` disables eviction).
+
+    Returns:
+        BaseCheckpointSaver: The checkpointer to compile the graph with.
+    """
+    from cuga.config import DBS_DIR, settings
+
+    advanced = settings.advanced_features
+    backend = (backend or advanced.get("checkpointer", "memory")).lower()
+    if ttl_s is None:
+        ttl_s = float(advanced.get("checkpointer_ttl_s", 0) or 0)
+    if backend == "memory":
+        return MemorySaver()
+    if backend == "sqlite":
+        path = path or advanced.get("checkpointer_path", "checkpoints.sqlite")
+        if path != ":memory:" and not os.path.isabs(path):
+            path = os.path.join(DBS_DIR, path)
+        return _shared_saver(backend, path, ttl_s or None)
+    if backend == "postgres":
+        url = url or os.environ.get("CUGA_CHECKPOINTER_URL")
+        if not url:
+            raise ValueError("CUGA_CHECKPOINTER_URL must be set for the postgres checkpointer")
+        return _shared_saver(backend, url, ttl_s or None)
+    raise ValueError(f"Unsupported checkpointer backend {backend}")
+
+
+def _shared_saver(backend: str, location: str, ttl_s: Optional[float]) -> SQLCheckpointSaver:
+    # The graph is rebuilt for every task; reusing the saver avoids opening (and leaking) a connection each time.
+    key = (backend, location, ttl_s)
+    with _shared_savers_lock:
+        saver = _shared_savers.get(key)
+        if saver is None:
+            if backend == "sqlite":
+                logger.info(f"Using SQLite LangGraph checkpointer at {location}")
+                saver = SQLCheckpointSaver.from_sqlite(location, ttl_s=ttl_s)
+            else:
+                saver = SQLCheckpointSaver.from_postgres(location, ttl_s=ttl_s)
+            _shared_savers[key] = saver
+        return saver
+
+
+def close_checkpointers() -> None:
+    """Close every SQL saver opened by ``create_checkpointer`` in this process."""
+    with _shared_savers_lock:
+        savers = list(_shared_savers.values())
+        _shared_savers.clear()
+    for saver in savers:
+        try:
+            saver.close()
+        except Exception as e:
+            logger.warning(f"Failed to close checkpointer: {e}")
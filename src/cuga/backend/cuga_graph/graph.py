@@ -1,6 +1,6 @@
 from typing import Optional
 
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.constants import END, START
 from langgraph.graph import StateGraph
 
@@ -44,6 +44,7 @@ from cuga.backend.cuga_graph.nodes.task_decomposition_planning.task_decompositio
     TaskDecompositionAgent,
 )
 from cuga.backend.cuga_graph.nodes.cuga_lite.cuga_lite_node import CugaLiteNode
+from cuga.backend.cuga_graph.checkpointer import create_checkpointer
 
 
 class DynamicAgentGraph:
@@ -67,12 +68,12 @@ class DynamicAgentGraph:
         self.cuga_lite = CugaLiteNode(langfuse_handler=langfuse_handler)
         self.graph = None
 
-    async def build_graph(self):
+    async def build_graph(self, checkpointer: Optional[BaseCheckpointSaver] = None):
         graph = StateGraph(AgentState)
         await self.add_nodes(graph)
         self.add_edges(graph)
         self.graph = graph.compile(
-            checkpointer=MemorySaver(),
+            checkpointer=checkpointer or create_checkpointer(),
             interrupt_after=[self.action_agent.action_agent.name, self.interrupt_tool_node.name],
         )
 
@@ -0,0 +1,132 @@
+"""
+LRU cache of initialized CugaAgent instances.
+
+Initializing a CugaAgent loads every app's tools from the registry, builds the
+StructuredTools, renders the system prompt and compiles the CodeAct graph, which
+takes seconds. A compiled agent holds no per-task state (messages, variables and
+the thread id are passed to ``execute``), so ``CugaLiteNode`` reuses one per
+configuration. Entries are rebuilt when the tool catalog fingerprint changes,
+which covers tools registered at runtime on the tracker as well as registry
+catalog changes.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import aiohttp
+from loguru import logger
+
+from cuga.backend.tools_env.registry.utils.api_utils import get_registry_base_url
+from cuga.backend.tools_env.registry.utils.http_client import registry_session
+from cuga.config import settings
+
+
+def digest(value: Any) -> str:
+    """Stable short hash of a prompt, instructions string or config dict."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class _Entry:
+    agent: Any
+    fingerprint: Optional[str]
+
+
+class AgentCache:
+    """
+    Keeps up to ``max_size`` initialized agents, evicting the least recently used.
+
+    Args:
+        max_size (int): Maximum cached agents; 0 disables caching.
+    """
+
+    def __init__(self, max_size: int = 16):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_create(
+        self,
+        key: Hashable,
+        fingerprint: Callable[[], Awaitable[Optional[str]]],
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the agent cached under ``key``, building it if missing or built for another fingerprint.
+
+        ``fingerprint`` is only awaited when caching is enabled, since computing it can cost a registry
+        round trip.
+        """
+        if self.max_size <= 0:
+            return await factory()
+        fingerprint = await fingerprint()
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.agent
+            self.misses += 1
+            agent = await factory()
+            self._entries[key] = _Entry(agent=agent, fingerprint=fingerprint)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._locks.pop(evicted, None)
+            return agent
+
+
+class CatalogFingerprint:
+    """
+    Cheap fingerprint of the tools CugaLite can see.
+
+    Combines the apps/tools registered at runtime on the tracker with the registry catalog
+    ETag, fetched with ``If-None-Match`` so an unchanged catalog costs a 304.
+    """
+
+    def __init__(self):
+        self._etag: Optional[str] = None
+
+    async def compute(self, tracker: Any) -> str:
+        tracker_part = sorted(
+            (name, sorted(getattr(tool, "name", str(tool)) for tool in tools))
+            for name, tools in (getattr(tracker, "tools", None) or {}).items()
+        )
+        registry_part = await self._registry_etag() if settings.advanced_features.registry else "disabled"
+        return digest({"tracker": tracker_part, "registry": registry_part})
+
+    async def _registry_etag(self) -> str:
+        url = f"{get_registry_base_url()}/apis?include_response_schema=true"
+        headers = {"accept": "application/json"}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        try:
+            async with registry_session().get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 304:
+                    return self._etag
+                if response.status != 200:
+                    return f"status-{response.status}"
+                etag = response.headers.get("ETag")
+                if etag is None:
+                    # Registry without catalog ETags: hash the body instead.
+                    return digest(await response.text())
+                self._etag = etag
+                return etag
+        except Exception as e:
+            logger.debug(f"Could not fingerprint the registry catalog: {e}")
+            # Agents built while the registry is down are rebuilt once it answers again.
+            return "unavailable"
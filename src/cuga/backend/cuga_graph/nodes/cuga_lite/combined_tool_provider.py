@@ -6,13 +6,13 @@ First checks tracker for runtime tools, then falls back to registry.
 """
 
 from typing import List, Dict, Optional, Any
-import aiohttp
 
 from loguru import logger
 from langchain_core.tools import StructuredTool
 
 from cuga.backend.activity_tracker.tracker import ActivityTracker
 from cuga.backend.tools_env.registry.utils.api_utils import get_apps, get_registry_base_url
+from cuga.backend.tools_env.registry.utils.http_client import registry_session
 from cuga.backend.tools_env.registry.utils.types import AppDefinition
 from cuga.backend.cuga_graph.nodes.cuga_lite.tool_provider_interface import (
     ToolProviderInterface,
@@ -282,26 +282,23 @@ class CombinedToolProvider(ToolProviderInterface):
                 url = f'{registry_base}/applications/{app_name}/apis?include_response_schema=true'
                 headers = {'accept': 'application/json'}
 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            api_dicts = await response.json()
-                            if api_dicts:
-                                for tool_name, tool_def in api_dicts.items():
-                                    if any(tool.name == tool_name for tool in all_tools):
-                                        continue
-                                    try:
-                                        tool = create_tool_from_api_dict(tool_name, tool_def, app_name)
-                                        all_tools.append(tool)
-                                        logger.debug(f"  ✓ {tool_name}")
-                                    except Exception as e:
-                                        logger.warning(f"  ✗ Failed to create tool {tool_name}: {e}")
-                                        continue
-                        else:
-                            error_text = await response.text()
-                            logger.warning(
-                                f"Registry request failed with status {response.status}: {error_text}"
-                            )
+                async with registry_session().get(url, headers=headers) as response:
+                    if response.status == 200:
+                        api_dicts = await response.json()
+                        if api_dicts:
+                            for tool_name, tool_def in api_dicts.items():
+                                if any(tool.name == tool_name for tool in all_tools):
+                                    continue
+                                try:
+                                    tool = create_tool_from_api_dict(tool_name, tool_def, app_name)
+                                    all_tools.append(tool)
+                                    logger.debug(f"  ✓ {tool_name}")
+                                except Exception as e:
+                                    logger.warning(f"  ✗ Failed to create tool {tool_name}: {e}")
+                                    continue
+                    else:
+                        error_text = await response.text()
+                        logger.warning(f"Registry request failed with status {response.status}: {error_text}")
             except Exception as e:
                 logger.warning(f"Error getting tools from registry for {app_name}: {e}")
 
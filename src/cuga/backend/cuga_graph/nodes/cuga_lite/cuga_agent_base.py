@@ -39,6 +39,7 @@ from cuga.backend.cuga_graph.nodes.cuga_lite.tool_provider_interface import (
     AppDefinition,
 )
 from cuga.config import settings
+from cuga.backend.tools_env.registry.utils.http_client import SANDBOX_CLIENT_CODE
 
 # E2B sandbox imports (optional)
 try:
@@ -887,50 +888,43 @@ async def _execute_in_e2b_sandbox(
 # HTTP client for calling registry tools
 import asyncio
 import json
-import urllib.request
-import urllib.error
+{client_code}
 
 async def call_api(app_name, api_name, args=None):
-    \"\"\"Call registry API tool via HTTP (synchronous).\"\"\"
+    \"\"\"Call registry API tool via HTTP over a reused keep-alive connection.\"\"\"
     if args is None:
         args = {{}}
 
     # Registry URL from CUGA settings
     url = "{registry_url}/functions/call"
-
-    headers = {{
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }}
     payload = {{
         "function_name": api_name,
         "app_name": app_name,
         "args": args
     }}
 
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-
     loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _registry_post, url, payload, 30)
 
-    def _sync_call():
-        try:
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                try:
-                    response_data = json.loads(response_data)
-                except Exception as e:
-                    pass
-                return response_data
-        except urllib.error.HTTPError as e:
-            print(e)
-            raise Exception(f"HTTP Error: {{e.code}} - {{e.reason}}")
-        except urllib.error.URLError as e:
-            print(e)
-            raise Exception(f"URL Error: {{e.reason}}")
-    
-    return await loop.run_in_executor(None, _sync_call)
-""".format(registry_url=function_call_url)
+
+async def call_api_batch(calls):
+    \"\"\"Call several registry tools in one request.
+
+    `calls` is a list of (app_name, api_name, args) tuples; returns one result per call, in order.
+    A failed call yields {{"status_code": ..., "error": ...}} instead of its result.
+    \"\"\"
+    url = "{registry_url}/functions/call_batch"
+    payload = {{
+        "calls": [
+            {{"app_name": app_name, "function_name": api_name, "args": args or {{}}}}
+            for app_name, api_name, args in calls
+        ]
+    }}
+
+    loop = asyncio.get_event_loop()
+    response = await loop.run_in_executor(None, _registry_post, url, payload, 120)
+    return [item["result"] if "result" in item else item for item in response["results"]]
+""".format(registry_url=function_call_url, client_code=SANDBOX_CLIENT_CODE)
 
         # Combine: imports + call_api + tools + variables + user code
         complete_code = f"""
@@ -9,6 +9,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from cuga.backend.cuga_graph.nodes.cuga_lite import CugaAgent
+from cuga.backend.cuga_graph.nodes.cuga_lite.agent_cache import AgentCache, CatalogFingerprint, digest
 from cuga.backend.cuga_graph.nodes.shared.base_node import BaseNode
 from cuga.backend.cuga_graph.state.agent_state import AgentState, SubTaskHistory
 from cuga.backend.activity_tracker.tracker import ActivityTracker
@@ -32,6 +33,10 @@ from cuga.configurations.instructions_manager import get_all_instructions_format
 
 tracker = ActivityTracker()
 
+# Shared by every CugaLiteNode so graphs rebuilt per request still reuse initialized agents.
+agent_cache = AgentCache(max_size=settings.advanced_features.lite_agent_cache_size)
+catalog_fingerprint = CatalogFingerprint()
+
 
 def _convert_sets_to_lists(value: Any) -> Any:
     """Recursively convert sets to lists for JSON serialization."""
@@ -102,6 +107,26 @@ class CugaLiteNode(BaseNode):
             return None
 
     async def create_agent(self, app_names=None, task_loaded_from_file=False, is_autonomous_subtask=False):
+        """Return an initialized CugaAgent for this configuration, reusing a cached one when possible."""
+        instructions = get_all_instructions_formatted()
+        key = (
+            tuple(sorted(app_names)) if app_names else None,
+            digest(instructions or ""),
+            digest(getattr(self.prompt_template, "template", None) or repr(self.prompt_template)),
+            digest(settings.agent.code.model.to_dict()),
+            bool(task_loaded_from_file),
+            bool(is_autonomous_subtask),
+            # The agent keeps this node's handler, so trace ids must not leak across nodes. The cached
+            # agent holds a reference to the handler, so its id cannot be reused while the entry lives.
+            id(self.langfuse_handler) if self.langfuse_handler is not None else None,
+        )
+        return await agent_cache.get_or_create(
+            key,
+            lambda: catalog_fingerprint.compute(tracker),
+            lambda: self._build_agent(app_names, instructions, task_loaded_from_file, is_autonomous_subtask),
+        )
+
+    async def _build_agent(self, app_names, instructions, task_loaded_from_file, is_autonomous_subtask):
         """Create and initialize a new CugaAgent with optional app filtering."""
         logger.info("Initializing new CugaLite agent instance...")
 
@@ -116,7 +141,7 @@ class CugaLiteNode(BaseNode):
         agent = CugaAgent(
             app_names=app_names,
             langfuse_handler=langfuse_handler,
-            instructions=get_all_instructions_formatted(),
+            instructions=instructions,
             task_loaded_from_file=task_loaded_from_file,
             is_autonomous_subtask=is_autonomous_subtask,
             prompt_template=self.prompt_template,
@@ -4,14 +4,13 @@ Tool Registry Provider
 Provides tools from the MCP registry (separate process).
 """
 
-import aiohttp
-import json
 from typing import List, Dict, Any, Optional
 from loguru import logger
 from pydantic import create_model, Field
 from langchain_core.tools import StructuredTool
 
 from cuga.backend.tools_env.registry.utils.api_utils import get_apis, get_apps, get_registry_base_url
+from cuga.backend.tools_env.registry.utils.http_client import call_registry_batch, call_registry_function
 from cuga.backend.cuga_graph.nodes.cuga_lite.tool_provider_interface import (
     ToolProviderInterface,
     AppDefinition,
@@ -29,33 +28,25 @@ async def call_api(app_name: str, api_name: str, args: Dict[str, Any] = None):
     Returns:
         The API response
     """
-    if args is None:
-        args = {}
+    try:
+        return await call_registry_function(get_registry_base_url(), app_name, api_name, args)
+    except Exception as e:
+        raise Exception(f"Error calling API {api_name}: {str(e)}")
+
 
-    registry_base = get_registry_base_url()
-    registry_host = f'{registry_base}/functions/call'
+async def call_api_batch(calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Call several API tools in one registry round trip.
 
-    payload = {"function_name": api_name, "app_name": app_name, "args": args}
+    Args:
+        calls: List of ``{"app_name", "function_name", "args"}`` dicts
 
+    Returns:
+        One ``{"status_code", "result"}`` or ``{"status_code", "error"}`` dict per call, in order
+    """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                registry_host,
-                json=payload,
-                headers={"accept": "application/json", "Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"HTTP Error: {response.status} - {error_text}")
-
-                response_data = await response.text()
-                try:
-                    return json.loads(response_data)
-                except json.JSONDecodeError:
-                    return response_data
+        return await call_registry_batch(get_registry_base_url(), calls)
     except Exception as e:
-        raise Exception(f"Error calling API {api_name}: {str(e)}")
+        raise Exception(f"Error calling API batch: {str(e)}")
 
 
 def _convert_openapi_params_to_json_schema(parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -32,6 +32,7 @@ from pydantic import BaseModel
 from enum import Enum
 
 from cuga.backend.cuga_graph.state.agent_state import AgentState
+from cuga.backend.cuga_graph.utils import event_projection
 from cuga.backend.altk_components import ALTKLifecycleManager
 
 
@@ -291,18 +292,8 @@ class AgentLoop:
         logger.info("Current Node: {}".format(first_key))
         if first_key == "__interrupt__":
             return StreamEvent(name=str(first_key), data="")
-        state_obj = AgentState(**event[first_key])
-        messages = state_obj.messages
-        if messages:
-            event_val = messages[-1].content
-        else:
-            event_val = None
-        if first_key == "BrowserPlannerAgent":
-            event_val = json.dumps(state_obj.previous_steps[-1].model_dump())
-        if first_key == "ActionAgent":
-            event_val = json.dumps(messages[-1].tool_calls)
-        if first_key == 'ReuseAgent':
-            event_val = messages[-1].content
+        # Read only the keys the event needs instead of validating the whole AgentState per update.
+        event_val = event_projection.event_data(first_key, event[first_key])
         # Override CugaLite to display as CodeAgent for consistency
         if first_key == "CugaLite":
             first_key = "CodeAgent"
@@ -338,10 +329,8 @@ class AgentLoop:
         return None
 
     def get_output(self, event):
-        state: AgentState = AgentState(
-            **self.graph.get_state({"configurable": {"thread_id": self.thread_id}}).values
-        )
-        msg: AIMessage = state.messages[-1] if len(state.messages) > 0 else None
+        values = self.graph.get_state({"configurable": {"thread_id": self.thread_id}}).values
+        msg: Optional[AIMessage] = event_projection.last_message(values)
         logger.info("Calling get output {}".format(",".join(list(event.keys()))))
 
         # Print Langfuse trace ID if available
@@ -368,7 +357,7 @@ class AgentLoop:
             )
 
         if "FinalAnswerAgent" in list(event.keys()) or "CodeAgent" in list(event.keys()):
-            final_answer = state.final_answer
+            final_answer = event_projection.final_answer(values)
             if self.lifecycle_manager is not None:
                 final_answer = self.lifecycle_manager.enforce_policy(final_answer)
             return AgentLoopAnswer(end=True, has_tools=False, answer=final_answer, tools=msg.tool_calls)
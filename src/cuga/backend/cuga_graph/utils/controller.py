@@ -158,7 +158,7 @@ class AgentRunner:
         pu_answer = await self.env.pu_processor.transform(transformer_params={"filter_visible_only": False})
         state.elements_as_string = pu_answer.string_representation
         state.focused_element_bid = pu_answer.focused_element_bid
-        tracker.collect_image(pu_answer.img)
+        tracker.collect_image(pu_answer.img, duplicate=pu_answer.img_duplicate)
         state.read_page = pu_answer.page_content
 
     def get_current_state(self) -> AgentState:
@@ -0,0 +1,52 @@
+"""
+Lightweight projections of graph stream updates.
+
+``AgentLoop`` used to rebuild a full ``AgentState`` from every ``stream_mode="updates"`` event just to read
+the last message. Validating the whole state (variables storage, histories, chat messages) costs time
+proportional to the state size on every node transition, so these helpers read only the keys they need
+from the raw update dict and validate at most the single item they return.
+"""
+
+import json
+from typing import Any, Mapping, Optional
+
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+
+def _last(update: Mapping[str, Any], key: str) -> Any:
+    items = update.get(key) if isinstance(update, Mapping) else None
+    return items[-1] if items else None
+
+
+def last_message(update: Mapping[str, Any]) -> Optional[AIMessage]:
+    """Return the last entry of ``update["messages"]`` as an ``AIMessage``, or ``None``."""
+    message = _last(update, "messages")
+    if message is None or isinstance(message, AIMessage):
+        return message
+    if isinstance(message, BaseModel):
+        message = message.model_dump()
+    return AIMessage(**message)
+
+
+def last_previous_step(update: Mapping[str, Any]) -> Optional[dict]:
+    """Return the last entry of ``update["previous_steps"]`` as a plain dict, or ``None``."""
+    step = _last(update, "previous_steps")
+    if isinstance(step, BaseModel):
+        return step.model_dump()
+    return step
+
+
+def final_answer(update: Mapping[str, Any]) -> Optional[str]:
+    return update.get("final_answer", "") if isinstance(update, Mapping) else ""
+
+
+def event_data(node: str, update: Mapping[str, Any]) -> str:
+    """Project a node's update to the payload ``AgentLoop`` streams for it."""
+    message = last_message(update)
+    value = message.content if message is not None else None
+    if node == "BrowserPlannerAgent":
+        value = json.dumps(last_previous_step(update))
+    if node == "ActionAgent":
+        value = json.dumps(message.tool_calls)
+    return value or ""
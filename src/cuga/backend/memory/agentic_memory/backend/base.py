@@ -53,6 +53,10 @@ class BaseMemoryBackend(ABC):
     def create_and_store_fact(self, namespace_id: str, fact: Fact) -> str:
         pass
 
+    def create_and_store_facts(self, namespace_id: str, facts: list[Fact]) -> list[str]:
+        """Store several facts. Backends that can embed and insert in bulk override this."""
+        return [self.create_and_store_fact(namespace_id, fact) for fact in facts]
+
     @abstractmethod
     def search_for_facts(
         self, namespace_id: str, query: str | None = None, filters: dict | None = None, limit: int = 10
@@ -79,6 +83,10 @@ class BaseMemoryBackend(ABC):
     def add_step(self, namespace_id: str, run_id: str, step: dict, prompt: str):
         pass
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[dict]) -> list:
+        """Add several ``{"step": ..., "prompt": ...}`` items to a run. Backends that can batch override this."""
+        return [self.add_step(namespace_id, run_id, item['step'], item['prompt']) for item in steps]
+
     @abstractmethod
     def get_run(self, namespace_id: str, run_id: str) -> Run:
         pass
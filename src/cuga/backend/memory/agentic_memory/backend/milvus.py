@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 
 import json
 
 import uuid
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
 from cuga.backend.memory.agentic_memory.backend.base import BaseMemoryBackend
 from cuga.backend.memory.agentic_memory.config import milvus_config
@@ -20,6 +22,12 @@ from collections.abc import Generator
 
 logger = Logging.get_logger()
 
+# Validates a whole query result in one call instead of one model_validate per row.
+_recorded_facts = TypeAdapter(list[RecordedFact])
+
+# Step extractions are LLM calls, so add_steps runs this many at a time.
+MAX_PARALLEL_EXTRACTIONS = 8
+
 
 class MilvusMemoryBackend(BaseMemoryBackend):
     milvus = get_milvus_client()
@@ -83,19 +91,27 @@ class MilvusMemoryBackend(BaseMemoryBackend):
             db_manager.delete_namespace(namespace_id)
 
     def create_and_store_fact(self, namespace_id: str, fact: Fact) -> str:
-        self.validate_namespace(namespace_id)
-
-        # Use fact's metadata if provided, otherwise default to empty dict for Milvus compatibility
-        fact_data = fact.model_dump()
-        if fact_data.get('metadata') is None:
-            fact_data['metadata'] = {}
+        return self.create_and_store_facts(namespace_id, [fact])[0]
 
-        return str(
-            self.milvus.insert(
-                collection_name=namespace_id,
-                data={**fact_data, 'embedding': self.embedding_model.encode(fact.content)},
-            )['ids'][0]
-        )
+    def create_and_store_facts(self, namespace_id: str, facts: list[Fact], batch_size: int = 64) -> list[str]:
+        """Embed ``facts`` in batches and insert them with a single Milvus call, returning their IDs."""
+        self.validate_namespace(namespace_id)
+        if not facts:
+            return []
+
+        embeddings = self.embedding_model.encode([fact.content for fact in facts], batch_size=batch_size)
+        rows = []
+        for fact, embedding in zip(facts, embeddings):
+            # Use fact's metadata if provided, otherwise default to empty dict for Milvus compatibility
+            fact_data = fact.model_dump()
+            if fact_data.get('metadata') is None:
+                fact_data['metadata'] = {}
+            rows.append({**fact_data, 'embedding': embedding})
+
+        ids = self.milvus.insert(collection_name=namespace_id, data=rows)['ids']
+        if len(ids) != len(rows):
+            raise HTTPException(status_code=500, detail="Unable to add facts.")
+        return [str(i) for i in ids]
 
     def search_for_facts(
         self, namespace_id: str, query: str | None = None, limit: int = 10, filters: dict | None = None
@@ -103,17 +119,15 @@ class MilvusMemoryBackend(BaseMemoryBackend):
         self.validate_namespace(namespace_id)
 
         if query is None:
-            return [
-                RecordedFact.model_validate(i)
-                for i in self.milvus.query(
+            return _recorded_facts.validate_python(
+                self.milvus.query(
                     collection_name=namespace_id,
                     filter='AND'.join(['id > 0'] + [f"{k} == '{v}'" for k, v in filters.items()]),
                 )
-            ]
+            )
         else:
-            return [
-                RecordedFact.model_validate(i)
-                for i in self.milvus.query(
+            return _recorded_facts.validate_python(
+                self.milvus.query(
                     collection_name=namespace_id,
                     anns_field='embedding',
                     data=[self.embedding_model.encode(query)],
@@ -121,7 +135,7 @@ class MilvusMemoryBackend(BaseMemoryBackend):
                     limit=limit,
                     search_params={"metric_type": "IP"},
                 )
-            ]
+            )
 
     def delete_fact_by_id(self, namespace_id: str, fact_id: str):
         fact_id = int(fact_id)
@@ -148,9 +162,8 @@ class MilvusMemoryBackend(BaseMemoryBackend):
         with SQLiteManager() as db_manager:
             db_manager.delete_run(namespace_id=namespace_id, run_id=run_id)
 
-    def add_step(self, namespace_id: str, run_id: str, step: dict, prompt: str):
-        self.validate_namespace(namespace_id)
-        llm = get_chat_model(milvus_config.step_processing)
+    @staticmethod
+    def _extract_step(llm, step: dict, prompt: str) -> dict:
         messages = [
             {
                 "role": "system",
@@ -163,39 +176,55 @@ class MilvusMemoryBackend(BaseMemoryBackend):
         for attempt in range(3):
             extraction = llm.invoke(messages).content
             try:
-                parsed_extraction = json.loads(extraction)
+                return json.loads(extraction)
             except JSONDecodeError:
                 continue
-            else:
-                break
-        else:
-            raise HTTPException(
-                status_code=500, detail=f"Unable to parse JSON output from llm prompt:\n{extraction}"
+        raise HTTPException(
+            status_code=500, detail=f"Unable to parse JSON output from llm prompt:\n{extraction}"
+        )
+
+    def add_step(self, namespace_id: str, run_id: str, step: dict, prompt: str):
+        return self.add_steps(namespace_id, run_id, [{'step': step, 'prompt': prompt}])[0]
+
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[dict]) -> list[str]:
+        """Add several steps to a run.
+
+        ``steps`` holds ``{"step": ..., "prompt": ...}`` items. Extractions run concurrently, the summaries
+        are embedded in one batch and all rows are inserted with a single Milvus call.
+        """
+        self.validate_namespace(namespace_id)
+        if not steps:
+            return []
+
+        llm = get_chat_model(milvus_config.step_processing)
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_EXTRACTIONS, len(steps))) as pool:
+            extractions = list(
+                pool.map(lambda item: self._extract_step(llm, item['step'], item['prompt']), steps)
             )
 
-        added_step = self.milvus.insert(
-            collection_name=namespace_id,
-            data={
-                'content': parsed_extraction['summary'],
-                'embedding': self.embedding_model.encode(parsed_extraction['summary']),
-                'metadata': {**parsed_extraction, 'run_id': run_id, 'step': step},
-            },
-        )['ids'][0]
-
-        if len(added_step) > 0:
-            return added_step['results'][0]['id']
-        else:
+        embeddings = self.embedding_model.encode([extraction['summary'] for extraction in extractions])
+        rows = [
+            {
+                'content': extraction['summary'],
+                'embedding': embedding,
+                'metadata': {**extraction, 'run_id': run_id, 'step': item['step']},
+            }
+            for item, extraction, embedding in zip(steps, extractions, embeddings)
+        ]
+        added_steps = self.milvus.insert(collection_name=namespace_id, data=rows)['ids']
+
+        if len(added_steps) != len(rows):
             raise HTTPException(status_code=500, detail="Unable to add step.")
+        return [str(i) for i in added_steps]
 
     def get_run(self, namespace_id: str, run_id: str) -> Run:
         self.validate_namespace(namespace_id)
-        steps = [
-            RecordedFact.model_validate(i)
-            for i in self.milvus.query(
+        steps = _recorded_facts.validate_python(
+            self.milvus.query(
                 collection_name=namespace_id,
                 filter=f"run_id == '{run_id}'",
             )
-        ]
+        )
         sorted_steps = sorted(steps, key=lambda step: step.created_at)
 
         with SQLiteManager() as db_manager:
@@ -205,9 +234,8 @@ class MilvusMemoryBackend(BaseMemoryBackend):
 
     def search_runs(self, namespace_id: str, query: str, filters: dict[str, str]) -> Run | None:
         self.validate_namespace(namespace_id)
-        results = [
-            RecordedFact.model_validate(i)
-            for i in self.milvus.query(
+        results = _recorded_facts.validate_python(
+            self.milvus.query(
                 collection_name=namespace_id,
                 anns_field='embedding',
                 data=[self.embedding_model.encode(query)],
@@ -215,7 +243,7 @@ class MilvusMemoryBackend(BaseMemoryBackend):
                 limit=5,
                 search_params={"metric_type": "IP"},
             )
-        ]
+        )
 
         if len(results) > 0:
             run_id = results[0].run_id
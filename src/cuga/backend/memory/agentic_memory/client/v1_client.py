@@ -401,6 +401,22 @@ class V1MemoryClient:
             },
         )
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[dict]) -> list[str]:
+        """
+        Save the results of several steps into memory in one request
+        Args:
+            namespace_id: The namespace containing the run
+            run_id: The ID of the run
+            steps: A list of {"step": ..., "prompt": ...} items, as taken by `add_step`
+        Returns:
+            The IDs of the stored steps, in order.
+        """
+        return self._make_request(
+            "POST",
+            f"/v1/namespaces/{namespace_id}/runs/{run_id}/steps/batch",
+            json={"steps": steps},
+        )
+
     def search_runs(
         self, namespace_id: str, query: str | None = None, filters: dict[str, str] | None = None
     ) -> Run | None:
@@ -1,60 +1,172 @@
 import datetime
 import logging
 import os
+import queue
 import sqlite3
 import threading
+from contextlib import contextmanager
+from typing import Iterator
 
 from cuga.backend.memory.agentic_memory.schema import Namespace, Run
 from cuga.config import DBS_DIR
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DB_PATH = os.path.join(DBS_DIR, 'agentic.db')
 
-class SQLiteManager:
-    """A database for any resources that can't be generalized across backends."""
+# Statements are module constants so each pooled connection's statement cache
+# (sqlite3 keeps up to ``cached_statements`` prepared statements) hits on reuse.
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS namespaces (
+        id           TEXT PRIMARY KEY,
+        created_at   TIMESTAMP NOT NULL,
+        user_id      TEXT,
+        agent_id     TEXT,
+        app_id       TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        namespace_id TEXT NOT NULL,
+        id           TEXT NOT NULL,
+        created_at   TIMESTAMP NOT NULL,
+        ended        BOOLEAN NOT NULL,
+
+        PRIMARY KEY (namespace_id, id),
+        FOREIGN KEY (namespace_id) REFERENCES namespaces (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_runs_namespace_created ON runs (namespace_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_namespaces_created ON namespaces (created_at)",
+)
+_INSERT_NAMESPACE = (
+    "INSERT INTO namespaces (id, created_at, user_id, agent_id, app_id) VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_RUN = "INSERT INTO runs (namespace_id, id, created_at, ended) VALUES (?, ?, ?, ?)"
+_SELECT_NAMESPACE = "SELECT id, created_at, user_id, agent_id, app_id FROM namespaces WHERE id = ?"
+_SELECT_RUN = "SELECT namespace_id, id, created_at, ended FROM runs WHERE namespace_id = ? AND id = ?"
+_SELECT_NAMESPACES = "SELECT id, created_at, user_id, agent_id, app_id FROM namespaces ORDER BY id ASC"
+_SELECT_RUNS = "SELECT namespace_id, id, created_at, ended FROM runs WHERE namespace_id = ? ORDER BY id ASC"
+_END_RUN = "UPDATE runs SET ended = ? WHERE namespace_id = ? AND id = ?"
+_DELETE_NAMESPACE = "DELETE FROM namespaces WHERE id = ?"
+_DELETE_RUN = "DELETE FROM runs WHERE namespace_id = ? AND id = ?"
+
+
+class _ConnectionPool:
+    """One writer connection plus a pool of read-only connections for a single database file.
 
-    def __init__(self, db_path: str = os.path.join(DBS_DIR, 'agentic.db')):
+    The database runs in WAL mode, so readers never wait on the writer; writes are serialized by a lock.
+    """
+
+    def __init__(self, db_path: str, readers: int = 4):
         self.db_path = db_path
+        # In-memory databases are private to one connection, so everything goes through the writer.
+        self._shared = db_path != ':memory:' and not db_path.startswith('file::memory:')
+        if self._shared:
+            try:
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            except Exception:
+                pass
+        self.write_lock = threading.Lock()
+        self.writer = self._connect(read_only=False)
+        self._create_schema()
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(readers)
+        self._all_readers: list[sqlite3.Connection] = []
 
-    def _create_namespace_table(self):
-        with self._lock:
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            connection = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False, isolation_level=None
+            )
+        else:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
+
+    def _create_schema(self) -> None:
+        with self.write_lock:
             try:
-                self.connection.execute("BEGIN")
-                self.connection.execute("""
-                    CREATE TABLE IF NOT EXISTS namespaces (
-                        id           TEXT PRIMARY KEY,
-                        created_at   TIMESTAMP NOT NULL,
-                        user_id      TEXT,
-                        agent_id     TEXT,
-                        app_id       TEXT
-                    )
-                """)
-                self.connection.execute("COMMIT")
+                self.writer.execute("BEGIN")
+                for statement in _SCHEMA:
+                    self.writer.execute(statement)
+                self.writer.execute("COMMIT")
             except Exception as e:
-                self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to create namespaces table: {e}")
+                self.writer.execute("ROLLBACK")
+                logger.error(f"Failed to create tables: {e}")
                 raise
 
-    def _create_run_table(self):
-        with self._lock:
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        if not self._shared:
+            with self.write_lock:
+                yield self.writer
+            return
+        with self._reader_slots:
             try:
-                self.connection.execute("BEGIN")
-                self.connection.execute("""
-                    CREATE TABLE IF NOT EXISTS runs (
-                        namespace_id TEXT NOT NULL,
-                        id           TEXT NOT NULL,
-                        created_at   TIMESTAMP NOT NULL,
-                        ended        BOOLEAN NOT NULL,
-                        
-                        PRIMARY KEY (namespace_id, id),
-                        FOREIGN KEY (namespace_id) REFERENCES namespaces (id)
-                    )
-                """)
-                self.connection.execute("COMMIT")
-            except Exception as e:
-                self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to create runs table: {e}")
+                connection = self._readers.get_nowait()
+            except queue.Empty:
+                connection = self._connect(read_only=True)
+                self._all_readers.append(connection)
+            try:
+                yield connection
+            finally:
+                self._readers.put(connection)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in one transaction on the writer connection."""
+        with self.write_lock:
+            self.writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.writer
+            except BaseException:
+                self.writer.execute("ROLLBACK")
                 raise
+            self.writer.execute("COMMIT")
+
+    def close(self) -> None:
+        for connection in self._all_readers:
+            connection.close()
+        self._all_readers.clear()
+        self.writer.close()
+
+
+_pools: dict[str, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+class SQLiteManager:
+    """A database for any resources that can't be generalized across backends.
+
+    Connections are pooled per database file for the whole process: entering the context manager reuses
+    the pool instead of reopening the file and re-creating tables, and leaving it keeps the pool open.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, readers: int = 4):
+        self.db_path = db_path
+        self.readers = readers
+        self._pool: _ConnectionPool | None = None
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled connection (tests and process shutdown)."""
+        with _pools_lock:
+            for pool in _pools.values():
+                pool.close()
+            _pools.clear()
+
+    def _get_pool(self) -> _ConnectionPool:
+        if self._pool is None:
+            with _pools_lock:
+                pool = _pools.get(self.db_path)
+                if pool is None:
+                    pool = _pools[self.db_path] = _ConnectionPool(self.db_path, self.readers)
+            self._pool = pool
+        return self._pool
 
     def create_namespace(
         self,
@@ -64,31 +176,14 @@ class SQLiteManager:
         app_id: str | None = None,
     ) -> Namespace:
         created_at = datetime.datetime.now(datetime.timezone.utc)
-        with self._lock:
-            try:
-                self.connection.execute("BEGIN")
-                self.connection.execute(
-                    """
-                    INSERT INTO namespaces (
-                        id, created_at, user_id, agent_id, app_id
-                    )
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        namespace_id,
-                        created_at,
-                        user_id,
-                        agent_id,
-                        app_id,
-                    ),
-                )
-                self.connection.execute("COMMIT")
-            except sqlite3.IntegrityError as e:
-                raise RuntimeError(f'Namespace "{namespace_id}" already exists.') from e
-            except Exception as e:
-                self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to create namespace: {e}")
-                raise
+        try:
+            with self._get_pool().write() as connection:
+                connection.execute(_INSERT_NAMESPACE, (namespace_id, created_at, user_id, agent_id, app_id))
+        except sqlite3.IntegrityError as e:
+            raise RuntimeError(f'Namespace "{namespace_id}" already exists.') from e
+        except Exception as e:
+            logger.error(f"Failed to create namespace: {e}")
+            raise
         return Namespace(
             id=namespace_id,
             created_at=created_at,
@@ -102,84 +197,41 @@ class SQLiteManager:
         namespace_id: str,
         run_id: str,
     ) -> Run:
+        return self.create_runs(namespace_id, [run_id])[0]
+
+    def create_runs(self, namespace_id: str, run_ids: list[str]) -> list[Run]:
+        """Create several runs in a single transaction."""
         created_at = datetime.datetime.now(datetime.timezone.utc)
-        with self._lock:
-            try:
-                self.connection.execute("BEGIN")
-                self.connection.execute(
-                    """
-                    INSERT INTO runs (
-                        namespace_id, id, created_at, ended
-                    )
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (namespace_id, run_id, created_at, False),
+        try:
+            with self._get_pool().write() as connection:
+                connection.executemany(
+                    _INSERT_RUN, [(namespace_id, run_id, created_at, False) for run_id in run_ids]
                 )
-                self.connection.execute("COMMIT")
-            except sqlite3.IntegrityError as e:
-                raise RuntimeError(f'Run "{run_id}" already exists.') from e
-            except Exception as e:
-                self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to create run: {e}")
-                raise
-        return Run(id=run_id, created_at=created_at, steps=[], ended=False)
+        except sqlite3.IntegrityError as e:
+            raise RuntimeError(f'Run "{", ".join(run_ids)}" already exists.') from e
+        except Exception as e:
+            logger.error(f"Failed to create run: {e}")
+            raise
+        return [Run(id=run_id, created_at=created_at, steps=[], ended=False) for run_id in run_ids]
+
+    def _fetch(self, row_factory, sql: str, params=(), one: bool = False):
+        with self._get_pool().read() as connection:
+            cursor: sqlite3.Cursor = connection.cursor()
+            cursor.row_factory = row_factory
+            cursor.execute(sql, params)
+            return cursor.fetchone() if one else cursor.fetchall()
 
     def get_namespace(self, namespace_id: str) -> Namespace | None:
-        with self._lock:
-            cursor: sqlite3.Cursor = self.connection.cursor()
-            cursor.row_factory = Namespace.row_factory
-            cursor.execute(
-                """
-                    SELECT id, created_at, user_id, agent_id, app_id
-                    FROM namespaces
-                    WHERE id = ?
-                """,
-                (namespace_id,),
-            )
-            return cursor.fetchone()
+        return self._fetch(Namespace.row_factory, _SELECT_NAMESPACE, (namespace_id,), one=True)
 
     def get_run(self, namespace_id: str, run_id: str) -> Run | None:
-        with self._lock:
-            cursor: sqlite3.Cursor = self.connection.cursor()
-            cursor.row_factory = Run.row_factory
-            cursor.execute(
-                """
-                    SELECT namespace_id, id, created_at, ended
-                    FROM runs
-                    WHERE namespace_id = ? AND id = ?
-                """,
-                (
-                    namespace_id,
-                    run_id,
-                ),
-            )
-            return cursor.fetchone()
+        return self._fetch(Run.row_factory, _SELECT_RUN, (namespace_id, run_id), one=True)
 
     def all_namespaces(self) -> list[Namespace]:
-        with self._lock:
-            cursor: sqlite3.Cursor = self.connection.cursor()
-            cursor.row_factory = Namespace.row_factory
-            cursor.execute("""
-                SELECT id, created_at, user_id, agent_id, app_id
-                FROM namespaces
-                ORDER BY id ASC
-            """)
-            return cursor.fetchall()
+        return self._fetch(Namespace.row_factory, _SELECT_NAMESPACES)
 
     def all_runs(self, namespace_id: str) -> list[Run]:
-        with self._lock:
-            cursor: sqlite3.Cursor = self.connection.cursor()
-            cursor.row_factory = Run.row_factory
-            cursor.execute(
-                """
-                    SELECT namespace_id, id, created_at, ended
-                    FROM runs
-                    WHERE namespace_id = ?
-                    ORDER BY id ASC
-                """,
-                (namespace_id,),
-            )
-            return cursor.fetchall()
+        return self._fetch(Run.row_factory, _SELECT_RUNS, (namespace_id,))
 
     def search_namespaces(
         self,
@@ -193,88 +245,51 @@ class SQLiteManager:
             for k, v in {"user_id": user_id, "agent_id": agent_id, "app_id": app_id}.items()
             if v is not None
         }
-        sql = ' AND '.join([f"{k} = ?" for k, v in query.keys()])
+        sql = ' AND '.join([f"{k} = ?" for k in query])
         params = list(query.values()) + [limit]
         if not sql:
             raise ValueError('At least one of the parameters must not be `None`.')
-        with self._lock:
-            cursor: sqlite3.Cursor = self.connection.cursor()
-            cursor.row_factory = Namespace.row_factory
-            cursor = self.connection.execute(
-                f"""
-                    SELECT id, created_at, user_id, agent_id, app_id
-                    FROM namespaces
-                    WHERE {sql}
-                    LIMIT ?
-                """,
-                params,
-            )
-            return cursor.fetchall()
+        return self._fetch(
+            Namespace.row_factory,
+            f"SELECT id, created_at, user_id, agent_id, app_id FROM namespaces WHERE {sql} LIMIT ?",
+            params,
+        )
 
     def end_run(self, namespace_id: str, run_id: str):
-        with self._lock:
-            self.connection.execute("BEGIN")
-            self.connection.execute(
-                "UPDATE runs SET ended = ? WHERE namespace_id = ? AND id = ?",
-                (
-                    True,
-                    namespace_id,
-                    run_id,
-                ),
-            )
-            self.connection.execute("COMMIT")
+        self.end_runs(namespace_id, [run_id])
+
+    def end_runs(self, namespace_id: str, run_ids: list[str]):
+        """Mark several runs ended in a single transaction."""
+        with self._get_pool().write() as connection:
+            connection.executemany(_END_RUN, [(True, namespace_id, run_id) for run_id in run_ids])
 
     def delete_namespace(self, namespace_id: str):
-        with self._lock:
-            self.connection.execute("BEGIN")
-            self.connection.execute("DELETE FROM namespaces WHERE id = ?", (namespace_id,))
-            self.connection.execute("COMMIT")
+        with self._get_pool().write() as connection:
+            connection.execute(_DELETE_NAMESPACE, (namespace_id,))
 
     def delete_run(self, namespace_id: str, run_id: str):
-        with self._lock:
-            self.connection.execute("BEGIN")
-            self.connection.execute(
-                "DELETE FROM runs WHERE namespace_id = ? AND id = ?",
-                (
-                    namespace_id,
-                    run_id,
-                ),
-            )
-            self.connection.execute("COMMIT")
+        with self._get_pool().write() as connection:
+            connection.execute(_DELETE_RUN, (namespace_id, run_id))
 
     def reset(self) -> None:
         """Drop and recreate every table."""
-        with self._lock:
-            try:
-                self.connection.execute("BEGIN")
-                self.connection.execute("DROP TABLE IF EXISTS namespaces")
-                self.connection.execute("DROP TABLE IF EXISTS runs")
-                self.connection.execute("COMMIT")
-                self._create_namespace_table()
-            except Exception as e:
-                self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to reset tables: {e}")
-                raise
+        try:
+            with self._get_pool().write() as connection:
+                connection.execute("DROP TABLE IF EXISTS namespaces")
+                connection.execute("DROP TABLE IF EXISTS runs")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+        except Exception as e:
+            logger.error(f"Failed to reset tables: {e}")
+            raise
 
     def close(self) -> None:
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Release this handle; the pooled connections stay open for other users (see ``close_all``)."""
+        self._pool = None
 
     def __enter__(self) -> "SQLiteManager":
-        # Ensure parent directory exists
-        try:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        except Exception:
-            pass
-        self.connection: sqlite3.Connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._lock = threading.Lock()
-        self._create_namespace_table()
-        self._create_run_table()
+        self._get_pool()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
-
-    def __del__(self):
-        self.close()
@@ -241,6 +241,21 @@ def add_step(
     return memory_backend.add_step(namespace_id, run_id, step, prompt)
 
 
+@router_v1.post("/namespaces/{namespace_id}/runs/{run_id}/steps/batch")
+def add_steps(
+    namespace_id: Annotated[
+        str, Path(description='The namespace which contains facts relevant to the user.')
+    ],
+    run_id: Annotated[str, Path(description='The run which contains the steps for an agentic workflow.')],
+    steps: Annotated[
+        list[dict],
+        Body(embed=True, description='Items holding a "step" object and the "prompt" to parse it.'),
+    ],
+) -> list[str]:
+    """Add several steps into a run, in order."""
+    return memory_backend.add_steps(namespace_id, run_id, steps)
+
+
 @router_v1.post("/namespaces/{namespace_id}/runs/search")
 def search_runs(
     namespace_id: Annotated[
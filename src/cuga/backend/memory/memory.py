@@ -133,12 +133,16 @@ class Memory:
         """Add a new step into a run."""
         return self.memory_client.add_step(namespace_id, run_id, step, prompt)
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[dict]) -> list[str]:
+        """Add several ``{"step": ..., "prompt": ...}`` items into a run in one request."""
+        return self.memory_client.add_steps(namespace_id, run_id, steps)
+
     def _get_user_id(self, state: "AgentState") -> str:
         """Extract or generate user ID for memory scoping"""
         # Use the pi field from AgentState
         if hasattr(state, 'pi') and state.pi:
             pi_dict = json.loads(state.pi)
-            state.user_id = str(f"{pi_dict["first_name"]}_{pi_dict["last_name"]}_{pi_dict["phone_number"]}")
+            state.user_id = str(f"{pi_dict['first_name']}_{pi_dict['last_name']}_{pi_dict['phone_number']}")
         else:
             state.user_id = "default_user"
         self.user_id = state.user_id
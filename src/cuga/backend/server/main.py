@@ -31,6 +31,7 @@ from cuga.backend.browser_env.browser.gym_obs.http_stream_comm import (
 )
 from cuga.backend.cuga_graph.nodes.browser.action_agent.tools.tools import format_tools
 from cuga.backend.cuga_graph.graph import DynamicAgentGraph
+from cuga.backend.cuga_graph.checkpointer import close_checkpointers
 from cuga.backend.cuga_graph.utils.controller import AgentRunner
 from cuga.backend.cuga_graph.utils.event_porcessors.action_agent_event_processor import (
     ActionAgentEventProcessor,
@@ -41,6 +42,8 @@ from cuga.backend.browser_env.browser.gym_env_async import BrowserEnvGymAsync
 from cuga.backend.browser_env.browser.open_ended_async import OpenEndedTaskAsync
 from cuga.backend.cuga_graph.utils.agent_loop import AgentLoop, AgentLoopAnswer, StreamEvent, OutputFormat
 from cuga.backend.tools_env.registry.utils.api_utils import get_registry_base_url
+from cuga.backend.tools_env.registry.utils.http_client import close_registry_session
+from cuga.backend.activity_tracker.memory_ingest import shutdown_ingest_queue
 from cuga.config import (
     get_app_name_from_url,
     get_user_data_path,
@@ -289,6 +292,12 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Application is shutting down...")
 
+    close_checkpointers()
+
+    await close_registry_session()
+    # Steps still queued for the memory service are sent before the process exits.
+    await asyncio.to_thread(shutdown_ingest_queue)
+
     # Terminate the save_reuse server process if it's running
     if app_state.save_reuse_process and app_state.save_reuse_process.returncode is None:
         logger.info("Terminating save_reuse server...")
@@ -413,11 +422,14 @@ async def event_stream(query: str, api_mode=False, resume=None, thread_id: str =
                 local_state.thread_id = thread_id
 
     if not api_mode:
+        if not resume:
+            # a new query is a new task: don't diff its first page against the previous task's last one
+            app_state.env.pu_processor.reset()
         local_obs, _, _, _, local_info = await app_state.env.step("")
         pu_answer = await app_state.env.pu_processor.transform(
             transformer_params={"filter_visible_only": True}
         )
-        local_tracker.collect_image(pu_answer.img)
+        local_tracker.collect_image(pu_answer.img, duplicate=pu_answer.img_duplicate)
         if local_state:
             local_state.elements_as_string = pu_answer.string_representation
             local_state.focused_element_bid = pu_answer.focused_element_bid
@@ -588,7 +600,7 @@ async def event_stream(query: str, api_mode=False, resume=None, thread_id: str =
                             pu_answer = await app_state.env.pu_processor.transform(
                                 transformer_params={"filter_visible_only": True}
                             )
-                            local_tracker.collect_image(pu_answer.img)
+                            local_tracker.collect_image(pu_answer.img, duplicate=pu_answer.img_duplicate)
                             local_state.elements_as_string = pu_answer.string_representation
                             local_state.focused_element_bid = pu_answer.focused_element_bid
                             local_state.read_page = pu_answer.page_content
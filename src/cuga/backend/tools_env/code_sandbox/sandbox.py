@@ -16,6 +16,7 @@ from datetime import datetime
 from loguru import logger
 from cuga.config import settings, LOGGING_DIR
 from cuga.backend.tools_env.registry.utils.api_utils import get_registry_base_url
+from cuga.backend.tools_env.registry.utils.http_client import SANDBOX_CLIENT_CODE
 import docker
 
 
@@ -83,9 +84,7 @@ def get_premable(is_local=False, current_date=None):
     # Check if registry_host was explicitly configured
     if hasattr(settings.server_ports, 'registry_host') and settings.server_ports.registry_host:
         # Use the configured registry_host directly
-        registry_host = (
-            f"{registry_base}/functions/call?trajectory_path={quote(tracker.get_current_trajectory_path())}"
-        )
+        base_url = registry_base
     else:
         # Fallback to default behavior (Docker vs local)
         # In Docker, use host.docker.internal to access host services
@@ -94,9 +93,9 @@ def get_premable(is_local=False, current_date=None):
             if is_local
             else f"http://host.docker.internal:{str(settings.server_ports.registry)}"  # Docker host
         )
-        registry_host = (
-            f"{base_url}/functions/call?trajectory_path={quote(tracker.get_current_trajectory_path())}"
-        )
+    trajectory_query = f"trajectory_path={quote(tracker.get_current_trajectory_path())}"
+    registry_host = f"{base_url}/functions/call?{trajectory_query}"
+    batch_host = f"{base_url}/functions/call_batch?{trajectory_query}"
 
     # Check if structured tools should be enabled
     if settings.features.local_sandbox and tracker.tools is not None and len(tracker.tools) > 0:
@@ -119,6 +118,7 @@ import datetime
 import asyncio
 import concurrent.futures
 """
+        + SANDBOX_CLIENT_CODE
         + tool_import_code
         + """
 
@@ -151,39 +151,47 @@ async def call_api(app_name, api_name, args=None):
     url = \""""
         + registry_host
         + """\"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
     payload = {
         "function_name": api_name,
         "app_name": app_name,
         "args": args
     }
 
-    data = json.dumps(payload).encode('utf-8')
-    req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-
     loop = asyncio.get_event_loop()
-    
-    def _sync_call():
+    return await loop.run_in_executor(None, _registry_post, url, payload, 30)
+
+
+async def call_api_batch(calls):
+    \"\"\"Call several tools at once; `calls` is a list of (app_name, api_name, args) tuples.\"\"\"
+"""
+        + (
+            # Structured tools are resolved in-process by call_api, so they cannot go through the registry batch.
+            """
+    async def _call_one(app_name, api_name, args):
         try:
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_data = response.read().decode('utf-8')
-                try:
-                    response_data = json.loads(response_data)
-                except Exception as e:
-                    pass
-                return response_data
-        except urllib.error.HTTPError as e:
-            print(e)
-            raise Exception(f"HTTP Error: {e.code} - {e.reason}")
-        except urllib.error.URLError as e:
-            print(e)
-            raise Exception(f"URL Error: {e.reason}")
-    
-    return await loop.run_in_executor(None, _sync_call)
-        """
+            return await call_api(app_name, api_name, args)
+        except Exception as e:
+            return {"status_code": 500, "error": str(e)}
+
+    return list(await asyncio.gather(*(_call_one(*call) for call in calls)))
+"""
+            if tool_invocation_code
+            else """
+    url = \""""
+            + batch_host
+            + """\"
+    payload = {
+        "calls": [
+            {"app_name": app_name, "function_name": api_name, "args": args or {}}
+            for app_name, api_name, args in calls
+        ]
+    }
+
+    loop = asyncio.get_event_loop()
+    response = await loop.run_in_executor(None, _registry_post, url, payload, 120)
+    return [item["result"] if "result" in item else item for item in response["results"]]
+"""
+        )
     )
 
     return preamble
@@ -0,0 +1,97 @@
+"""
+Precomputed, versioned API catalog for the registry.
+
+Transforming an OpenAPI spec (or converting MCP/TRM tool parameters) into the
+registry's API format is pure work over ``MCPManager.schemas``, yet it used to be
+redone on every ``/applications/{app}/apis`` request. ``ApiCatalog`` memoizes
+the transformed result per ``(app, include_response_schema)`` together with its
+serialized JSON body and a content-hash ETag, so the registry can answer with
+the cached bytes or a ``304 Not Modified``.
+
+Entries are snapshots: they are built once, never mutated, and replaced only
+when ``invalidate`` is called because an app's schemas changed. Callers must
+treat the returned ``apis`` mappings as read-only.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+ALL_APPS = "*"
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    version: int
+    apis: Dict[str, Any]
+    body: bytes
+    etag: str
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an ``If-None-Match`` header value already names this entry."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
+
+
+def _entry(version: int, apis: Dict[str, Any]) -> CatalogEntry:
+    # default=str matches how FastAPI's encoder renders dates parsed out of YAML specs.
+    body = json.dumps(apis, default=str, separators=(",", ":")).encode("utf-8")
+    return CatalogEntry(
+        version=version, apis=apis, body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    )
+
+
+class ApiCatalog:
+    """
+    Memoized per-app API definitions.
+
+    Args:
+        build (Callable[[str, bool], Dict]): Transforms one app's schemas; called with
+            ``(app_name, include_response_schema)`` on a cache miss.
+        apps (Callable[[], Iterable[str]]): Lists the apps included in the all-apps catalog.
+    """
+
+    def __init__(self, build: Callable[[str, bool], Dict[str, Any]], apps: Callable[[], Iterable[str]]):
+        self._build = build
+        self._apps = apps
+        self._entries: Dict[Tuple[str, bool], CatalogEntry] = {}
+        self._lock = threading.RLock()
+        self.version = 0
+
+    def get(self, app_name: str, include_response_schema: bool = False) -> CatalogEntry:
+        key = (app_name, include_response_schema)
+        entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = _entry(self.version, self._build(app_name, include_response_schema))
+                    self._entries[key] = entry
+        return entry
+
+    def get_all(self, include_response_schema: bool = False) -> CatalogEntry:
+        key = (ALL_APPS, include_response_schema)
+        entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    apis = {app: self.get(app, include_response_schema).apis for app in self._apps()}
+                    entry = _entry(self.version, apis)
+                    self._entries[key] = entry
+        return entry
+
+    def invalidate(self, app_name: Optional[str] = None) -> None:
+        """Drop cached entries for ``app_name`` (or every app) and bump the catalog version."""
+        with self._lock:
+            self.version += 1
+            if app_name is None:
+                self._entries = {}
+            else:
+                self._entries = {
+                    key: entry for key, entry in self._entries.items() if key[0] not in (app_name, ALL_APPS)
+                }
@@ -1,10 +1,11 @@
 import httpx
-from typing import Dict, Any, List
+from dataclasses import asdict, dataclass
+from typing import Dict, Any, List, Optional
 import json
-import aiohttp
 from cuga.config import PACKAGE_ROOT
 import os
 import asyncio
+import time
 
 from mcp.types import TextContent
 
@@ -21,6 +22,9 @@ from cuga.backend.tools_env.registry.config.config_loader import Auth
 from cuga.backend.tools_env.registry.config.config_loader import ServiceConfig, Service
 from cuga.backend.tools_env.registry.mcp_manager.openapi_parser import SimpleOpenAPIParser
 from cuga.backend.tools_env.registry.mcp_manager.adapter import new_mcp_from_custom_parser
+from cuga.backend.tools_env.registry.mcp_manager.session_pool import MCPSessionPool
+from cuga.backend.tools_env.registry.mcp_manager.api_catalog import ApiCatalog, CatalogEntry
+from cuga.backend.tools_env.registry.mcp_manager.schema_cache import SchemaCache, content_digest
 import threading
 from collections import defaultdict
 from urllib.parse import urlparse
@@ -31,8 +35,29 @@ import yaml
 from cuga.backend.utils.consts import ServiceType, LOCAL_ORCHESTRATE_URL, LOCAL_TRM_URL
 
 
+@dataclass
+class ServiceStatus:
+    """Startup state and timing of one configured service."""
+
+    name: str
+    type: str
+    state: str = "pending"  # pending | loading | ready | failed
+    duration_ms: Optional[float] = None
+    tool_count: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
 class MCPManager:
-    def __init__(self, config: Dict[str, ServiceConfig]):
+    def __init__(
+        self,
+        config: Dict[str, ServiceConfig],
+        startup_concurrency: int = 8,
+        service_timeout_s: float = 60.0,
+        schema_cache: Optional[SchemaCache] = None,
+    ):
         self.schema_urls: Dict[str, ServiceConfig] = config
         self.servers = {}
         self.threads = {}
@@ -44,6 +69,13 @@ class MCPManager:
         self.trm_tools = {}
         self.mcp_clients = {}  # Store MCP client connections
         self.fastmcp_client = None  # FastMCP client for standard MCP servers
+        self.session_pool = MCPSessionPool()  # Persistent sessions reused across tool calls
+        self.startup_concurrency = max(1, startup_concurrency)
+        self.service_timeout_s = service_timeout_s
+        self.schema_cache = schema_cache  # On-disk cache of fetched/parsed OpenAPI specs (None disables)
+        self.service_status: Dict[str, ServiceStatus] = {}
+        self.startup_duration_ms: Optional[float] = None
+        self.catalog = ApiCatalog(self._build_apis_for_application, lambda: list(self.tools_by_server.keys()))
 
     @staticmethod
     def _get_response_schema_from_tool(
@@ -97,28 +129,33 @@ class MCPManager:
         raise RuntimeError("No free port found in safe range.")
 
     @staticmethod
-    async def _fetch_and_parse_schema(url_or_path):
+    async def _read_schema_source(url_or_path, schema_cache: Optional[SchemaCache] = None):
+        """Return ``(raw_text, content_type, is_url)`` for an OpenAPI URL or local path."""
         parsed = urlparse(url_or_path)
         is_url = parsed.scheme in ('http', 'https')
         if is_url:
             # Handle HTTP/HTTPS URLs
+            if schema_cache is not None:
+                fetched = await schema_cache.fetch(url_or_path.split('&')[0])
+                return fetched.text, fetched.content_type, is_url
             async with httpx.AsyncClient() as client:
                 r = await client.get(url_or_path.split('&')[0])
                 r.raise_for_status()
-                ct = r.headers.get("Content-Type", "").lower()
-                raw = r.text
+                return r.text, r.headers.get("Content-Type", "").lower(), is_url
+
+        # Handle local file paths
+        if os.path.isabs(url_or_path):
+            file_path = url_or_path
         else:
-            # Handle local file paths
-            if os.path.isabs(url_or_path):
-                file_path = url_or_path
-            else:
-                file_path = os.path.join(PACKAGE_ROOT, url_or_path)
+            file_path = os.path.join(PACKAGE_ROOT, url_or_path)
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                raw = f.read()
-            # Determine content type from file extension
-            ct = 'json' if file_path.lower().endswith('.json') else 'yaml'
+        with open(file_path, 'r', encoding='utf-8') as f:
+            raw = f.read()
+        # Determine content type from file extension
+        return raw, 'json' if file_path.lower().endswith('.json') else 'yaml', is_url
 
+    @staticmethod
+    def _parse_schema_text(raw, ct):
         # Parse based on content type
         if 'json' in ct:
             parser = SimpleOpenAPIParser.from_json(raw)
@@ -126,7 +163,12 @@ class MCPManager:
         else:
             parser = SimpleOpenAPIParser.from_yaml(raw)
             schema_data = yaml.safe_load(raw)
+        return schema_data, parser
 
+    @staticmethod
+    async def _fetch_and_parse_schema(url_or_path):
+        raw, ct, is_url = await MCPManager._read_schema_source(url_or_path)
+        schema_data, parser = MCPManager._parse_schema_text(raw, ct)
         return schema_data, parser, is_url
 
     def _create_mcp_server(self, base_url, parser, name):
@@ -470,12 +512,25 @@ class MCPManager:
     def get_apps(self) -> List[ServiceConfig]:
         return list(self.schema_urls.values())
 
+    def set_schemas(self, app_name: str, schemas: Any) -> None:
+        """Replace an app's schemas and invalidate its cached API catalog."""
+        self.schemas[app_name] = schemas
+        self.catalog.invalidate(app_name)
+
+    def get_catalog_entry(self, app_name: str, include_response_schema=False) -> CatalogEntry:
+        return self.catalog.get(app_name, include_response_schema)
+
+    def get_all_catalog_entry(self, include_response_schema=False) -> CatalogEntry:
+        return self.catalog.get_all(include_response_schema)
+
     def get_all_apis(self, include_response_schema=False):
-        app_names = list(self.tools_by_server.keys())
-        tools = {app: self.get_apis_for_application(app, include_response_schema) for app in app_names}
-        return tools
+        return self.catalog.get_all(include_response_schema).apis
 
     def get_apis_for_application(self, app_name, include_response_schema=False):
+        """Cached API definitions for ``app_name``; the returned mapping is shared and must not be mutated."""
+        return self.catalog.get(app_name, include_response_schema).apis
+
+    def _build_apis_for_application(self, app_name, include_response_schema=False):
         if "default" in app_name:
             return self.schemas[app_name]
         is_trm_app = any(app_name in item for item in list(self.trm_tools.keys()))
@@ -558,78 +613,80 @@ class MCPManager:
 
         try:
             for name, config in mcp_servers:
-                try:
-                    transport = self._create_transport(name, config)
-                    if not transport:
-                        continue
-
-                    client = FastMCPClient(transport)
+                await self._connect_mcp_server(name, config)
+        except Exception as e:
+            logger.error(f"Error initializing MCP servers: {e}")
+            raise
 
-                    logger.info(f"Fetching tools from {name}...")
+    async def _connect_mcp_server(self, name: str, config: ServiceConfig) -> int:
+        """Fetch the tools of one MCP server and register a pooled session for it; returns the tool count."""
+        if not FastMCPClient:
+            raise Exception("FastMCP not available. Please install fastmcp package.")
+        try:
+            transport = self._create_transport(name, config)
+            if not transport:
+                return 0
 
-                    # Add timeout for tool fetching
-                    async def fetch_tools():
-                        async with client:
-                            return await client.list_tools()
+            client = FastMCPClient(transport)
 
-                    try:
-                        tools = await asyncio.wait_for(fetch_tools(), timeout=15.0)
-                        logger.info(
-                            f"Retrieved {len(tools)} tools from {name}: {[tool.name for tool in tools]}"
-                        )
-                    except asyncio.TimeoutError:
-                        print(f"Timeout fetching tools from {name} after 15 seconds")
-                        raise
-
-                    self.schemas[name] = {
-                        "tools": [
-                            {
-                                "name": tool.name,
-                                "description": tool.description,
-                                "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {},
-                                "outputSchema": tool.outputSchema if hasattr(tool, 'outputSchema') else {},
-                            }
-                            for tool in tools
-                        ]
-                    }
+            logger.info(f"Fetching tools from {name}...")
 
-                    for tool in tools:
-                        prefixed_name = f"{name}_{tool.name}"
+            # Add timeout for tool fetching
+            async def fetch_tools():
+                async with client:
+                    return await client.list_tools()
 
-                        input_schema = tool.inputSchema if hasattr(tool, 'inputSchema') else {}
-                        flattened_params = self._flatten_tool_parameters(input_schema)
+            try:
+                tools = await asyncio.wait_for(fetch_tools(), timeout=15.0)
+                logger.info(f"Retrieved {len(tools)} tools from {name}: {[tool.name for tool in tools]}")
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout fetching tools from {name} after 15 seconds")
+                raise
+
+            self.schemas[name] = {
+                "tools": [
+                    {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {},
+                        "outputSchema": tool.outputSchema if hasattr(tool, 'outputSchema') else {},
+                    }
+                    for tool in tools
+                ]
+            }
 
-                        output_schema = tool.outputSchema if hasattr(tool, 'outputSchema') else {}
+            for tool in tools:
+                prefixed_name = f"{name}_{tool.name}"
 
-                        tool_dict = {
-                            "type": "function",
-                            "function": {
-                                "name": prefixed_name,
-                                "description": tool.description,
-                                "parameters": flattened_params,
-                                "outputSchema": output_schema,
-                            },
-                        }
-                        self.tools_by_server[name].append(tool_dict)
-                        self.server_by_tool[prefixed_name] = name
+                input_schema = tool.inputSchema if hasattr(tool, 'inputSchema') else {}
+                flattened_params = self._flatten_tool_parameters(input_schema)
 
-                    print(f"✓ Connected to MCP server '{name}' with {len(tools)} tools")
-                    self.mcp_clients[name] = config.url or config.command
-                    self.auth_config[name] = config.auth
+                output_schema = tool.outputSchema if hasattr(tool, 'outputSchema') else {}
 
-                    if not hasattr(self, 'mcp_transports'):
-                        self.mcp_transports = {}
-                    self.mcp_transports[name] = transport
+                tool_dict = {
+                    "type": "function",
+                    "function": {
+                        "name": prefixed_name,
+                        "description": tool.description,
+                        "parameters": flattened_params,
+                        "outputSchema": output_schema,
+                    },
+                }
+                self.tools_by_server[name].append(tool_dict)
+                self.server_by_tool[prefixed_name] = name
 
-                except Exception as e:
-                    print(f"Error connecting to MCP server {name}: {e}")
-                    import traceback
+            logger.info(f"✓ Connected to MCP server '{name}' with {len(tools)} tools")
+            self.mcp_clients[name] = config.url or config.command
+            self.auth_config[name] = config.auth
 
-                    print(f"Traceback: {traceback.format_exc()}")
-                    raise
+            if not hasattr(self, 'mcp_transports'):
+                self.mcp_transports = {}
+            self.mcp_transports[name] = transport
+            self.session_pool.register(name, lambda transport=transport: FastMCPClient(transport))
+            return len(tools)
 
         except Exception as e:
-            logger.error(f"Error initializing MCP servers: {e}")
+            logger.opt(exception=True).error(f"Error connecting to MCP server {name}: {e}")
             raise
 
     def _create_transport(self, name: str, config: ServiceConfig):
@@ -800,26 +857,22 @@ class MCPManager:
 
                 apply_authentication(auth, headers, query_params)
 
-            if hasattr(self, 'mcp_transports') and server_name in self.mcp_transports:
+            if server_name in self.session_pool:
                 original_tool_name = tool_name.replace(f"{server_name}_", "")
 
-                transport = self.mcp_transports[server_name]
-                client = FastMCPClient(transport)
-
-                async with client:
-                    result = await client.call_tool(original_tool_name, args)
-                    ##TODO add result.structured output if exists and retutn instead of text key  return [TextContent(text=result_text, type='text')]
-                    structured_content = (
-                        result.structured_content if hasattr(result, 'structured_content') else None
-                    )
-                    result_text = (
-                        structured_content
-                        if structured_content
-                        else (result.content[0].text if result.content else str(result))
-                    )
-                    if isinstance(result_text, dict):
-                        result_text = json.dumps(result_text)
-                    return [TextContent(text=result_text, type='text')]
+                result = await self.session_pool.call_tool(server_name, original_tool_name, args)
+                ##TODO add result.structured output if exists and retutn instead of text key  return [TextContent(text=result_text, type='text')]
+                structured_content = (
+                    result.structured_content if hasattr(result, 'structured_content') else None
+                )
+                result_text = (
+                    structured_content
+                    if structured_content
+                    else (result.content[0].text if result.content else str(result))
+                )
+                if isinstance(result_text, dict):
+                    result_text = json.dumps(result_text)
+                return [TextContent(text=result_text, type='text')]
             else:
                 url = self.mcp_clients[server_name]
                 base_url = url.replace('/sse', '')
@@ -832,75 +885,140 @@ class MCPManager:
 
                     url_with_params = f"{base_url}?{urlencode(query_params)}"
 
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{url_with_params}/call_tool",
-                        json={"name": original_tool_name, "arguments": args},
-                        headers=headers,
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            structured_content = result.get('structured_content', None)
-                            result_text = (
-                                structured_content
-                                if structured_content
-                                else (
-                                    result.get('content', [{}])[0].get('text', '')
-                                    if result.get('content')
-                                    else str(result)
-                                )
+                session = await self.session_pool.http_session()
+                async with session.post(
+                    f"{url_with_params}/call_tool",
+                    json={"name": original_tool_name, "arguments": args},
+                    headers=headers,
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        structured_content = result.get('structured_content', None)
+                        result_text = (
+                            structured_content
+                            if structured_content
+                            else (
+                                result.get('content', [{}])[0].get('text', '')
+                                if result.get('content')
+                                else str(result)
                             )
-                            if isinstance(result_text, dict):
-                                result_text = json.dumps(result_text)
-                            return [TextContent(text=result_text, type='text')]
-                        else:
-                            error_msg = f"MCP server call failed with status {response.status}"
-                            structured_content = result.get('structured_content', None)
-                            result_text = (
-                                structured_content
-                                if structured_content
-                                else (
-                                    result.get('content', [{}])[0].get('text', '')
-                                    if result.get('content')
-                                    else str(result)
-                                )
-                            )
-                            return [TextContent(text=error_msg, type='text')]
+                        )
+                        if isinstance(result_text, dict):
+                            result_text = json.dumps(result_text)
+                        return [TextContent(text=result_text, type='text')]
+                    else:
+                        error_msg = f"MCP server call failed with status {response.status}"
+                        return [TextContent(text=error_msg, type='text')]
 
         except Exception as e:
             error_msg = f"Error calling MCP server tool: {e}"
             return [TextContent(text=error_msg, type='text')]
 
+    async def close(self):
+        """Close pooled MCP sessions and the shared HTTP session."""
+        await self.session_pool.close()
+
     async def load_tools(self):
-        openapi = []
-        trm = []
-        mcp_servers = []
-        trm_urls = {}
+        """
+        Discover every configured service concurrently.
 
+        At most ``startup_concurrency`` services are fetched at once and each is bounded by
+        ``service_timeout_s``. A failing service is recorded in ``service_status`` and
+        skipped instead of aborting startup, so the registry comes up with whatever is reachable.
+        """
+        semaphore = asyncio.Semaphore(self.startup_concurrency)
+        discoveries = []
         for name, config in self.schema_urls.items():
             if config.type == ServiceType.OPENAPI:
-                openapi.append((name, config))
+                load = self._load_openapi_service
             elif config.type == ServiceType.TRM:
-                trm.append((name, config))
-                trm_urls[name] = {
-                    "url": config.url if config.url != "local" else LOCAL_ORCHESTRATE_URL,
-                    "tools": config.tools,
-                    "auth": config.auth,
-                }
+                load = self._load_trm_service
             elif config.type == ServiceType.MCP_SERVER:
-                mcp_servers.append((name, config))
-        if openapi and len(openapi) > 0:
-            await self.initialize_servers(openapi)
+                load = self._connect_mcp_server
+            else:
+                continue
+            service_type = getattr(config.type, "value", str(config.type))
+            self.service_status[name] = ServiceStatus(name=name, type=service_type)
+            discoveries.append(self._discover_service(semaphore, name, load(name, config)))
+
+        started = time.perf_counter()
+        await asyncio.gather(*discoveries)
+        if self.servers:
             await self.run_all_servers()
 
-        # Initialize FastMCP client for all MCP servers
-        if mcp_servers:
-            await self._initialize_fastmcp_client(mcp_servers)
+        # Transform every app's schemas once, up front, instead of on each catalog request.
+        self.catalog.invalidate()
+        self._warm_catalog()
+        self.startup_duration_ms = (time.perf_counter() - started) * 1000
+        self._log_startup_report()
+
+    async def _discover_service(self, semaphore: asyncio.Semaphore, name: str, load) -> None:
+        status = self.service_status[name]
+        async with semaphore:
+            status.state = "loading"
+            started = time.perf_counter()
+            try:
+                status.tool_count = await asyncio.wait_for(load, timeout=self.service_timeout_s)
+                status.state = "ready"
+            except Exception as e:
+                status.state = "failed"
+                status.error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+                logger.error(f"Service '{name}' failed to load: {status.error}")
+            finally:
+                status.duration_ms = (time.perf_counter() - started) * 1000
+
+    async def _load_openapi_service(self, name: str, config: ServiceConfig) -> int:
+        await self._initialize_server(name, config)
+        return len(self.tools_by_server.get(name, []))
+
+    async def _load_trm_service(self, name: str, config: ServiceConfig) -> int:
+        url = config.url if config.url != "local" else LOCAL_ORCHESTRATE_URL
+        await self._get_trm_tools(name, url, config.tools, config.auth)
+        self.add_trm_tools([(name, config)])
+        return len(self.schemas[name])
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Summarize service availability.
 
-        if len(trm_urls) > 0:
-            for name, data in trm_urls.items():
-                await self._get_trm_tools(name, data["url"], data["tools"], data["auth"])
-        self.add_trm_tools(trm)
+        ``status`` is ``ready`` when every service loaded, ``degraded`` when only some did and
+        ``unavailable`` when none loaded. Discovery finishes before the server accepts requests,
+        so there is no intermediate state to report.
+        """
+        services = {name: status.to_dict() for name, status in self.service_status.items()}
+        states = [status.state for status in self.service_status.values()]
+        if all(state == "ready" for state in states):
+            overall = "ready"
+        elif any(state == "ready" for state in states):
+            overall = "degraded"
+        else:
+            overall = "unavailable"
+        return {"status": overall, "startup_ms": self.startup_duration_ms, "services": services}
+
+    def _log_startup_report(self):
+        ready = sum(status.state == "ready" for status in self.service_status.values())
+        lines = [
+            f"  {status.name:<30} {status.state:<8} {status.duration_ms:>9.1f} ms  {status.tool_count:>4} tools"
+            + (f"  {status.error}" if status.error else "")
+            for status in sorted(self.service_status.values(), key=lambda s: s.duration_ms or 0, reverse=True)
+        ]
+        logger.info(
+            f"Loaded {ready}/{len(self.service_status)} services in {self.startup_duration_ms:.1f} ms\n"
+            + "\n".join(lines)
+        )
+
+    def _warm_catalog(self):
+        for app_name in list(self.schemas.keys()):
+            try:
+                self.catalog.get(app_name, False)
+                self.catalog.get(app_name, True)
+            except Exception as e:
+                logger.warning(f"Could not precompute API catalog for '{app_name}': {type(e).__name__}: {e}")
+        try:
+            self.catalog.get_all(False)
+            self.catalog.get_all(True)
+        except Exception as e:
+            logger.warning(f"Could not precompute the combined API catalog: {type(e).__name__}: {e}")
 
     def add_trm_tools(self, services: List[Service]):
         for name, config in services:
@@ -914,39 +1032,68 @@ class MCPManager:
     async def initialize_servers(self, services: List[Service]):
         for name, config in services:
             try:
-                schema_data, parser, is_url = await self._fetch_and_parse_schema(config.url)
-                if not is_url:
-                    # this is a path
-                    config.url = schema_data['servers'][0]['url']
+                await self._initialize_server(name, config)
+            except Exception as e:
+                print(f"Failed to initialize server for {config.url}: {e}")
 
-                # Apply filtering and overrides
-                modified_schema = self._filter_and_override_schema(schema_data, config)
+    async def _initialize_server(self, name: str, config: ServiceConfig):
+        modified_schema, parser, server_url = await self._load_openapi_schema(config)
+        if server_url is not None:
+            # this is a path
+            config.url = server_url
 
-                self.schemas[name] = modified_schema
-                self.auth_config[name] = config.auth
-                base_url = self._extract_base_url(config.url)
+        self.schemas[name] = modified_schema
+        self.auth_config[name] = config.auth
+        base_url = self._extract_base_url(config.url)
 
-                # Create parser from modified schema
-                has_body_overrides = any(
-                    override.drop_request_body_parameters for override in (config.api_overrides or [])
-                )
-                has_query_overrides = any(
-                    override.drop_query_parameters for override in (config.api_overrides or [])
-                )
+        mcp_server = self._create_mcp_server(base_url, parser, name)
+        self.servers[name] = mcp_server
+        await self._register_tools(mcp_server)
 
-                if config.include or config.api_overrides or has_body_overrides or has_query_overrides:
-                    # Re-create parser with modified schema
-                    schema_json = (
-                        yaml.dump(modified_schema)
-                        if isinstance(modified_schema, dict)
-                        else str(modified_schema)
-                    )
-                    parser = SimpleOpenAPIParser.from_yaml(schema_json)
-                mcp_server = self._create_mcp_server(base_url, parser, name)
-                self.servers[name] = mcp_server
-                await self._register_tools(mcp_server)
-            except Exception as e:
-                print(f"Failed to initialize server for {config.url}: {e}")
+    async def _load_openapi_schema(self, config: ServiceConfig):
+        """
+        Fetch, parse and filter a service's OpenAPI document.
+
+        Returns ``(filtered_schema, parser, server_url)`` where ``server_url`` is only set for
+        local files, whose base URL comes from the document. With a schema cache the result is
+        reused for as long as the document content and the service's overrides are unchanged.
+        """
+        raw, ct, is_url = await self._read_schema_source(config.url, self.schema_cache)
+        cache_key = None
+        if self.schema_cache is not None:
+            overrides = config.model_dump(mode="json", include={"include", "api_overrides"})
+            cache_key = SchemaCache.derived_key(content_digest(raw), overrides)
+            cached = self.schema_cache.load_derived(cache_key)
+            if cached is not None:
+                return cached["schema"], SimpleOpenAPIParser(cached["parser"]), cached["server_url"]
+
+        schema_data, parser = self._parse_schema_text(raw, ct)
+        server_url = None if is_url else schema_data['servers'][0]['url']
+
+        # Apply filtering and overrides
+        modified_schema = self._filter_and_override_schema(schema_data, config)
+
+        # Create parser from modified schema
+        has_body_overrides = any(
+            override.drop_request_body_parameters for override in (config.api_overrides or [])
+        )
+        has_query_overrides = any(override.drop_query_parameters for override in (config.api_overrides or []))
+
+        if config.include or config.api_overrides or has_body_overrides or has_query_overrides:
+            # Re-create parser with modified schema
+            schema_json = (
+                yaml.dump(modified_schema) if isinstance(modified_schema, dict) else str(modified_schema)
+            )
+            parser = SimpleOpenAPIParser.from_yaml(schema_json)
+
+        if cache_key is not None:
+            stored = self.schema_cache.store_derived(
+                cache_key, {"schema": modified_schema, "parser": parser.document, "server_url": server_url}
+            )
+            if stored is not None:
+                # the JSON form a warm start loads, so the cache never changes what the registry serves
+                return stored["schema"], SimpleOpenAPIParser(stored["parser"]), stored["server_url"]
+        return modified_schema, parser, server_url
 
     async def _register_tools(self, mcp_server):
         response = await mcp_server.list_tools()
@@ -0,0 +1,183 @@
+"""
+On-disk cache for OpenAPI documents fetched by the registry.
+
+Fetching, parsing and filtering every OpenAPI spec on each registry start is
+the slowest part of startup. ``SchemaCache`` keeps three kinds of files under
+its directory:
+
+- ``blobs/<sha256>``: raw spec bodies, addressed by content hash.
+- ``urls/<sha256(url)>.json``: per-URL validators (``ETag``/``Last-Modified``)
+  pointing at the blob last served for that URL.
+- ``derived/<key>.json``: the parsed and filtered result, keyed by the blob
+  hash plus the service's ``include``/``api_overrides`` config.
+
+A URL fetched less than ``ttl_s`` ago is served from disk without touching the
+network; older entries are revalidated with a conditional GET, and a failed
+request falls back to the cached copy so the registry can start offline.
+"""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+from loguru import logger
+
+# Bump when the layout of derived entries (or the filtering that produces them) changes.
+DERIVED_FORMAT_VERSION = 1
+
+
+@dataclass
+class FetchedSchema:
+    text: str
+    content_type: str
+    digest: str
+    from_cache: bool = False
+
+
+def content_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class SchemaCache:
+    """
+    Content-addressed cache of fetched OpenAPI specs and their parsed/filtered results.
+
+    Args:
+        directory (str | Path): Cache root; created on first write.
+        ttl_s (float): Serve a cached URL without revalidation for this long (0 always revalidates).
+    """
+
+    def __init__(self, directory, ttl_s: float = 3600.0):
+        self.directory = Path(directory)
+        self.ttl_s = ttl_s
+
+    @classmethod
+    def from_settings(cls) -> Optional["SchemaCache"]:
+        """Build the cache from ``advanced_features.registry_schema_cache_*``; ``None`` when disabled."""
+        from cuga.config import DBS_DIR, settings
+
+        directory = settings.advanced_features.registry_schema_cache_dir
+        if not directory:
+            return None
+        if not os.path.isabs(directory):
+            directory = os.path.join(DBS_DIR, directory)
+        return cls(directory, ttl_s=settings.advanced_features.registry_schema_cache_ttl_s)
+
+    # -- raw documents -------------------------------------------------------------------
+
+    def _url_path(self, url: str) -> Path:
+        return self.directory / "urls" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / "blobs" / digest
+
+    def _read_url_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self._url_path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            entry["text"] = self._blob_path(entry["digest"]).read_text(encoding="utf-8")
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    def _write_url_entry(self, url: str, entry: Dict[str, Any], text: str) -> None:
+        blob = self._blob_path(entry["digest"])
+        if not blob.exists():
+            _atomic_write(blob, text.encode("utf-8"))
+        _atomic_write(self._url_path(url), json.dumps(entry).encode("utf-8"))
+
+    async def fetch(self, url: str, client: Optional[httpx.AsyncClient] = None) -> FetchedSchema:
+        """Return the spec at ``url``, revalidating or serving the cached copy as appropriate."""
+        cached = self._read_url_entry(url)
+        if cached and time.time() - cached.get("fetched_at", 0) < self.ttl_s:
+            return FetchedSchema(cached["text"], cached.get("content_type", ""), cached["digest"], True)
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            if client is None:
+                async with httpx.AsyncClient() as owned:
+                    response = await owned.get(url, headers=headers)
+            else:
+                response = await client.get(url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except (httpx.HTTPError, OSError) as e:
+            if cached is None:
+                raise
+            logger.warning(f"Could not revalidate OpenAPI spec {url} ({e}); using cached copy")
+            return FetchedSchema(cached["text"], cached.get("content_type", ""), cached["digest"], True)
+
+        if response.status_code == 304 and cached:
+            text, content_type, digest = cached["text"], cached.get("content_type", ""), cached["digest"]
+            from_cache = True
+        else:
+            text = response.text
+            content_type = response.headers.get("Content-Type", "").lower()
+            digest = content_digest(text)
+            from_cache = False
+        entry = {
+            "url": url,
+            "digest": digest,
+            "content_type": content_type,
+            "etag": response.headers.get("ETag") or (cached or {}).get("etag"),
+            "last_modified": response.headers.get("Last-Modified") or (cached or {}).get("last_modified"),
+            "fetched_at": time.time(),
+        }
+        try:
+            self._write_url_entry(url, entry, text)
+        except OSError as e:
+            logger.warning(f"Could not cache OpenAPI spec {url}: {e}")
+        return FetchedSchema(text, content_type, digest, from_cache)
+
+    # -- parsed/filtered results ---------------------------------------------------------
+
+    @staticmethod
+    def derived_key(digest: str, overrides: Any) -> str:
+        fingerprint = json.dumps(
+            {"v": DERIVED_FORMAT_VERSION, "digest": digest, "overrides": overrides},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def load_derived(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self.directory / "derived" / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def store_derived(self, key: str, value: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Write a derived entry and return it as ``load_derived`` will read it back.
+
+        JSON turns the int keys of YAML specs (unquoted response codes) into strings and, with
+        ``default=str``, dates into strings too. Callers use the returned value so a cold start sees exactly
+        what a warm one will. ``None`` when the value cannot be encoded.
+        """
+        try:
+            data = json.dumps(value, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not encode schema cache entry {key}: {e}")
+            return None
+        try:
+            _atomic_write(self.directory / "derived" / f"{key}.json", data.encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not write schema cache entry {key}: {e}")
+        return json.loads(data)
@@ -0,0 +1,154 @@
+"""
+Long-lived client sessions for external MCP servers.
+
+Opening a FastMCP client per tool call spawns and handshakes a fresh stdio
+server (or a fresh SSE/HTTP session) every time. ``MCPSessionPool`` keeps one
+connected client per server instead: MCP multiplexes requests over a session,
+so concurrent calls share it, bounded by ``max_concurrency``. A session that
+drops is reconnected on the next call, and sessions idle for longer than
+``idle_timeout_s`` are closed by a background reaper.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+from loguru import logger
+
+
+class _Session:
+    def __init__(self, factory: Callable[[], Any], max_concurrency: int):
+        self.factory = factory
+        self.client: Optional[Any] = None
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.connect_lock = asyncio.Lock()
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+
+    def is_connected(self) -> bool:
+        if self.client is None:
+            return False
+        is_connected = getattr(self.client, "is_connected", None)
+        return bool(is_connected()) if callable(is_connected) else True
+
+    async def connect(self, timeout: float) -> Any:
+        async with self.connect_lock:
+            if self.is_connected():
+                return self.client
+            await self.close()
+            client = self.factory()
+            await asyncio.wait_for(client.__aenter__(), timeout=timeout)
+            self.client = client
+            return client
+
+    async def close(self) -> None:
+        client, self.client = self.client, None
+        if client is None:
+            return
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Error while closing MCP session: {e}")
+
+
+class MCPSessionPool:
+    """
+    Pool of persistent MCP client sessions, one per server.
+
+    Args:
+        max_concurrency (int): Maximum concurrent calls per server session.
+        idle_timeout_s (float): Close sessions unused for this long (0 disables).
+        connect_timeout_s (float): Timeout for connecting and handshaking a session.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 16, idle_timeout_s: float = 300.0, connect_timeout_s: float = 15.0
+    ):
+        self.max_concurrency = max_concurrency
+        self.idle_timeout_s = idle_timeout_s
+        self.connect_timeout_s = connect_timeout_s
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._sessions: Dict[str, _Session] = {}
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    def register(self, server_name: str, factory: Callable[[], Any]) -> None:
+        """Register how to build a client for ``server_name`` (e.g. ``lambda: Client(transport)``)."""
+        self._factories[server_name] = factory
+
+    def __contains__(self, server_name: str) -> bool:
+        return server_name in self._factories
+
+    def _session(self, server_name: str) -> _Session:
+        session = self._sessions.get(server_name)
+        if session is None:
+            if server_name not in self._factories:
+                raise KeyError(f"MCP server '{server_name}' is not registered")
+            session = _Session(self._factories[server_name], self.max_concurrency)
+            self._sessions[server_name] = session
+        return session
+
+    async def call_tool(self, server_name: str, tool_name: str, args: dict) -> Any:
+        """Call a tool over the server's pooled session, reconnecting once if the session dropped."""
+        session = self._session(server_name)
+        self._ensure_reaper()
+        async with session.semaphore:
+            session.in_flight += 1
+            try:
+                for attempt in (1, 2):
+                    client = await session.connect(self.connect_timeout_s)
+                    try:
+                        return await client.call_tool(tool_name, args)
+                    except Exception:
+                        # A tool error leaves the session usable; only retry when the connection died,
+                        # which means the call never completed on the server.
+                        if session.is_connected() or attempt == 2:
+                            raise
+                        logger.warning(f"MCP session to '{server_name}' dropped, reconnecting")
+            finally:
+                session.in_flight -= 1
+                session.last_used = time.monotonic()
+
+    async def http_session(self) -> aiohttp.ClientSession:
+        """Shared ``aiohttp`` session for servers reached through the plain HTTP fallback."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+        return self._http
+
+    def _ensure_reaper(self) -> None:
+        if self.idle_timeout_s and (self._reaper is None or self._reaper.done()):
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.idle_timeout_s / 2, 0.05))
+            await self.close_idle()
+
+    async def close_idle(self, now: Optional[float] = None) -> int:
+        now = time.monotonic() if now is None else now
+        idle = [
+            session
+            for session in self._sessions.values()
+            if session.client is not None
+            and session.in_flight == 0
+            and now - session.last_used >= self.idle_timeout_s
+        ]
+        for session in idle:
+            await session.close()
+        return len(idle)
+
+    async def close(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
@@ -1,17 +1,20 @@
+import asyncio
 import json
 import os
 from contextlib import asynccontextmanager
 from json import JSONDecodeError
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from pathlib import Path
 from mcp.types import TextContent
 from pydantic import BaseModel  # Import BaseModel for request body
 from typing import Dict, Any, List, Optional  # Add Any for flexible args/return
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from cuga.config import PACKAGE_ROOT
 from cuga.backend.activity_tracker.tracker import ActivityTracker, Step
 from cuga.backend.tools_env.registry.config.config_loader import load_service_configs
+from cuga.backend.tools_env.registry.mcp_manager.api_catalog import CatalogEntry
 from cuga.backend.tools_env.registry.mcp_manager.mcp_manager import MCPManager
+from cuga.backend.tools_env.registry.mcp_manager.schema_cache import SchemaCache
 from cuga.backend.tools_env.registry.registry.api_registry import ApiRegistry
 from loguru import logger
 from cuga.config import settings
@@ -35,6 +38,12 @@ class FunctionCallOnboardRequest(BaseModel):
     schemas: List[dict]  # The name of the function to call
 
 
+class FunctionCallBatchRequest(BaseModel):
+    """Request body model for calling several functions at once."""
+
+    calls: List[FunctionCallRequest]
+
+
 # Default configuration file
 DEFAULT_MCP_SERVERS_FILE = os.path.join(
     PACKAGE_ROOT, "backend", "tools_env", "registry", "config", "mcp_servers.yaml"
@@ -56,10 +65,16 @@ async def lifespan(app: FastAPI):
     config_file = get_config_filename()
     print(f"Using configuration file: {config_file}")
     services = load_service_configs(config_file)
-    mcp_manager = MCPManager(config=services)
+    mcp_manager = MCPManager(
+        config=services,
+        startup_concurrency=settings.advanced_features.registry_startup_concurrency,
+        service_timeout_s=settings.advanced_features.registry_service_timeout_s,
+        schema_cache=SchemaCache.from_settings(),
+    )
     registry = ApiRegistry(client=mcp_manager)
     await registry.start_servers()
     yield
+    await mcp_manager.close()
 
 
 # --- FastAPI Server Setup ---
@@ -84,15 +99,32 @@ async def list_applications():
     return await registry.show_applications()
 
 
+def _catalog_response(entry: CatalogEntry, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if entry.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
 # -- API Endpoints --
 @app.get("/applications/{app_name}/apis", tags=["APIs"])
-async def list_application_apis(app_name: str, include_response_schema: bool = False):
+async def list_application_apis(
+    app_name: str, include_response_schema: bool = False, if_none_match: Optional[str] = Header(default=None)
+):
     global registry
     """
     Retrieve the list of API definitions for a specific application.
+
+    Responses carry an ETag; clients sending it back in If-None-Match get a 304 until the app's schemas change.
     """
     try:
-        return await registry.show_apis_for_app(app_name, include_response_schema)
+        if app_name == "web" and registry._is_web_search_enabled():
+            return await registry.show_apis_for_app(app_name, include_response_schema)
+        entry = mcp_manager.get_catalog_entry(app_name, include_response_schema)
+        return _catalog_response(entry, if_none_match)
+    except KeyError:
+        logger.error(f"Application '{app_name}' not found in registry")
+        raise HTTPException(status_code=404, detail=f"Application '{app_name}' not found in registry")
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -101,12 +133,14 @@ async def list_application_apis(app_name: str, include_response_schema: bool = F
 
 
 @app.get("/apis", tags=["APIs"])
-async def list_all_apis(include_response_schema: bool = False):
+async def list_all_apis(
+    include_response_schema: bool = False, if_none_match: Optional[str] = Header(default=None)
+):
     global registry
     """
     Retrieve a list of all API definitions across all registered applications.
     """
-    return await registry.show_all_apis(include_response_schema)
+    return _catalog_response(mcp_manager.get_all_catalog_entry(include_response_schema), if_none_match)
 
 
 class AuthAppsRequest(BaseModel):
@@ -124,10 +158,54 @@ async def authenticate_apps(request: AuthAppsRequest):
 @app.post("/functions/onboard", tags=["Functions"])
 async def onboard_function(request: FunctionCallOnboardRequest):
     global registry, mcp_manager
-    mcp_manager.schemas[request.app_name] = request.schemas
+    mcp_manager.set_schemas(request.app_name, request.schemas)
     return {"status": f"Loaded successfully {len(request.schemas)} tools"}
 
 
+async def _execute_function_call(request: FunctionCallRequest, trajectory_path: Optional[str] = None):
+    """Run one function call and return ``(status_code, content)``."""
+    apis = await registry.show_apis_for_app(request.app_name)
+    api_info = apis.get(request.function_name, {})
+    is_secure = api_info.get("secure", False)
+    logger.debug(f"is_secure: {is_secure}")
+    if trajectory_path:
+        settings.update({"ADVANCED_FEATURES": {"TRACKER_ENABLED": True}}, merge=True)
+        tracker.collect_step_external(
+            Step(name="api_call", data=request.model_dump_json()), full_path=trajectory_path
+        )
+    result: TextContent = await registry.call_function(
+        app_name=request.app_name,
+        function_name=request.function_name,
+        arguments=request.args,
+        auth_config=mcp_manager.auth_config.get(request.app_name) if is_secure else None,
+    )
+    if isinstance(result, dict):
+        tracker.collect_step_external(
+            Step(name="api_response", data=json.dumps(result)), full_path=trajectory_path
+        )
+        return result.get("status_code", 500), result
+    result_json = None
+    logger.debug(result)
+    if result and result[0]:
+        result_json = result[0].text
+        try:
+            result_json = json.loads(result[0].text)
+        except JSONDecodeError:
+            pass
+    if result[0].text == "[]":
+        result_json = []
+    final_response = result_json
+    logger.debug(f"Final response: {final_response}")
+    tracker.collect_step_external(
+        Step(
+            name="api_response",
+            data=json.dumps(final_response) if not isinstance(final_response, str) else final_response,
+        ),
+        full_path=trajectory_path,
+    )
+    return 200, final_response
+
+
 # --- ENDPOINT for Calling Functions ---
 @app.post("/functions/call", tags=["Functions"])
 async def call_mcp_function(request: FunctionCallRequest, trajectory_path: Optional[str] = None):
@@ -141,48 +219,10 @@ async def call_mcp_function(request: FunctionCallRequest, trajectory_path: Optio
     """
     print(f"Received request to call function: {request.function_name} with args: {request.args}")
     try:
-        global mcp_manager
-        apis = await registry.show_apis_for_app(request.app_name)
-        api_info = apis.get(request.function_name, {})
-        is_secure = api_info.get("secure", False)
-        logger.debug(f"is_secure: {is_secure}")
-        if trajectory_path:
-            settings.update({"ADVANCED_FEATURES": {"TRACKER_ENABLED": True}}, merge=True)
-            tracker.collect_step_external(
-                Step(name="api_call", data=request.model_dump_json()), full_path=trajectory_path
-            )
-        result: TextContent = await registry.call_function(
-            app_name=request.app_name,
-            function_name=request.function_name,
-            arguments=request.args,
-            auth_config=mcp_manager.auth_config.get(request.app_name) if is_secure else None,
-        )
-        if isinstance(result, dict):
-            tracker.collect_step_external(
-                Step(name="api_response", data=json.dumps(result)), full_path=trajectory_path
-            )
-            return JSONResponse(status_code=result.get("status_code", 500), content=result)
-        else:
-            result_json = None
-            logger.debug(result)
-            if result and result[0]:
-                result_json = result[0].text
-                try:
-                    result_json = json.loads(result[0].text)
-                except JSONDecodeError:
-                    pass
-            if result[0].text == "[]":
-                result_json = []
-            final_response = result_json
-        logger.debug(f"Final response: {final_response}")
-        tracker.collect_step_external(
-            Step(
-                name="api_response",
-                data=json.dumps(final_response) if not isinstance(final_response, str) else final_response,
-            ),
-            full_path=trajectory_path,
-        )
-        return final_response
+        status_code, content = await _execute_function_call(request, trajectory_path)
+        if status_code != 200:
+            return JSONResponse(status_code=status_code, content=content)
+        return content
     except HTTPException as e:
         logger.error(e)
 
@@ -195,6 +235,33 @@ async def call_mcp_function(request: FunctionCallRequest, trajectory_path: Optio
         raise HTTPException(status_code=500, detail="Internal server error processing function call.")
 
 
+@app.post("/functions/call_batch", tags=["Functions"])
+async def call_mcp_function_batch(request: FunctionCallBatchRequest, trajectory_path: Optional[str] = None):
+    """
+    Calls several functions in one request, running up to
+    ``advanced_features.registry_batch_max_concurrency`` of them at a time.
+
+    Returns ``{"results": [...]}`` in request order; each entry is ``{"status_code", "result"}``
+    or, when that call failed, ``{"status_code", "error"}``. One failing call does not fail the batch.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.advanced_features.registry_batch_max_concurrency))
+
+    async def run(call: FunctionCallRequest) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                status_code, content = await _execute_function_call(call, trajectory_path)
+                return {"status_code": status_code, "result": content}
+            except HTTPException as e:
+                logger.error(e)
+                return {"status_code": e.status_code, "error": e.detail}
+            except Exception as e:
+                logger.error(f"Batch call to {call.app_name}.{call.function_name} failed: {e}")
+                return {"status_code": 500, "error": f"{type(e).__name__}: {e}"}
+
+    logger.debug(f"Received batch of {len(request.calls)} function calls")
+    return {"results": await asyncio.gather(*(run(call) for call in request.calls))}
+
+
 @app.get("/api/reset")
 async def reset():
     registry.auth_manager = None
@@ -211,6 +278,20 @@ async def get_mcp_function_schema(request: FunctionCallRequest):
     pass
 
 
+@app.get("/ready", tags=["Health"])
+async def readiness():
+    """
+    Report which configured services loaded. Returns 200 while at least one service is available
+    (``ready`` or ``degraded``) and 503 when nothing loaded.
+    """
+    manager = globals().get("mcp_manager")
+    if manager is None:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "services": {}})
+    report = manager.readiness()
+    status_code = 200 if report["status"] in ("ready", "degraded") else 503
+    return JSONResponse(status_code=status_code, content=report)
+
+
 # -- Root Endpoint --
 @app.get("/", include_in_schema=False)
 async def root():
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test suite for the /functions/call_batch endpoint
+Tests result ordering, per-call error isolation and the concurrency bound
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from cuga.backend.tools_env.registry.registry import api_registry_server as server
+from cuga.backend.tools_env.registry.registry.api_registry_server import (
+    FunctionCallBatchRequest,
+    FunctionCallRequest,
+)
+from cuga.config import settings
+
+
+def _batch(*function_names: str) -> FunctionCallBatchRequest:
+    return FunctionCallBatchRequest(
+        calls=[FunctionCallRequest(app_name="app", function_name=name, args={}) for name in function_names]
+    )
+
+
+class TestCallBatch:
+    """Test suite for batched function calls"""
+
+    @pytest.fixture
+    def fake_calls(self, monkeypatch):
+        """Replace the single-call path with one that sleeps, fails on demand and tracks concurrency"""
+        state = {"active": 0, "peak": 0}
+        delays = {"slow": 0.1, "medium": 0.05}
+
+        async def execute(request, trajectory_path=None):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            try:
+                await asyncio.sleep(delays.get(request.function_name, 0.01))
+                if request.function_name == "missing":
+                    raise HTTPException(status_code=404, detail="Function 'missing' not found")
+                if request.function_name == "broken":
+                    raise ConnectionError("connection refused")
+                return 200, {"name": request.function_name}
+            finally:
+                state["active"] -= 1
+
+        monkeypatch.setattr(server, "_execute_function_call", execute)
+        monkeypatch.setattr(settings.advanced_features, "registry_batch_max_concurrency", 2)
+        return state
+
+    @pytest.mark.asyncio
+    async def test_results_follow_request_order(self, fake_calls):
+        """Slow calls finishing last still come back in request order"""
+        response = await server.call_mcp_function_batch(_batch("slow", "medium", "fast"))
+
+        assert [r["result"]["name"] for r in response["results"]] == ["slow", "medium", "fast"]
+        assert all(r["status_code"] == 200 for r in response["results"])
+
+    @pytest.mark.asyncio
+    async def test_failing_calls_are_isolated(self, fake_calls):
+        """An HTTP error and an unexpected exception only fail their own entries"""
+        response = await server.call_mcp_function_batch(_batch("a", "missing", "broken", "b"))
+        results = response["results"]
+
+        assert results[0] == {"status_code": 200, "result": {"name": "a"}}
+        assert results[1] == {"status_code": 404, "error": "Function 'missing' not found"}
+        assert results[2]["status_code"] == 500
+        assert "ConnectionError" in results[2]["error"]
+        assert results[3] == {"status_code": 200, "result": {"name": "b"}}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, fake_calls):
+        """No more than registry_batch_max_concurrency calls run at once"""
+        response = await server.call_mcp_function_batch(_batch(*(f"call{i}" for i in range(8))))
+
+        assert len(response["results"]) == 8
+        assert fake_calls["peak"] == 2
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test suite for concurrent service discovery in MCPManager.load_tools
+Tests bounded parallelism, per-service failure isolation and the readiness report
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from cuga.backend.tools_env.registry.config.config_loader import ServiceConfig
+from cuga.backend.tools_env.registry.mcp_manager.mcp_manager import MCPManager
+from cuga.backend.utils.consts import ServiceType
+
+
+def _configs(count: int, service_type: ServiceType = ServiceType.MCP_SERVER):
+    return {
+        f"svc{i}": ServiceConfig(name=f"svc{i}", type=service_type, url=f"http://svc{i}")
+        for i in range(count)
+    }
+
+
+def _fake_loader(manager: MCPManager, delay: float, failing=(), hanging=()):
+    state = {"active": 0, "peak": 0}
+
+    async def load(name, config):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(60 if name in hanging else delay)
+            if name in failing:
+                raise ConnectionError("connection refused")
+            manager.schemas[name] = {"tools": []}
+            manager.tools_by_server[name] = []
+            return 3
+        finally:
+            state["active"] -= 1
+
+    return load, state
+
+
+class TestConcurrentStartup:
+    """Test suite for concurrent startup of configured services"""
+
+    @pytest.mark.asyncio
+    async def test_services_load_concurrently_with_bounded_parallelism(self):
+        """Ten 0.1 s services with a limit of 5 finish in about two rounds"""
+        manager = MCPManager(_configs(10), startup_concurrency=5)
+        load, state = _fake_loader(manager, delay=0.1)
+        manager._connect_mcp_server = load
+
+        started = time.perf_counter()
+        await manager.load_tools()
+        elapsed = time.perf_counter() - started
+
+        assert state["peak"] == 5
+        assert elapsed < 0.6
+        report = manager.readiness()
+        assert report["status"] == "ready"
+        assert all(service["state"] == "ready" for service in report["services"].values())
+        assert all(service["tool_count"] == 3 for service in report["services"].values())
+        assert all(service["duration_ms"] >= 90 for service in report["services"].values())
+
+    @pytest.mark.asyncio
+    async def test_failing_service_is_isolated(self):
+        """One failing and one hanging service leave the others available"""
+        manager = MCPManager(_configs(4), service_timeout_s=0.3)
+        load, _ = _fake_loader(manager, delay=0.01, failing={"svc1"}, hanging={"svc2"})
+        manager._connect_mcp_server = load
+
+        await manager.load_tools()
+
+        report = manager.readiness()
+        assert report["status"] == "degraded"
+        assert report["services"]["svc1"]["state"] == "failed"
+        assert "ConnectionError" in report["services"]["svc1"]["error"]
+        assert report["services"]["svc2"]["state"] == "failed"
+        assert "TimeoutError" in report["services"]["svc2"]["error"]
+        assert set(manager.get_server_names()) == {"svc0", "svc3"}
+
+    @pytest.mark.asyncio
+    async def test_nothing_loaded_is_unavailable(self):
+        """Readiness reports unavailable when every service failed"""
+        manager = MCPManager(_configs(2))
+        load, _ = _fake_loader(manager, delay=0, failing={"svc0", "svc1"})
+        manager._connect_mcp_server = load
+
+        await manager.load_tools()
+
+        assert manager.readiness()["status"] == "unavailable"
@@ -1,8 +1,7 @@
 import json
 from typing import List
 
-import aiohttp
-
+from cuga.backend.tools_env.registry.utils.http_client import registry_session
 from cuga.backend.tools_env.registry.utils.types import AppDefinition
 from cuga.config import settings
 from loguru import logger
@@ -60,18 +59,17 @@ async def get_apis(app_name: str):
     headers = {'accept': 'application/json'}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                # Check if the request was successful
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Request failed with status {response.status}: {error_text}")
-
-                # Parse JSON response
-                json_data = await response.json()
-                if json_data:
-                    all_tools.update(json_data)
-                return all_tools
+        async with registry_session().get(url, headers=headers) as response:
+            # Check if the request was successful
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Request failed with status {response.status}: {error_text}")
+
+            # Parse JSON response
+            json_data = await response.json()
+            if json_data:
+                all_tools.update(json_data)
+            return all_tools
 
     except Exception as e:
         if len(all_tools) > 0:
@@ -104,21 +102,20 @@ async def get_apps() -> List[AppDefinition]:
         return external_apps
     logger.debug(f"External apps are {external_apps}")
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                logger.debug("Recieved responses")
-                # Check if the request was successful
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Request failed with status {response.status}: {error_text}")
-
-                # Parse JSON response
-                json_data = await response.json()
-                result = [AppDefinition(**p) for p in json_data]
-                for e in external_apps:
-                    result.append(e)
-
-                return result
+        async with registry_session().get(url, headers=headers) as response:
+            logger.debug("Recieved responses")
+            # Check if the request was successful
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Request failed with status {response.status}: {error_text}")
+
+            # Parse JSON response
+            json_data = await response.json()
+            result = [AppDefinition(**p) for p in json_data]
+            for e in external_apps:
+                result.append(e)
+
+            return result
     except Exception as e:
         if len(external_apps) > 0:
             logger.warning("registry is not running, using external apps")
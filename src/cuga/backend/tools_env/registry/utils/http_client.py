@@ -0,0 +1,178 @@
+"""
+Pooled HTTP client for calls to the API registry.
+
+Tool calls made by generated code go through ``/functions/call``; opening a new
+``aiohttp.ClientSession`` for each one paid a TCP handshake per call and never
+reused a connection. ``registry_session`` hands out one keep-alive session per
+event loop (aiohttp sessions are bound to the loop that created them), sized by
+``advanced_features.registry_client_*``. A session is closed when its loop shuts down
+through ``asyncio.run`` (or ``loop.shutdown_asyncgens()``), so sessions opened on
+short-lived loops such as sandbox executors don't leak.
+"""
+
+import asyncio
+import contextlib
+import json
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from cuga.config import settings
+
+_JSON_HEADERS = {"accept": "application/json", "Content-Type": "application/json"}
+
+# loop -> (session, async generator that closes the session when the loop finalizes it)
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncIterator[None]]]" = weakref.WeakKeyDictionary()
+
+
+async def _close_on_loop_shutdown(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+async def _start(closer: AsyncIterator[None]) -> None:
+    # Once started, the loop tracks the generator and ``shutdown_asyncgens`` runs its ``finally``.
+    with contextlib.suppress(StopAsyncIteration):  # already closed by close_registry_session
+        await closer.__anext__()
+
+
+def registry_session() -> aiohttp.ClientSession:
+    """Return the pooled session for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _sessions.get(loop)
+    if entry is None or entry[0].closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.advanced_features.registry_client_max_connections,
+            limit_per_host=settings.advanced_features.registry_client_max_connections,
+            keepalive_timeout=settings.advanced_features.registry_client_keepalive_s,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        closer = _close_on_loop_shutdown(session)
+        loop.create_task(_start(closer))
+        entry = _sessions[loop] = (session, closer)
+    return entry[0]
+
+
+async def close_registry_session() -> None:
+    """Close the running loop's pooled session (call on application shutdown)."""
+    entry = _sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        session, closer = entry
+        await closer.aclose()
+        if not session.closed:
+            await session.close()
+
+
+def _decode(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+async def call_registry_function(
+    registry_base: str,
+    app_name: str,
+    api_name: str,
+    args: Optional[Dict[str, Any]] = None,
+    timeout: float = 30,
+) -> Any:
+    """POST one call to ``/functions/call`` and return the decoded response."""
+    payload = {"function_name": api_name, "app_name": app_name, "args": args or {}}
+    async with registry_session().post(
+        f"{registry_base}/functions/call",
+        json=payload,
+        headers=_JSON_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        text = await response.text()
+        if response.status != 200:
+            raise Exception(f"HTTP Error: {response.status} - {text}")
+        return _decode(text)
+
+
+async def call_registry_batch(
+    registry_base: str, calls: List[Dict[str, Any]], timeout: float = 120
+) -> List[Dict[str, Any]]:
+    """
+    POST several calls to ``/functions/call_batch`` in one round trip.
+
+    Each call is ``{"app_name", "function_name", "args"}``; the result list has one
+    ``{"status_code", "result"}`` (or ``{"status_code", "error"}``) entry per call, in order.
+    """
+    payload = {
+        "calls": [
+            {"app_name": c["app_name"], "function_name": c["function_name"], "args": c.get("args") or {}}
+            for c in calls
+        ]
+    }
+    async with registry_session().post(
+        f"{registry_base}/functions/call_batch",
+        json=payload,
+        headers=_JSON_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        text = await response.text()
+        if response.status != 200:
+            raise Exception(f"HTTP Error: {response.status} - {text}")
+        return json.loads(text)["results"]
+
+
+# Stdlib-only client pasted into sandbox preambles (generated code cannot import cuga or aiohttp).
+# One keep-alive connection per executor thread; a reused connection the server already closed
+# is reopened once, while a failure on a fresh connection is raised so a POST is never sent twice.
+SANDBOX_CLIENT_CODE = '''
+import http.client
+import threading
+import urllib.parse
+
+_registry_local = threading.local()
+
+
+def _registry_connection(parts, timeout):
+    conn = getattr(_registry_local, "conn", None)
+    if conn is not None and getattr(_registry_local, "netloc", None) == parts.netloc:
+        return conn, True
+    if conn is not None:
+        conn.close()
+    conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = conn_cls(parts.netloc, timeout=timeout)
+    _registry_local.conn, _registry_local.netloc = conn, parts.netloc
+    return conn, False
+
+
+def _registry_post(url, payload, timeout=30):
+    parts = urllib.parse.urlsplit(url)
+    target = parts.path + ("?" + parts.query if parts.query else "")
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"accept": "application/json", "Content-Type": "application/json"}
+    while True:
+        conn, reused = _registry_connection(parts, timeout)
+        conn.timeout = timeout
+        try:
+            conn.request("POST", target, body=body, headers=headers)
+            response = conn.getresponse()
+            text = response.read().decode("utf-8")
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+            conn.close()
+            _registry_local.conn = None
+            if not reused:
+                print(e)
+                raise Exception(f"URL Error: {e}")
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            _registry_local.conn = None
+            print(e)
+            raise Exception(f"URL Error: {e}")
+    if response.status != 200:
+        raise Exception(f"HTTP Error: {response.status} - {response.reason}")
+    try:
+        return json.loads(text)
+    except Exception:
+        return text
+'''
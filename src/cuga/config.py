@@ -122,8 +122,13 @@ validators = [
     Validator("advanced_features.langfuse_tracing", default=False),
     Validator("advanced_features.benchmark", default="default"),
     Validator("advanced_features.tracker_enabled", default=False),
+    Validator("advanced_features.tracker_fsync_interval", default=1.0),
+    Validator("advanced_features.checkpointer", default="memory"),
+    Validator("advanced_features.checkpointer_path", default="checkpoints.sqlite"),
+    Validator("advanced_features.checkpointer_ttl_s", default=604800),
     Validator("advanced_features.lite_mode", default=False),
     Validator("advanced_features.lite_mode_tool_threshold", default=15),
+    Validator("advanced_features.lite_agent_cache_size", default=16),
     Validator("advanced_features.enable_memory", default=False),
     Validator("advanced_features.enable_fact", default=False),
     Validator("advanced_features.decomposition_strategy", default="flexible"),
@@ -133,6 +138,23 @@ validators = [
     Validator("advanced_features.max_input_length", default=50000),
     Validator("advanced_features.e2b_sandbox_mode", default="per-session"),
     Validator("advanced_features.enable_web_search", default=False),
+    Validator("advanced_features.registry_startup_concurrency", default=8),
+    Validator("advanced_features.registry_service_timeout_s", default=60.0),
+    Validator("advanced_features.registry_schema_cache_dir", default="schema_cache"),
+    Validator("advanced_features.registry_schema_cache_ttl_s", default=3600),
+    Validator("advanced_features.registry_client_max_connections", default=100),
+    Validator("advanced_features.registry_client_keepalive_s", default=30.0),
+    Validator("advanced_features.registry_batch_max_concurrency", default=16),
+    Validator("advanced_features.memory_ingest_async", default=True),
+    Validator("advanced_features.memory_ingest_queue_size", default=1000),
+    Validator("advanced_features.memory_ingest_batch_size", default=16),
+    Validator("advanced_features.memory_ingest_max_retries", default=3),
+    Validator("page_understanding.screenshot_format", default="png", is_in=["png", "jpeg", "jpg", "webp"]),
+    Validator("page_understanding.screenshot_quality", default=80, gte=0, lte=100),
+    Validator("page_understanding.screenshot_max_width", default=0, gte=0),
+    Validator("page_understanding.screenshot_max_height", default=0, gte=0),
+    Validator("page_understanding.screenshot_clip_to_viewport", default=True),
+    Validator("page_understanding.screenshot_dedup_distance", default=-1, gte=-1, lte=64),
     Validator("features.chat", default=True),
     Validator("features.memory_provider", default="mem0"),
     Validator("playwright_args", default=[]),
@@ -1,6 +1,9 @@
 import json
 import logging
+import sqlite3
 import threading
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -8,11 +11,24 @@ from typing import Dict, Optional
 
 from .types import Cost, Usage
 
-DEFAULT_LEDGER = Path.home() / ".cuga" / "billing.json"
+DEFAULT_LEDGER = Path.home() / ".cuga" / "billing.sqlite"
 DEFAULT_PRICING = {
     "gpt-4o-mini": {"input": 0.15, "output": 0.6},
     "mistral": {"input": 0.0, "output": 0.0},
 }
+GROUP_COLUMNS = ("day", "run_id", "tenant", "model")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "id INTEGER PRIMARY KEY, ts REAL NOT NULL, day TEXT NOT NULL, run_id TEXT, tenant TEXT, "
+    "model TEXT NOT NULL, is_local INTEGER NOT NULL, prompt_tokens INTEGER NOT NULL, "
+    "completion_tokens INTEGER NOT NULL, cost REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_day ON entries (day)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_run ON entries (run_id)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_tenant ON entries (tenant, day)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_model ON entries (model, day)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+)
 
 
 @dataclass
@@ -20,6 +36,8 @@ class BudgetConfig:
     run_budget_usd: Optional[float] = None
     daily_budget_usd: Optional[float] = None
     enforce: str = "warn"
+    run_id: Optional[str] = None
+    tenant: Optional[str] = None
 
 
 class BudgetExceeded(Exception):
@@ -27,28 +45,87 @@ class BudgetExceeded(Exception):
 
 
 class BudgetManager:
-    _lock = threading.Lock()
+    """Track LLM spend in a SQLite (WAL) ledger shared by all worker processes.
+
+    Every call appends one row tagged with day, run, tenant and model, so writers
+    never rewrite shared state and can run concurrently. Budget checks use in-memory
+    running totals; the daily total is re-read from the ledger at most every
+    ``refresh_interval_s`` seconds to pick up spend from other processes.
+    """
 
     def __init__(
         self,
         config: BudgetConfig,
         ledger_path: Path = DEFAULT_LEDGER,
         pricing: Optional[Dict[str, Dict[str, float]]] = None,
+        refresh_interval_s: float = 1.0,
     ):
         self.config = config
-        self.ledger_path = ledger_path
         self.pricing = pricing or DEFAULT_PRICING
+        self.refresh_interval_s = refresh_interval_s
+        self.run_id = config.run_id or uuid.uuid4().hex
+        # A sibling ``*.json`` file is the pre-SQLite ledger; its daily totals are imported once.
+        self.legacy_path = ledger_path.with_suffix(".json")
+        self.ledger_path = ledger_path.with_suffix(".sqlite")
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
-
-    def _ledger(self) -> Dict[str, float]:
-        if self.ledger_path.exists():
-            with self.ledger_path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        return {}
-
-    def _persist(self, ledger: Dict[str, float]) -> None:
-        with self.ledger_path.open("w", encoding="utf-8") as handle:
-            json.dump(ledger, handle)
+        self._local = threading.local()
+        self._totals_lock = threading.Lock()
+        self._run_total = 0.0
+        self._day = ""
+        self._day_total = 0.0
+        self._day_refreshed = 0.0
+        self._init_schema()
+
+    # -- storage ---------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.ledger_path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self) -> None:
+        conn = self._connection()
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        if self.legacy_path.exists():
+            self._import_legacy(conn)
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        try:
+            with self.legacy_path.open("r", encoding="utf-8") as handle:
+                ledger = json.load(handle)
+        except (OSError, json.JSONDecodeError) as exc:
+            logging.getLogger(__name__).warning(
+                "Ignoring unreadable budget ledger %s: %s", self.legacy_path, exc
+            )
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_import'").fetchone() is None:
+                conn.executemany(
+                    "INSERT INTO entries (ts, day, model, is_local, prompt_tokens, completion_tokens, cost) "
+                    "VALUES (?, ?, 'legacy', 0, 0, 0, ?)",
+                    [(time.time(), day, float(total)) for day, total in ledger.items()],
+                )
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('legacy_import', ?)", (str(self.legacy_path),)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # -- accounting ------------------------------------------------------------------
 
     def _estimate(self, usage: Usage, model: str, is_local: bool) -> Cost:
         prices = (
@@ -61,13 +138,13 @@ class BudgetManager:
             output_cost=(usage.completion_tokens / 1000) * prices.get("output", 0.0),
         )
 
-    def _check(self, incremental: float, today_total: float) -> None:
-        if self.config.run_budget_usd and incremental > self.config.run_budget_usd:
+    def _check(self, run_total: float, today_total: float) -> None:
+        if self.config.run_budget_usd and run_total > self.config.run_budget_usd:
             if self.config.enforce == "block":
                 raise BudgetExceeded("Per-run budget exceeded")
             logging.getLogger(__name__).warning(
                 "Per-run budget exceeded: %.3f > %.3f",
-                incremental,
+                run_total,
                 self.config.run_budget_usd,
             )
 
@@ -80,18 +157,82 @@ class BudgetManager:
                 self.config.daily_budget_usd,
             )
 
-    def record(self, usage: Usage, model: str, is_local: bool) -> Cost:
-        with BudgetManager._lock:
-            cost = self._estimate(usage, model, is_local)
-            ledger = self._ledger()
-            today_key = date.today().isoformat()
-            current_total = ledger.get(today_key, 0.0)
+    def _today_total(self, today: str) -> float:
+        now = time.monotonic()
+        if today != self._day or now - self._day_refreshed >= self.refresh_interval_s:
+            row = self._connection().execute(
+                "SELECT COALESCE(SUM(cost), 0) FROM entries WHERE day = ?", (today,)
+            )
+            total = row.fetchone()[0]
+            with self._totals_lock:
+                self._day, self._day_total, self._day_refreshed = today, total, now
+        return self._day_total
+
+    def record(
+        self,
+        usage: Usage,
+        model: str,
+        is_local: bool,
+        run_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> Cost:
+        cost = self._estimate(usage, model, is_local)
+        today_key = date.today().isoformat()
+        run_id = run_id or self.run_id
+        tenant = tenant or self.config.tenant
+        self._today_total(today_key)
+        with self._totals_lock:
+            run_total = (self._run_total if run_id == self.run_id else 0.0) + cost.total
+            day_total = self._day_total + cost.total
+        self._check(run_total, day_total)
+
+        self._connection().execute(
+            "INSERT INTO entries (ts, day, run_id, tenant, model, is_local, prompt_tokens, completion_tokens, cost) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                time.time(),
+                today_key,
+                run_id,
+                tenant,
+                model,
+                int(is_local),
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                cost.total,
+            ),
+        )
+        with self._totals_lock:
+            if run_id == self.run_id:
+                self._run_total += cost.total
+            if self._day == today_key:
+                self._day_total += cost.total
+        return cost
 
-            self._check(cost.total, current_total + cost.total)
+    # -- queries ---------------------------------------------------------------------
 
-            ledger[today_key] = current_total + cost.total
-            self._persist(ledger)
-            return cost
+    def totals(
+        self,
+        by: str = "day",
+        day: Optional[str] = None,
+        run_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, float]:
+        """Aggregate spend grouped by ``day``, ``run_id``, ``tenant`` or ``model``, optionally filtered."""
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group budget ledger by {by!r}; expected one of {GROUP_COLUMNS}")
+        filters = {"day": day, "run_id": run_id, "tenant": tenant, "model": model}
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection().execute(
+            f"SELECT {by}, SUM(cost) FROM entries {where} GROUP BY {by} ORDER BY {by}", params
+        )
+        return {key: total for key, total in rows}
+
+    def run_total(self) -> float:
+        with self._totals_lock:
+            return self._run_total
 
 
 def budget_from_env(env: Dict[str, str]) -> BudgetConfig:
@@ -101,5 +242,6 @@ def budget_from_env(env: Dict[str, str]) -> BudgetConfig:
         run_budget_usd=float(run_budget) if run_budget else None,
         daily_budget_usd=float(daily_budget) if daily_budget else None,
         enforce=env.get("AGENT_BUDGET_ENFORCE", "warn"),
+        run_id=env.get("AGENT_RUN_ID") or None,
+        tenant=env.get("AGENT_TENANT") or None,
     )
-
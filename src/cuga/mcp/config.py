@@ -14,6 +14,10 @@ class PoolConfig(BaseModel):
     max_active: int = 4
     min_idle: int = 0
     idle_ttl_s: float = 30.0
+    # Autoscaling: add a worker when the least-loaded one has this many calls
+    # outstanding, or when the smoothed call latency exceeds target_latency_ms.
+    scale_up_in_flight: int = 1
+    target_latency_ms: Optional[float] = None
 
 
 class MCPConfig(BaseModel):
@@ -35,6 +39,8 @@ class MCPConfig(BaseModel):
             spec.setdefault("name", alias)
             normalized_tools[alias] = ToolSpec(**spec)
         data["tools"] = normalized_tools
+        pools_data = data.get("pools", {})
+        data["pools"] = {name: PoolConfig(**{"name": name, **pool}) for name, pool in pools_data.items()}
         return cls.model_validate(data)
 
 
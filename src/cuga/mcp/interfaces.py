@@ -60,3 +60,4 @@ class ToolSpec(BaseModel):
     working_dir: Optional[str] = None
     pool: Optional[str] = None
     timeout_s: float = 30.0
+    max_in_flight: int = 8
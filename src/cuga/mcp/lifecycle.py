@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 # REVIEW-FIX: Circuit breaker accounting, allowlist pre-flight, and consistent error handling.
+# Per-alias worker pools with least-loaded dispatch, autoscaling and idle reaping.
 
 import asyncio
 import time
 from collections import defaultdict, deque
 from typing import Dict, Optional, Tuple
 
+from cuga.mcp.config import PoolConfig
 from cuga.mcp.errors import CallTimeout, StartupError, ToolUnavailable
 from cuga.mcp.interfaces import ToolRequest, ToolResponse, ToolSpec
 from cuga.mcp.registry import MCPRegistry
@@ -39,38 +41,205 @@ class CircuitState:
         return True
 
 
+class RunnerPool:
+    """Worker processes serving one tool alias.
+
+    Calls are dispatched to the runner with the fewest outstanding calls. The pool
+    grows (up to ``max_active``) when every runner is busy or latency exceeds the
+    target, and idle runners beyond ``min_idle`` are reaped after ``idle_ttl_s``.
+    """
+
+    _LATENCY_ALPHA = 0.2
+
+    def __init__(self, spec: ToolSpec, config: PoolConfig) -> None:
+        self.spec = spec
+        self.config = config
+        self.runners: deque[SubprocessStdioRunner] = deque()
+        self.active: Dict[int, int] = {}
+        self.last_used: Dict[int, float] = {}
+        self.latency_ms: Optional[float] = None
+        self.lock = asyncio.Lock()
+        self.spawning = False
+
+    def __len__(self) -> int:
+        return len(self.runners)
+
+    def prune(self) -> None:
+        for runner in [r for r in self.runners if not r.is_healthy()]:
+            self.discard(runner)
+
+    def discard(self, runner: SubprocessStdioRunner) -> None:
+        try:
+            self.runners.remove(runner)
+        except ValueError:
+            pass
+        self.active.pop(id(runner), None)
+        self.last_used.pop(id(runner), None)
+
+    def add(self, runner: SubprocessStdioRunner) -> None:
+        self.runners.append(runner)
+        self.active[id(runner)] = 0
+        self.last_used[id(runner)] = time.monotonic()
+
+    def least_loaded(self) -> Optional[SubprocessStdioRunner]:
+        if not self.runners:
+            return None
+        return min(self.runners, key=lambda r: self.active.get(id(r), 0))
+
+    def should_scale_up(self, runner: SubprocessStdioRunner) -> bool:
+        if len(self.runners) >= max(self.config.max_active, 1) or self.spawning:
+            return False
+        if self.active.get(id(runner), 0) >= max(self.config.scale_up_in_flight, 1):
+            return True
+        target = self.config.target_latency_ms
+        return bool(target and self.latency_ms is not None and self.latency_ms > target)
+
+    def acquire(self, runner: SubprocessStdioRunner) -> None:
+        self.active[id(runner)] = self.active.get(id(runner), 0) + 1
+        self.last_used[id(runner)] = time.monotonic()
+
+    def release(self, runner: SubprocessStdioRunner, latency_ms: Optional[float] = None) -> None:
+        if id(runner) in self.active:
+            self.active[id(runner)] = max(self.active[id(runner)] - 1, 0)
+            self.last_used[id(runner)] = time.monotonic()
+        if latency_ms is not None:
+            if self.latency_ms is None:
+                self.latency_ms = latency_ms
+            else:
+                self.latency_ms += self._LATENCY_ALPHA * (latency_ms - self.latency_ms)
+
+    def idle_runners(self, now: float) -> list[SubprocessStdioRunner]:
+        surplus = len(self.runners) - self.config.min_idle
+        if surplus <= 0:
+            return []
+        idle = [
+            r
+            for r in self.runners
+            if self.active.get(id(r), 0) == 0
+            and now - self.last_used.get(id(r), now) >= self.config.idle_ttl_s
+        ]
+        idle.sort(key=lambda r: self.last_used.get(id(r), now))
+        return idle[:surplus]
+
+
 class LifecycleManager:
     def __init__(self, registry: Optional[MCPRegistry] = None) -> None:
         self.registry = registry or MCPRegistry()
-        self.runners: Dict[Tuple[str, str], SubprocessStdioRunner] = {}
+        self.pools: Dict[Tuple[str, str], RunnerPool] = {}
         self.circuits: Dict[str, CircuitState] = defaultdict(CircuitState)
-        self.pool: Dict[str, deque[SubprocessStdioRunner]] = defaultdict(deque)
+        self._reaper: Optional[asyncio.Task] = None
+        self._background: set[asyncio.Task] = set()
 
     def _runner_key(self, spec: ToolSpec) -> Tuple[str, str]:
         return (spec.alias, spec.transport)
 
-    async def ensure_runner(self, spec: ToolSpec) -> SubprocessStdioRunner:
+    def _pool_config(self, spec: ToolSpec) -> PoolConfig:
+        pools = self.registry.config.pools
+        if spec.pool:
+            if spec.pool not in pools:
+                raise ToolUnavailable(f"Unknown MCP pool: {spec.pool}")
+            return pools[spec.pool]
+        # Tools without a pool keep the historical single, long-lived process: never reaped when idle.
+        return PoolConfig(name=spec.alias, max_active=1, min_idle=1)
+
+    def _pool_for(self, spec: ToolSpec) -> RunnerPool:
         key = self._runner_key(spec)
-        if spec.transport != "stdio":
-            raise ToolUnavailable(f"Unsupported transport: {spec.transport}")
-        if key in self.runners and self.runners[key].is_healthy():
-            return self.runners[key]
-        runner = SubprocessStdioRunner(
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = RunnerPool(spec, self._pool_config(spec))
+            self.pools[key] = pool
+        return pool
+
+    def _spawn_runner(self, spec: ToolSpec) -> SubprocessStdioRunner:
+        return SubprocessStdioRunner(
             command=spec.command or "python",
             args=spec.args,
             env=spec.env,
             working_dir=spec.working_dir,
             allowed_commands=self.registry.config.allow_commands,
+            max_in_flight=spec.max_in_flight,
         )
+
+    async def _grow(self, pool: RunnerPool) -> SubprocessStdioRunner:
+        runner = self._spawn_runner(pool.spec)
         await runner.start()
-        self.runners[key] = runner
+        pool.add(runner)
+        LOGGER.info(
+            "MCP pool scaled up",
+            extra={"alias": pool.spec.alias, "pool": pool.config.name, "size": len(pool)},
+        )
+        return runner
+
+    async def _grow_in_background(self, pool: RunnerPool) -> None:
+        pool.spawning = True
+        try:
+            await self._grow(pool)
+        except Exception as exc:  # noqa: BLE001 - the existing workers keep serving
+            LOGGER.warning("MCP pool scale-up failed", extra={"alias": pool.spec.alias, "error": str(exc)})
+        finally:
+            pool.spawning = False
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        while True:
+            ttls = [pool.config.idle_ttl_s for pool in self.pools.values() if pool.config.idle_ttl_s > 0]
+            await asyncio.sleep(max(min(ttls, default=30.0) / 2, 0.05))
+            await self.reap_idle()
+
+    async def reap_idle(self, now: Optional[float] = None) -> int:
+        """Stop runners that have been idle for longer than their pool's ``idle_ttl_s``."""
+        now = time.monotonic() if now is None else now
+        reaped = []
+        for pool in self.pools.values():
+            pool.prune()
+            for runner in pool.idle_runners(now):
+                pool.discard(runner)
+                reaped.append(runner)
+        if reaped:
+            await asyncio.gather(*(runner.stop() for runner in reaped), return_exceptions=True)
+            LOGGER.info("Reaped idle MCP runners", extra={"count": len(reaped)})
+        return len(reaped)
+
+    async def prewarm(self, aliases: Optional[list[str]] = None) -> None:
+        """Start ``min_idle`` runners (at least one) for each tool before the first call."""
+        specs = [self.registry.get(alias) for alias in aliases] if aliases else self.registry.list()
+
+        async def _warm(spec: ToolSpec) -> None:
+            pool = self._pool_for(spec)
+            async with pool.lock:
+                pool.prune()
+                while len(pool) < max(pool.config.min_idle, 1):
+                    await self._grow(pool)
+
+        await asyncio.gather(*(_warm(spec) for spec in specs if spec.transport == "stdio"))
+        self._ensure_reaper()
+
+    async def ensure_runner(self, spec: ToolSpec) -> SubprocessStdioRunner:
+        if spec.transport != "stdio":
+            raise ToolUnavailable(f"Unsupported transport: {spec.transport}")
+        pool = self._pool_for(spec)
+        self._ensure_reaper()
+        pool.prune()
+        runner = pool.least_loaded()
+        if runner is None:
+            async with pool.lock:
+                pool.prune()
+                runner = pool.least_loaded() or await self._grow(pool)
+        elif pool.should_scale_up(runner):
+            # Serve this call on the existing worker while a new one boots.
+            pool.spawning = True
+            task = asyncio.create_task(self._grow_in_background(pool))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
         return runner
 
     async def stop_runner(self, alias: str, transport: str = "stdio") -> None:
-        key = (alias, transport)
-        runner = self.runners.pop(key, None)
-        if runner:
-            await runner.stop()
+        pool = self.pools.pop((alias, transport), None)
+        if pool:
+            await asyncio.gather(*(runner.stop() for runner in list(pool.runners)))
 
     async def call(self, alias: str, request: ToolRequest) -> ToolResponse:
         spec = self.registry.get(alias)
@@ -88,10 +257,15 @@ class LifecycleManager:
             circuit.record_failure()
             metrics.counter("mcp.errors", {"kind": "startup"}).inc()
             return ToolResponse(ok=False, error=str(exc), metrics={"transport": spec.transport})
-        stop_timer = metrics.time_block("mcp.latency_ms")
+        pool = self._pool_for(spec)
+        pool.acquire(runner)
+        latency_ms: Optional[float] = None
+        started = time.perf_counter()
+        stop_timer = metrics.time_block("mcp.latency_ms", {"alias": alias})
         try:
             payload = {"method": request.method, "params": request.params}
             raw = await runner.call_with_retry(payload, timeout=request.timeout_s or spec.timeout_s)
+            latency_ms = (time.perf_counter() - started) * 1000
             circuit.record_success()
             return ToolResponse(ok=True, result=raw.get("result"), metrics={"transport": spec.transport})
         except CallTimeout as exc:
@@ -112,9 +286,15 @@ class LifecycleManager:
             LOGGER.exception("Unexpected MCP failure", extra={"alias": alias})
             return ToolResponse(ok=False, error="unexpected error", metrics={"transport": spec.transport})
         finally:
+            pool.release(runner, latency_ms)
             stop_timer()
 
     async def stop_all(self) -> None:
-        await asyncio.gather(*(runner.stop() for runner in list(self.runners.values())))
-        self.runners.clear()
-
+        tasks = [task for task in (self._reaper, *self._background) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._reaper = None
+        runners = [runner for pool in self.pools.values() for runner in pool.runners]
+        await asyncio.gather(*(runner.stop() for runner in runners))
+        self.pools.clear()
@@ -3,11 +3,13 @@ from __future__ import annotations
 # REVIEW-FIX: Subprocess taxonomy, allowlist, retries, and cross-platform safety.
 
 import asyncio
+import itertools
 import json
 import os
 import random
 import signal
 from asyncio.subprocess import Process
+from collections import OrderedDict
 from collections.abc import Iterable
 from typing import List, Optional
 
@@ -56,6 +58,16 @@ def _command_is_allowed(command: str, allowlist: Optional[Iterable[str]]) -> boo
 
 
 class SubprocessStdioRunner(Runner):
+    """Run an MCP server over newline-delimited JSON on stdio.
+
+    Requests are tagged with a JSON-RPC style ``id`` and many may be in flight at
+    once (bounded by ``max_in_flight``). A single reader task owns ``stdout`` and
+    resolves the future of the request whose ``id`` the response echoes; servers
+    that do not echo ids are answered in request order. Whether ids are echoed is
+    learned from the health handshake. Cancelling a caller (or hitting its timeout)
+    frees its slot and the late response is dropped.
+    """
+
     def __init__(
         self,
         command: str,
@@ -65,7 +77,10 @@ class SubprocessStdioRunner(Runner):
         startup_timeout: float = 10.0,
         max_restarts: int = 2,
         allowed_commands: Optional[Iterable[str]] = None,
+        max_in_flight: int = 8,
     ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
         self.command = command
         self.args = args or []
         self.env = env or {}
@@ -74,8 +89,15 @@ class SubprocessStdioRunner(Runner):
         self.max_restarts = max_restarts
         self.allowed_commands = list(allowed_commands) if allowed_commands is not None else None
         self.process: Optional[Process] = None
+        self.max_in_flight = max_in_flight
         self.restarts = 0
         self._ready = False
+        self._ids = itertools.count(1)
+        self._pending: "OrderedDict[int, asyncio.Future]" = OrderedDict()
+        self._echoes_ids: Optional[bool] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
 
     async def start(self) -> None:
         if not _command_is_allowed(self.command, self.allowed_commands):
@@ -111,7 +133,7 @@ class SubprocessStdioRunner(Runner):
             raise StartupError("Process failed to start")
         if not self.process.stdin or not self.process.stdout:
             raise StartupError("Missing stdio pipes")
-        handshake = json.dumps({"method": "health", "params": {}}) + "\n"
+        handshake = json.dumps({"method": "health", "params": {}, "id": 0}) + "\n"
         self.process.stdin.write(handshake.encode("utf-8"))
         await self.process.stdin.drain()
         try:
@@ -121,14 +143,17 @@ class SubprocessStdioRunner(Runner):
         if not raw:
             raise StartupError("EOF before handshake")
         try:
-            json.loads(raw.decode("utf-8"))
+            response = json.loads(raw.decode("utf-8"))
         except Exception as exc:  # noqa: BLE001
             raise StartupError("Invalid JSON from MCP server") from exc
+        # Learn the id mode before any request can time out and leave its late response unmatched.
+        self._echoes_ids = isinstance(response, dict) and response.get("id") == 0
         self._ready = True
 
     async def stop(self) -> None:
         if not self.process:
             return
+        await self._stop_reader()
         if self.process.returncode is None:
             self.process.send_signal(signal.SIGTERM)
             try:
@@ -141,24 +166,107 @@ class SubprocessStdioRunner(Runner):
     def is_healthy(self) -> bool:
         return bool(self.process and self.process.returncode is None)
 
+    @property
+    def in_flight(self) -> int:
+        return sum(1 for future in self._pending.values() if not future.done())
+
+    def _ensure_reader(self) -> None:
+        # Started lazily so it binds to the caller's event loop, after the handshake.
+        if self._reader is None or self._reader.done():
+            self._pending.clear()
+            self._write_lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._reader = asyncio.create_task(self._read_loop())
+
+    async def _stop_reader(self) -> None:
+        reader, self._reader = self._reader, None
+        if reader is not None and not reader.done():
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
+        self._fail_pending(StartupError("Process stopped"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        pending, self._pending = self._pending, OrderedDict()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    def _resolve(
+        self, request_id: Optional[int], result: Optional[dict], exc: Optional[Exception] = None
+    ) -> None:
+        if request_id is not None and request_id in self._pending:
+            future = self._pending.pop(request_id)
+        elif request_id is None and self._pending:
+            # Server does not echo ids: responses arrive in request order.
+            _, future = self._pending.popitem(last=False)
+        else:
+            LOGGER.debug("Dropping MCP response for unknown request", extra={"id": request_id})
+            return
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    async def _read_loop(self) -> None:
+        assert self.process and self.process.stdout
+        stdout = self.process.stdout
+        try:
+            while True:
+                raw = await stdout.readline()
+                if not raw:
+                    self._fail_pending(StartupError("EOF before handshake"))
+                    return
+                try:
+                    response = json.loads(raw.decode("utf-8"))
+                except Exception:  # noqa: BLE001
+                    self._resolve(None, None, StartupError("Invalid JSON from MCP server"))
+                    continue
+                request_id = response.get("id") if isinstance(response, dict) else None
+                if self._echoes_ids is None:
+                    self._echoes_ids = request_id is not None
+                self._resolve(request_id, response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001 - surface pipe failures to every waiter
+            self._fail_pending(StartupError(f"MCP reader failed: {exc}"))
+
+    async def _exchange(self, payload: dict) -> dict:
+        assert self.process and self.process.stdin and self._slots and self._write_lock
+        async with self._slots:
+            request_id = next(self._ids)
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            sent = False
+            try:
+                message = json.dumps({**payload, "id": request_id}) + "\n"
+                async with self._write_lock:
+                    self.process.stdin.write(message.encode("utf-8"))
+                    sent = True
+                    await self.process.stdin.drain()
+                return await future
+            finally:
+                # Unless the server is known to echo ids, a sent request keeps its (done) entry
+                # queued so its late response is absorbed in order instead of resolving the next one.
+                if not sent or self._echoes_ids is True:
+                    self._pending.pop(request_id, None)
+
     async def request(self, payload: dict, timeout: float) -> dict:
         if not self.process or self.process.returncode is not None:
             raise StartupError("Process not running")
         if not self.process.stdin or not self.process.stdout:
             raise StartupError("Process missing stdio")
-        message = json.dumps(payload) + "\n"
-        self.process.stdin.write(message.encode("utf-8"))
-        await self.process.stdin.drain()
+        self._ensure_reader()
         try:
-            raw = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
+            return await asyncio.wait_for(self._exchange(payload), timeout=timeout)
         except asyncio.TimeoutError as exc:
             raise CallTimeout("MCP call timed out") from exc
-        if not raw:
-            raise StartupError("EOF before handshake")
-        try:
-            return json.loads(raw.decode("utf-8"))
-        except Exception as exc:  # noqa: BLE001
-            raise StartupError("Invalid JSON from MCP server") from exc
+        except (BrokenPipeError, ConnectionResetError) as exc:
+            raise StartupError("Process not running") from exc
 
     async def call_with_retry(self, payload: dict, timeout: float, attempts: int = 3) -> dict:
         last_error: Exception | None = None
@@ -1,51 +1,179 @@
 from __future__ import annotations
 
+import bisect
+import math
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def exponential_buckets(start: float, factor: float, count: int) -> Tuple[float, ...]:
+    return tuple(start * factor**i for i in range(count))
+
+
+# 0.1 ms .. ~17 min in steps of 2**0.25 (~19%), so interpolated percentiles stay within ~10%.
+DEFAULT_BUCKETS = exponential_buckets(0.1, 2**0.25, 93)
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((labels or {}).items()))
 
 
 @dataclass
 class Counter:
     name: str
     count: int = 0
+    labels: LabelKey = ()
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def inc(self, value: int = 1) -> None:
-        self.count += value
+        with self._lock:
+            self.count += value
 
 
 @dataclass
 class Histogram:
+    """Fixed-bucket streaming histogram: memory is bounded by the bucket count, not samples."""
+
     name: str
-    values: list[float] = field(default_factory=list)
+    labels: LabelKey = ()
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.buckets = tuple(sorted(self.buckets))
+        # One extra slot for samples above the last bound (+Inf).
+        self.counts = [0] * (len(self.buckets) + 1)
 
     def observe(self, value: float) -> None:
-        self.values.append(value)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` quantile (0..1) by interpolating inside the matching bucket."""
+        with self._lock:
+            if self.count == 0:
+                return None
+            counts = list(self.counts)
+            count, low, high = self.count, self.min, self.max
+        rank = min(max(q, 0.0), 1.0) * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count == 0:
+                continue
+            if seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else low
+                upper = self.buckets[index] if index < len(self.buckets) else high
+                lower, upper = max(lower, low), min(upper, high)
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, low), high)
+            seen += bucket_count
+        return high
+
+    def percentiles(self, quantiles: Iterable[float] = (0.5, 0.95, 0.99)) -> Dict[str, Optional[float]]:
+        return {f"p{round(q * 100):g}": self.percentile(q) for q in quantiles}
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            count, total = self.count, self.total
+        return {"count": count, "sum": total, **self.percentiles()}
 
 
 class Metrics:
     def __init__(self) -> None:
-        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Counter] = {}
-        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[Tuple[str, LabelKey], Counter] = {}
+        self.histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+        self._lock = threading.Lock()
 
     def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
-        key = (name, tuple(sorted((labels or {}).items())))
-        if key not in self.counters:
-            self.counters[key] = Counter(name)
-        return self.counters[key]
-
-    def histogram(self, name: str) -> Histogram:
-        if name not in self.histograms:
-            self.histograms[name] = Histogram(name)
-        return self.histograms[name]
-
-    def time_block(self, name: str):
+        key = (name, _label_key(labels))
+        counter = self.counters.get(key)
+        if counter is None:
+            with self._lock:
+                counter = self.counters.setdefault(key, Counter(name, labels=key[1]))
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        key = (name, _label_key(labels))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = Histogram(name, labels=key[1], buckets=buckets or DEFAULT_BUCKETS)
+                    self.histograms[key] = histogram
+        return histogram
+
+    def time_block(self, name: str, labels: Optional[Dict[str, str]] = None):
         start = time.perf_counter()
 
         def _done() -> None:
-            self.histogram(name).observe((time.perf_counter() - start) * 1000)
+            self.histogram(name, labels).observe((time.perf_counter() - start) * 1000)
 
         return _done
 
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            counters = sorted(self.counters.values(), key=lambda c: (c.name, c.labels))
+            histograms = sorted(self.histograms.values(), key=lambda h: (h.name, h.labels))
+        typed: set[str] = set()
+        for counter in counters:
+            metric = _metric_name(counter.name) + "_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_format_labels(counter.labels)} {counter.count}")
+        for histogram in histograms:
+            metric = _metric_name(histogram.name)
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            with histogram._lock:
+                counts, count, total = list(histogram.counts), histogram.count, histogram.total
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(histogram.labels + (("le", f"{bound:.6g}"),))
+                lines.append(f"{metric}_bucket{labels} {cumulative}")
+            lines.append(f"{metric}_bucket{_format_labels(histogram.labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{metric}_sum{_format_labels(histogram.labels)} {total}")
+            lines.append(f"{metric}_count{_format_labels(histogram.labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _metric_name(name: str) -> str:
+    cleaned = "".join(ch if ch.isalnum() or ch in "_:" else "_" for ch in name)
+    return cleaned if not cleaned[:1].isdigit() else f"_{cleaned}"
+
+
+def _format_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
 
 metrics = Metrics()
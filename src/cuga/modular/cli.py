@@ -12,17 +12,26 @@ from .agents import CoordinatorAgent, PlannerAgent, WorkerAgent, build_default_r
 from .config import AgentConfig
 from .memory import VectorMemory
 from .rag import RagLoader, RagRetriever
+from .types import MemoryRecord
 
 logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 LOGGER = logging.getLogger(__name__)
 
 
+def _read_records(state_path: Path) -> List[MemoryRecord]:
+    if not state_path.exists():
+        return []
+    data = json.loads(state_path.read_text())
+    return [
+        MemoryRecord(text=record["text"], metadata=record.get("metadata") or {})
+        for record in data.get("records", [])
+    ]
+
+
 def _load_memory(state_path: Path, backend: str, profile: str) -> VectorMemory:
     memory = VectorMemory(backend_name=backend, profile=profile)
-    if state_path.exists():
-        data = json.loads(state_path.read_text())
-        for record in data.get("records", []):
-            memory.remember(record["text"], metadata=record.get("metadata"))
+    for record in _read_records(state_path):
+        memory.remember(record.text, metadata=record.metadata)
     return memory
 
 
@@ -31,10 +40,30 @@ def _persist_memory(memory: VectorMemory, state_path: Path) -> None:
     state_path.write_text(json.dumps(state, indent=2))
 
 
+def _expand_paths(paths: List[str]) -> List[Path]:
+    expanded: List[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        expanded.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+    return expanded
+
+
 def handle_ingest(args: argparse.Namespace) -> None:
     state_path = Path(args.state)
-    loader = RagLoader(backend=args.backend, profile=args.profile)
-    added = loader.ingest(Path(p) for p in args.paths)
+    loader = RagLoader(
+        backend=args.backend,
+        profile=args.profile,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        manifest_path=Path(args.manifest) if args.manifest else None,
+    )
+    if args.manifest:
+        # Incremental runs only add new/changed files, so keep what earlier runs stored. The records
+        # are restored locally without re-embedding; the loader only needs them to persist the state.
+        loader.memory.restore(_read_records(state_path))
+    added = loader.ingest(_expand_paths(args.paths))
     _persist_memory(loader.memory, state_path)
     LOGGER.info(json.dumps({"event": "ingest", "added": added, "trace_id": args.trace_id}))
 
@@ -70,7 +99,12 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     ingest = subparsers.add_parser("ingest", help="ingest files")
-    ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("paths", nargs="+", help="files or directories (searched recursively)")
+    ingest.add_argument("--chunk-size", dest="chunk_size", type=int, default=200, help="words per chunk")
+    ingest.add_argument("--chunk-overlap", dest="chunk_overlap", type=int, default=40)
+    ingest.add_argument("--batch-size", dest="batch_size", type=int, default=64)
+    ingest.add_argument("--workers", type=int, default=1, help="processes used to read/chunk/embed")
+    ingest.add_argument("--manifest", default=None, help="content-hash manifest for incremental ingest")
     ingest.set_defaults(func=handle_ingest)
 
     query = subparsers.add_parser("query", help="query memory")
@@ -1,22 +1,58 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Final
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final, Sequence
 
 _DIM: Final = 64
+_TOKEN_CACHE_SIZE: Final = 65536
 
 
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def _token_hash(token: str) -> int:
+    # Little-endian keeps ``hash % dim`` equal to ``digest[0] % dim`` for any dim dividing 256,
+    # so vectors for the default dimension are unchanged from the original byte-based scheme.
+    return int.from_bytes(hashlib.sha256(token.encode("utf-8")).digest()[:8], "little")
+
+
+@dataclass
 class HashingEmbedder:
-    """Deterministic offline embedder using hashing."""
+    """Deterministic offline embedder using hashing.
+
+    Token hashes are memoized, so repeated vocabulary costs one SHA-256 per
+    distinct token. ``embed_many`` builds a whole batch as a single float32
+    matrix with NumPy.
+    """
+
+    dim: int = _DIM
+
+    def __post_init__(self) -> None:
+        if self.dim <= 0:
+            raise ValueError("dim must be positive")
 
     def embed(self, text: str) -> list[float]:
-        tokens = text.lower().split()
-        vector = [0.0 for _ in range(_DIM)]
-        for token in tokens:
-            digest = hashlib.sha256(token.encode("utf-8")).digest()
-            idx = digest[0] % _DIM
-            vector[idx] += 1.0
+        vector = [0.0] * self.dim
+        for token in text.lower().split():
+            vector[_token_hash(token) % self.dim] += 1.0
         norm = sum(v * v for v in vector) ** 0.5
         if norm > 0:
             vector = [v / norm for v in vector]
         return vector
+
+    def embed_many(self, texts: Sequence[str]):
+        """Embed ``texts`` into a C-contiguous ``(len(texts), dim)`` float32 array."""
+        np = importlib.import_module("numpy")
+        rows: list[int] = []
+        cols: list[int] = []
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                rows.append(row)
+                cols.append(_token_hash(token) % self.dim)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if rows:
+            np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1.0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
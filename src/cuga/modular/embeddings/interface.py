@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, Sequence
 
 
 class Embedder(Protocol):
     def embed(self, text: str) -> list[float]:
         ...
+
+    def embed_many(self, texts: Sequence[str]):
+        """Return a contiguous float32 ``numpy.ndarray`` of shape ``(len(texts), dim)``."""
+        ...
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .embeddings.interface import Embedder
+
+LOGGER = logging.getLogger(__name__)
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def iter_chunks(path: Path, chunk_size: int, overlap: int) -> Iterator[str]:
+    """Stream ``path`` line by line and yield word windows of ``chunk_size`` words.
+
+    Consecutive chunks share ``overlap`` words. Only the current window is held in
+    memory, so arbitrarily large files can be chunked.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if not 0 <= overlap < chunk_size:
+        raise ValueError("overlap must be in [0, chunk_size)")
+    window: List[str] = []
+    emitted_up_to = 0
+    with path.open("r", encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            window.extend(line.split())
+            while len(window) >= chunk_size:
+                yield " ".join(window[:chunk_size])
+                window = window[chunk_size - overlap :]
+                emitted_up_to = overlap
+    if len(window) > emitted_up_to:
+        yield " ".join(window)
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class FileChunks:
+    path: str
+    digest: str
+    chunks: List[str]
+    embeddings: Optional[object] = None
+
+
+def process_file(
+    path: str, digest: str, chunk_size: int, overlap: int, embedder: Optional[Embedder]
+) -> FileChunks:
+    """Chunk (and optionally embed) one file. Runs inside pool workers, so it must stay picklable."""
+    chunks = list(iter_chunks(Path(path), chunk_size, overlap))
+    embeddings = embedder.embed_many(chunks) if embedder is not None and chunks else None
+    return FileChunks(path=path, digest=digest, chunks=chunks, embeddings=embeddings)
+
+
+@dataclass
+class IngestManifest:
+    """Content-hash manifest recording which files have already been ingested.
+
+    Entries keep ``size``/``mtime_ns`` so unchanged files are skipped without being
+    re-hashed; a changed stat triggers a hash comparison.
+    """
+
+    path: Optional[Path] = None
+    files: Dict[str, Dict[str, object]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "IngestManifest":
+        if path is None or not path.exists():
+            return cls(path=path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            LOGGER.warning("Ignoring unreadable ingest manifest %s: %s", path, exc)
+            return cls(path=path)
+        return cls(path=path, files=dict(data.get("files", {})))
+
+    def changed_digest(self, file_path: Path) -> Optional[str]:
+        """Return the new content hash if ``file_path`` needs ingesting, else ``None``."""
+        key = str(file_path)
+        stat = file_path.stat()
+        entry = self.files.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return None
+        digest = file_digest(file_path)
+        if entry and entry.get("sha256") == digest:
+            entry.update({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+            return None
+        return digest
+
+    def is_known(self, file_path: Path) -> bool:
+        return str(file_path) in self.files
+
+    def prune_missing(self) -> List[str]:
+        """Drop entries for files that no longer exist and return their paths."""
+        missing = [key for key in self.files if not Path(key).is_file()]
+        for key in missing:
+            del self.files[key]
+        return missing
+
+    def record(self, file_path: Path, digest: str) -> None:
+        stat = file_path.stat()
+        self.files[str(file_path)] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"version": 1, "files": self.files}, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
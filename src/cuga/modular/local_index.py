@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class InvertedIndex:
+    """In-process BM25 index over whole-word tokens.
+
+    Documents are tokenized once when added. Each term maps to a posting list of
+    ``doc_id -> term frequency`` so a query only touches documents sharing at
+    least one term with it, and the top-k is selected with a heap instead of a
+    full sort.
+    """
+
+    k1: float = 1.5
+    b: float = 0.75
+    postings: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    doc_lengths: Dict[int, int] = field(default_factory=dict)
+    doc_terms: Dict[int, Tuple[str, ...]] = field(default_factory=dict)
+    total_length: int = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        self.doc_lengths[doc_id] = len(tokens)
+        self.doc_terms[doc_id] = tuple(counts)
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id: int) -> bool:
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        return True
+
+    def search(
+        self,
+        query: str,
+        top_k: int,
+        predicate: Optional[Callable[[int], bool]] = None,
+    ) -> List[Tuple[int, float]]:
+        """Return up to ``top_k`` ``(doc_id, score)`` pairs, best first."""
+        doc_count = len(self.doc_lengths)
+        if top_k <= 0 or doc_count == 0:
+            return []
+        query_terms = set(tokenize(query))
+        avg_length = self.total_length / doc_count or 1.0
+        scores: Dict[int, float] = {}
+        for term in query_terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in posting.items():
+                norm = self.k1 * (1.0 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+        candidates = scores.items()
+        if predicate is not None:
+            candidates = [(doc_id, score) for doc_id, score in candidates if predicate(doc_id)]
+        return heapq.nlargest(top_k, candidates, key=lambda item: item[1])
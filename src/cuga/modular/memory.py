@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from .embeddings.interface import Embedder
 from .embeddings.hashing import HashingEmbedder
+from .local_index import InvertedIndex
 from .types import MemoryRecord
 from .vector_backends.base import EmbeddedRecord, SearchHit, VectorBackend
 from .vector_backends.chroma_backend import ChromaBackend
@@ -29,7 +29,22 @@ class VectorMemory:
     backend_name: str = "local"
     embedder: Embedder = field(default_factory=HashingEmbedder)
     backend: Optional[VectorBackend] = None
+    backend_options: Dict[str, object] = field(default_factory=dict)
     store: List[MemoryRecord] = field(default_factory=list)
+    index: InvertedIndex = field(default_factory=InvertedIndex, repr=False)
+    _records: Dict[int, MemoryRecord] = field(default_factory=dict, init=False, repr=False)
+    _next_id: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for record in self.store:
+            self._index_record(record)
+
+    def _index_record(self, record: MemoryRecord) -> int:
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = record
+        self.index.add(record_id, record.text)
+        return record_id
 
     def connect_backend(self) -> None:
         if self.backend_name == "local":
@@ -39,7 +54,7 @@ class VectorMemory:
         if backend_cls is None:
             raise RuntimeError(f"Unsupported backend {self.backend_name}")
         try:
-            backend = backend_cls()
+            backend = backend_cls(**self.backend_options)
             backend.connect()
         except ImportError as exc:  # pragma: no cover - defensive
             raise RuntimeError(
@@ -48,42 +63,98 @@ class VectorMemory:
         self.backend = backend
         LOGGER.info("Connected vector backend", extra={"backend": self.backend_name, "profile": self.profile})
 
-    def remember(self, text: str, metadata: Optional[Dict[str, str]] = None) -> None:
+    def remember(self, text: str, metadata: Optional[Dict[str, str]] = None) -> int:
         merged_metadata = {"profile": self.profile}
         if metadata:
             merged_metadata.update(metadata)
         record = MemoryRecord(text=text, metadata=merged_metadata)
         self.store.append(record)
+        record_id = self._index_record(record)
         if self.backend_name != "local":
             if self.backend is None:
                 self.connect_backend()
             if self.backend is None:
-                return
+                return record_id
             embedding = self.embedder.embed(text)
             self.backend.upsert([EmbeddedRecord(embedding=embedding, record=record)])
+        return record_id
+
+    def remember_many(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Optional[Dict[str, str]]]] = None,
+        embeddings=None,
+    ) -> List[int]:
+        """Batch variant of ``remember``: one ``embed_many`` call and one backend upsert.
+
+        ``embeddings`` may carry a precomputed ``(len(texts), dim)`` array, e.g. from
+        ingestion workers, in which case the embedder is not called.
+        """
+        metadatas = metadatas or [None] * len(texts)
+        records: List[MemoryRecord] = []
+        for text, metadata in zip(texts, metadatas):
+            merged_metadata = {"profile": self.profile}
+            if metadata:
+                merged_metadata.update(metadata)
+            records.append(MemoryRecord(text=text, metadata=merged_metadata))
+        self.store.extend(records)
+        record_ids = [self._index_record(record) for record in records]
+        if self.backend_name != "local" and records:
+            if self.backend is None:
+                self.connect_backend()
+            if self.backend is None:
+                return record_ids
+            if embeddings is None:
+                embeddings = self.embedder.embed_many([record.text for record in records])
+            self.backend.upsert_many(embeddings, records)
+        return record_ids
 
-    def search(self, query: str, top_k: int = 3) -> List[SearchHit]:
+    def restore(self, records: List[MemoryRecord]) -> List[int]:
+        """Reload previously persisted records into the local store and index.
+
+        Unlike ``remember_many`` nothing is embedded or sent to the backend, so callers that only
+        need the local view (e.g. incremental ingest) don't pay for re-embedding the whole corpus.
+        """
+        self.store.extend(records)
+        return [self._index_record(record) for record in records]
+
+    def forget(self, record_id: int) -> bool:
+        """Drop a record returned by ``remember`` from the local store and index."""
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return False
+        self.index.remove(record_id)
+        self.store.remove(record)
+        return True
+
+    def forget_where(self, key: str, value: str) -> int:
+        """Drop every local record whose ``metadata[key]`` equals ``value``; returns the count."""
+        matching = [
+            record_id for record_id, record in self._records.items() if record.metadata.get(key) == value
+        ]
+        for record_id in matching:
+            self.forget(record_id)
+        if self.backend is not None:
+            self.backend.delete_where(key, value)
+        return len(matching)
+
+    def persist(self) -> None:
+        """Flush a persistent backend (e.g. an on-disk FAISS index) to storage."""
+        if self.backend is not None and hasattr(self.backend, "save") and getattr(self.backend, "path", None):
+            self.backend.save()
+
+    def search(self, query: str, top_k: int = 3, profile: Optional[str] = None) -> List[SearchHit]:
         if self.backend is not None:
             query_vector = self.embedder.embed(query)
             return self.backend.search(query_vector, top_k)
-        return self._local_search(query, top_k)
+        return self._local_search(query, top_k, profile=profile)
 
-    def _local_search(self, query: str, top_k: int) -> List[SearchHit]:
-        query_terms = self._normalize_words(query)
-        if not query_terms:
-            return []
-        scored: List[SearchHit] = []
-        for record in self.store:
-            record_terms = self._normalize_words(record.text)
-            overlap = len(query_terms & record_terms)
-            if overlap == 0:
-                continue
-            score = overlap / max(len(query_terms), 1)
-            scored.append(SearchHit(text=record.text, metadata=record.metadata, score=float(score)))
-        scored.sort(key=lambda hit: hit.score, reverse=True)
-        return scored[:top_k]
-
-    @staticmethod
-    def _normalize_words(text: str) -> set[str]:
-        tokens = re.findall(r"[a-z0-9]+", text.lower())
-        return set(tokens)
+    def _local_search(self, query: str, top_k: int, profile: Optional[str] = None) -> List[SearchHit]:
+        predicate = None
+        if profile is not None:
+            predicate = lambda record_id: self._records[record_id].metadata.get("profile") == profile  # noqa: E731
+        hits: List[SearchHit] = []
+        for record_id, score in self.index.search(query, top_k, predicate=predicate):
+            record = self._records[record_id]
+            hits.append(SearchHit(text=record.text, metadata=record.metadata, score=float(score)))
+        return hits
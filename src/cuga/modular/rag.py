@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import logging
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Deque, Iterable, Iterator, List, Optional
 
+from .ingest import FileChunks, IngestManifest, process_file
 from .memory import VectorMemory
 from .vector_backends.base import SearchHit
 
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass
 class RagDocument:
@@ -22,19 +28,114 @@ class RagHit:
 
 
 class RagLoader:
-    def __init__(self, backend: Optional[str] = None, profile: str = "default") -> None:
+    """Chunk files and load them into ``VectorMemory``.
+
+    Files are streamed into overlapping word chunks, optionally in a process pool
+    (``workers > 1``) that also embeds them, and written to memory in batches of
+    ``batch_size``. With ``manifest_path`` set, a content-hash manifest makes
+    re-ingesting a directory process only new or changed files and drop the chunks of
+    files that have since been deleted.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        profile: str = "default",
+        chunk_size: int = 200,
+        chunk_overlap: int = 40,
+        batch_size: int = 64,
+        workers: int = 1,
+        manifest_path: Optional[Path] = None,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self.memory = VectorMemory(backend_name=backend or "local", profile=profile)
         self.memory.connect_backend()
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.batch_size = batch_size
+        self.workers = max(1, workers)
+        self.manifest = IngestManifest.load(Path(manifest_path) if manifest_path else None)
 
     def ingest(self, files: Iterable[Path]) -> int:
+        """Ingest ``files`` and return the number of files (re)processed."""
+        texts: List[str] = []
+        metadatas: List[dict] = []
+        vectors: List[object] = []
         added = 0
+        if self.manifest.path is not None:
+            # Files deleted since the last run must not linger in memory.
+            for missing in self.manifest.prune_missing():
+                self.memory.forget_where("path", missing)
+        for result in self._process(self._pending(files)):
+            path = Path(result.path)
+            if self.manifest.is_known(path):
+                # Changed since the last run: replace its chunks instead of duplicating them.
+                self.memory.forget_where("path", result.path)
+            for index, chunk in enumerate(result.chunks):
+                texts.append(chunk)
+                metadatas.append(
+                    {
+                        "path": result.path,
+                        "profile": self.memory.profile,
+                        "chunk": str(index),
+                        "content_hash": result.digest,
+                    }
+                )
+                if result.embeddings is not None:
+                    vectors.append(result.embeddings[index])
+                if len(texts) >= self.batch_size:
+                    self._flush(texts, metadatas, vectors)
+            if result.digest and self.manifest.path is not None:
+                self.manifest.record(path, result.digest)
+            added += 1
+        self._flush(texts, metadatas, vectors)
+        self.memory.persist()
+        self.manifest.save()
+        LOGGER.info("Ingested %s files", added, extra={"profile": self.memory.profile})
+        return added
+
+    def _pending(self, files: Iterable[Path]) -> Iterator[tuple[str, str]]:
         for path in files:
             if not path.is_file():
                 continue
-            text = path.read_text(encoding="utf-8", errors="ignore")
-            self.memory.remember(text, metadata={"path": str(path), "profile": self.memory.profile})
-            added += 1
-        return added
+            if self.manifest.path is None:
+                yield str(path), ""
+                continue
+            digest = self.manifest.changed_digest(path)
+            if digest is not None:
+                yield str(path), digest
+
+    def _process(self, pending: Iterator[tuple[str, str]]) -> Iterator[FileChunks]:
+        embedder = self.memory.embedder if self.memory.backend is not None else None
+        if self.workers == 1:
+            for path, digest in pending:
+                yield process_file(path, digest, self.chunk_size, self.chunk_overlap, embedder)
+            return
+        # Keep a bounded window of in-flight files so memory stays flat on large trees.
+        in_flight: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for path, digest in pending:
+                in_flight.append(
+                    pool.submit(process_file, path, digest, self.chunk_size, self.chunk_overlap, embedder)
+                )
+                if len(in_flight) >= self.workers * 2:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def _flush(self, texts: List[str], metadatas: List[dict], vectors: List[object]) -> None:
+        if not texts:
+            return
+        embeddings = None
+        if vectors and len(vectors) == len(texts):
+            import numpy as np
+
+            embeddings = np.stack(vectors)
+        self.memory.remember_many(list(texts), list(metadatas), embeddings=embeddings)
+        texts.clear()
+        metadatas.clear()
+        vectors.clear()
 
 
 class RagRetriever:
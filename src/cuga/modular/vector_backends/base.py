@@ -26,5 +26,13 @@ class VectorBackend(Protocol):
     def upsert(self, records: list[EmbeddedRecord]) -> None:
         ...
 
+    def upsert_many(self, embeddings, records: list[MemoryRecord]) -> None:
+        """Insert a ``(len(records), dim)`` float32 array of embeddings without per-row conversion."""
+        ...
+
+    def delete_where(self, key: str, value: str) -> int:
+        """Delete every record whose ``metadata[key]`` equals ``value``; returns the count."""
+        ...
+
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
         ...
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 
+from ..types import MemoryRecord
 from .base import EmbeddedRecord, SearchHit, VectorBackend
 
 
@@ -25,6 +26,25 @@ class ChromaBackend(VectorBackend):
         documents = [rec.record.text for rec in records]
         self._collection.upsert(ids=ids, embeddings=embeddings, metadatas=metadatas, documents=documents)
 
+    def upsert_many(self, embeddings, records: list[MemoryRecord]) -> None:
+        if self._collection is None or not records:
+            return
+        # Chroma accepts a 2-D numpy array for ``embeddings`` as-is.
+        self._collection.upsert(
+            ids=[str(uuid.uuid4()) for _ in records],
+            embeddings=embeddings,
+            metadatas=[rec.metadata for rec in records],
+            documents=[rec.text for rec in records],
+        )
+
+    def delete_where(self, key: str, value: str) -> int:
+        if self._collection is None:
+            return 0
+        ids = self._collection.get(where={key: value}, include=[])["ids"]
+        if ids:
+            self._collection.delete(ids=ids)
+        return len(ids)
+
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
         if self._collection is None:
             return []
@@ -1,14 +1,58 @@
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+import uuid
+from pathlib import Path
+from typing import Optional, Sequence
+
+from ..types import MemoryRecord
 from .base import EmbeddedRecord, SearchHit, VectorBackend
 
+_INDEX_FILE = "index.faiss"
+_METADATA_FILE = "metadata.sqlite"
+# FAISS recommends ~39 training points per IVF list.
+_IVF_POINTS_PER_LIST = 39
+
 
 class FaissBackend(VectorBackend):
-    def __init__(self) -> None:
+    """FAISS vector backend with an on-disk, memory-mapped index and SQLite metadata sidecar.
+
+    ``index_type`` selects ``flat`` (exact), ``ivf`` (IVF-Flat, trained automatically once
+    ``nlist * 39`` vectors are stored) or ``hnsw``. Vectors are keyed by the sidecar row id,
+    so records can be upserted or deleted by a stable string id (``metadata["id"]`` or the
+    ``ids`` argument). When ``path`` is set, ``connect`` memory-maps a previously saved
+    index read-only; the first write loads it into RAM, and ``save`` writes it back.
+
+    Unset options fall back to ``FAISS_INDEX_PATH``, ``FAISS_INDEX_TYPE``, ``FAISS_NLIST``,
+    ``FAISS_NPROBE``, ``FAISS_HNSW_M`` and ``FAISS_EF_SEARCH``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        index_type: Optional[str] = None,
+        nlist: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        hnsw_m: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> None:
+        path = path if path is not None else os.getenv("FAISS_INDEX_PATH")
+        self.path = Path(path) if path else None
+        self.index_type = (index_type or os.getenv("FAISS_INDEX_TYPE", "flat")).lower()
+        if self.index_type not in {"flat", "ivf", "hnsw"}:
+            raise ValueError(f"Unsupported FAISS index type {self.index_type}")
+        self.nlist = nlist or int(os.getenv("FAISS_NLIST", "100"))
+        self.nprobe = nprobe or int(os.getenv("FAISS_NPROBE", "8"))
+        self.hnsw_m = hnsw_m or int(os.getenv("FAISS_HNSW_M", "32"))
+        self.ef_search = ef_search or int(os.getenv("FAISS_EF_SEARCH", "64"))
         self._index = None
-        self._metadata: list[EmbeddedRecord] = []
         self._faiss = None
         self._np = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._mmapped_from: Optional[Path] = None
+        self._ivf_trained = False
 
     def connect(self) -> None:
         import importlib
@@ -16,30 +60,194 @@ class FaissBackend(VectorBackend):
         self._faiss = importlib.import_module("faiss")
         self._np = importlib.import_module("numpy")
         self._index = None
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path / _METADATA_FILE), check_same_thread=False)
+        else:
+            self._db = sqlite3.connect(":memory:", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            # AUTOINCREMENT: a deleted row id is never reused, so an orphaned HNSW vector can't
+            # point at a newer record.
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT UNIQUE NOT NULL, text TEXT NOT NULL, "
+            "metadata TEXT NOT NULL)"
+        )
+        self._db.commit()
+        if self.path is not None and (self.path / _INDEX_FILE).exists():
+            self.load()
 
-    def _ensure_index(self, dim: int) -> None:
+    # -- persistence -------------------------------------------------------------------
+
+    def load(self, path: Optional[str] = None) -> None:
+        """Memory-map a saved index read-only; it is copied into RAM on the first write."""
+        directory = Path(path) if path else self.path
+        if directory is None:
+            raise ValueError("No index path configured")
+        mmap_flag = getattr(self._faiss, "IO_FLAG_MMAP_IFC", self._faiss.IO_FLAG_MMAP)
+        self._index = self._faiss.read_index(
+            str(directory / _INDEX_FILE), mmap_flag | self._faiss.IO_FLAG_READ_ONLY
+        )
+        self._mmapped_from = directory
+        self._ivf_trained = self._is_ivf(self._index)
+        self._tune(self._index)
+
+    def save(self, path: Optional[str] = None) -> None:
+        directory = Path(path) if path else self.path
+        if directory is None:
+            raise ValueError("No index path configured")
         if self._index is None:
-            self._index = self._faiss.IndexFlatL2(dim)
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = directory / (_INDEX_FILE + ".tmp")
+        self._faiss.write_index(self._index, str(tmp_path))
+        os.replace(tmp_path, directory / _INDEX_FILE)
+        if self._db is not None:
+            self._db.commit()
+
+    def _writable(self) -> None:
+        if self._mmapped_from is not None:
+            self._index = self._faiss.read_index(str(self._mmapped_from / _INDEX_FILE))
+            self._tune(self._index)
+            self._mmapped_from = None
+
+    # -- index construction ------------------------------------------------------------
+
+    def _is_ivf(self, index) -> bool:
+        inner = self._faiss.downcast_index(index.index)
+        return isinstance(inner, self._faiss.IndexIVF)
+
+    def _tune(self, index) -> None:
+        inner = self._faiss.downcast_index(index.index)
+        if isinstance(inner, self._faiss.IndexIVF):
+            inner.nprobe = self.nprobe
+        elif isinstance(inner, self._faiss.IndexHNSW):
+            inner.hnsw.efSearch = self.ef_search
+
+    def _ensure_index(self, dim: int) -> None:
+        if self._index is not None:
+            return
+        if self.index_type == "hnsw":
+            inner = self._faiss.IndexHNSWFlat(dim, self.hnsw_m)
+        else:
+            # IVF starts exact and is rebuilt once there is enough data to train it.
+            inner = self._faiss.IndexFlatL2(dim)
+        self._index = self._faiss.IndexIDMap2(inner)
+        self._tune(self._index)
+
+    def _maybe_train_ivf(self) -> None:
+        if self.index_type != "ivf" or self._ivf_trained:
+            return
+        if self._index.ntotal < self.nlist * _IVF_POINTS_PER_LIST:
+            return
+        flat = self._faiss.downcast_index(self._index.index)
+        vectors = flat.reconstruct_n(0, flat.ntotal)
+        ids = self._faiss.vector_to_array(self._index.id_map).astype("int64")
+        quantizer = self._faiss.IndexFlatL2(flat.d)
+        ivf = self._faiss.IndexIVFFlat(quantizer, flat.d, self.nlist)
+        ivf.train(vectors)
+        index = self._faiss.IndexIDMap2(ivf)
+        index.add_with_ids(vectors, ids)
+        self._index = index
+        self._tune(self._index)
+        self._ivf_trained = True
+
+    # -- writes -----------------------------------------------------------------------
+
+    @staticmethod
+    def _record_key(record: MemoryRecord) -> str:
+        return str(record.metadata.get("id") or uuid.uuid4().hex)
 
     def upsert(self, records: list[EmbeddedRecord]) -> None:
-        if not records or self._faiss is None or self._np is None:
+        if not records or self._np is None:
             return
-        dim = len(records[0].embedding)
-        self._ensure_index(dim)
-        embeddings = self._np.stack(
-            [self._np.array(rec.embedding, dtype="float32") for rec in records]
-        )
-        self._index.add(embeddings)
-        self._metadata.extend(records)
+        embeddings = self._np.asarray([rec.embedding for rec in records], dtype="float32")
+        self.upsert_many(embeddings, [rec.record for rec in records])
+
+    def upsert_many(
+        self, embeddings, records: list[MemoryRecord], ids: Optional[Sequence[str]] = None
+    ) -> None:
+        if not records or self._faiss is None or self._np is None or self._db is None:
+            return
+        embeddings = self._np.ascontiguousarray(embeddings, dtype="float32")
+        keys = list(ids) if ids is not None else [self._record_key(record) for record in records]
+        self._ensure_index(embeddings.shape[1])
+        self._writable()
+        self.delete(keys)
+        row_ids = []
+        with self._db:
+            for key, record in zip(keys, records):
+                cursor = self._db.execute(
+                    "INSERT OR REPLACE INTO records (key, text, metadata) VALUES (?, ?, ?)",
+                    (key, record.text, json.dumps(record.metadata)),
+                )
+                row_ids.append(cursor.lastrowid)
+        self._index.add_with_ids(embeddings, self._np.asarray(row_ids, dtype="int64"))
+        self._maybe_train_ivf()
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """Delete records by stable id."""
+        if self._db is None or not ids:
+            return 0
+        placeholders = ",".join("?" for _ in ids)
+        rows = [
+            row[0]
+            for row in self._db.execute(f"SELECT id FROM records WHERE key IN ({placeholders})", list(ids))
+        ]
+        return self._delete_rows(rows)
+
+    def delete_where(self, key: str, value: str) -> int:
+        if self._db is None:
+            return 0
+        rows = [
+            row[0]
+            for row in self._db.execute(
+                "SELECT id FROM records WHERE json_extract(metadata, ?) = ?",
+                (f"$.{key}", value),
+            )
+        ]
+        return self._delete_rows(rows)
+
+    def _delete_rows(self, rows: list[int]) -> int:
+        if not rows:
+            return 0
+        placeholders = ",".join("?" for _ in rows)
+        with self._db:
+            # HNSW cannot remove vectors; they stay in the graph as orphans that search skips.
+            if self._index is not None and self.index_type != "hnsw":
+                self._writable()
+                self._index.remove_ids(self._np.asarray(rows, dtype="int64"))
+            self._db.execute(f"DELETE FROM records WHERE id IN ({placeholders})", rows)
+        return len(rows)
+
+    # -- reads ------------------------------------------------------------------------
 
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
-        if self._index is None or self._np is None:
+        if self._index is None or self._np is None or self._db is None or self._index.ntotal == 0:
+            return []
+        live = self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        orphans = max(self._index.ntotal - live, 0)
+        k = min(top_k + orphans, self._index.ntotal)
+        distances, indices = self._index.search(self._np.asarray(query_vector, dtype="float32")[None, :], k)
+        candidates = [(int(idx), float(dist)) for dist, idx in zip(distances[0], indices[0]) if idx >= 0]
+        if not candidates:
             return []
-        top_k = min(top_k, len(self._metadata))
-        distances, indices = self._index.search(self._np.array(query_vector, dtype="float32")[None, :], top_k)
+        placeholders = ",".join("?" for _ in candidates)
+        rows = {
+            row[0]: (row[1], row[2])
+            for row in self._db.execute(
+                f"SELECT id, text, metadata FROM records WHERE id IN ({placeholders})",
+                [idx for idx, _ in candidates],
+            )
+        }
         hits: list[SearchHit] = []
-        for dist, idx in zip(distances[0], indices[0]):
-            record = self._metadata[int(idx)].record
-            score = float(1.0 / (1.0 + dist))
-            hits.append(SearchHit(text=record.text, metadata=record.metadata, score=score))
+        seen: set[int] = set()
+        for idx, dist in candidates:
+            # Skip orphans of deleted records and any id FAISS returns twice.
+            if idx not in rows or idx in seen:
+                continue
+            seen.add(idx)
+            text, metadata = rows[idx]
+            hits.append(SearchHit(text=text, metadata=json.loads(metadata), score=float(1.0 / (1.0 + dist))))
+            if len(hits) == top_k:
+                break
         return hits
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 
+from ..types import MemoryRecord
 from .base import EmbeddedRecord, SearchHit, VectorBackend
 
 
@@ -9,6 +10,7 @@ class QdrantBackend(VectorBackend):
     def __init__(self) -> None:
         self._client = None
         self._collection_name = "cuga_modular"
+        self._collection_ready = False
 
     def connect(self) -> None:
         from qdrant_client import QdrantClient, models
@@ -17,15 +19,24 @@ class QdrantBackend(VectorBackend):
         self._client = QdrantClient(location=":memory:")
         try:
             self._client.get_collection(self._collection_name)
+            self._collection_ready = True
         except Exception:
-            self._client.create_collection(
-                collection_name=self._collection_name,
-                vectors_config=self._models.VectorParams(size=64, distance=self._models.Distance.COSINE),
-            )
+            # Created on first upsert so the vector size follows the embedder's dimension.
+            self._collection_ready = False
+
+    def _ensure_collection(self, dim: int) -> None:
+        if self._collection_ready:
+            return
+        self._client.create_collection(
+            collection_name=self._collection_name,
+            vectors_config=self._models.VectorParams(size=dim, distance=self._models.Distance.COSINE),
+        )
+        self._collection_ready = True
 
     def upsert(self, records: list[EmbeddedRecord]) -> None:
-        if self._client is None:
+        if self._client is None or not records:
             return
+        self._ensure_collection(len(records[0].embedding))
         payload = []
         for rec in records:
             payload.append(
@@ -37,8 +48,36 @@ class QdrantBackend(VectorBackend):
             )
         self._client.upsert(collection_name=self._collection_name, points=payload)
 
+    def upsert_many(self, embeddings, records: list[MemoryRecord]) -> None:
+        if self._client is None or not records:
+            return
+        self._ensure_collection(embeddings.shape[1])
+        # upload_collection takes the 2-D array directly and batches it internally.
+        self._client.upload_collection(
+            collection_name=self._collection_name,
+            vectors=embeddings,
+            payload=[{**rec.metadata, "text": rec.text} for rec in records],
+            ids=[str(uuid.uuid4()) for _ in records],
+        )
+
+    def delete_where(self, key: str, value: str) -> int:
+        if self._client is None or not self._collection_ready:
+            return 0
+        condition = self._models.Filter(
+            must=[self._models.FieldCondition(key=key, match=self._models.MatchValue(value=value))]
+        )
+        count = self._client.count(
+            collection_name=self._collection_name, count_filter=condition, exact=True
+        ).count
+        if count:
+            self._client.delete(
+                collection_name=self._collection_name,
+                points_selector=self._models.FilterSelector(filter=condition),
+            )
+        return count
+
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
-        if self._client is None:
+        if self._client is None or not self._collection_ready:
             return []
         results = self._client.search(
             collection_name=self._collection_name,
@@ -0,0 +1,31 @@
+import json
+import sys
+import threading
+import time
+
+_write_lock = threading.Lock()
+# ``--no-ids``: behave like a server that never echoes request ids, not even on the handshake.
+_ECHO_IDS = "--no-ids" not in sys.argv
+
+
+def _respond(payload: dict) -> None:
+    params = payload.get("params") or {}
+    time.sleep(float(params.get("delay", 0)))
+    response = {"result": "ok" if payload.get("method") == "health" else params}
+    if _ECHO_IDS and "id" in payload and not params.get("no_id"):
+        response["id"] = payload["id"]
+    with _write_lock:
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+def main() -> None:
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        threading.Thread(target=_respond, args=(json.loads(line),), daemon=True).start()
+
+
+if __name__ == "__main__":
+    main()
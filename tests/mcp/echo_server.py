@@ -13,6 +13,8 @@ def main() -> None:
                 result = {"result": "ok"}
             else:
                 result = {"result": payload.get("params")}
+            if "id" in payload:
+                result["id"] = payload["id"]
             sys.stdout.write(json.dumps(result) + "\n")
             sys.stdout.flush()
         except json.JSONDecodeError:
@@ -0,0 +1,102 @@
+import asyncio
+import sys
+import time
+
+from cuga.mcp.config import MCPConfig, PoolConfig
+from cuga.mcp.interfaces import ToolRequest, ToolSpec
+from cuga.mcp.lifecycle import LifecycleManager
+from cuga.mcp.registry import MCPRegistry
+
+
+def _config(**pool_kwargs) -> MCPConfig:
+    spec = ToolSpec(
+        alias="busy",
+        name="busy",
+        command=sys.executable,
+        args=["-m", "tests.mcp.concurrent_echo_server"],
+        pool="cpu",
+    )
+    return MCPConfig(
+        allow_commands=[sys.executable],
+        tools={"busy": spec},
+        pools={"cpu": PoolConfig(name="cpu", **pool_kwargs)},
+    )
+
+
+def test_pool_scales_up_under_load_and_spreads_calls():
+    async def _run():
+        manager = LifecycleManager(MCPRegistry(_config(max_active=3)))
+        first = await manager.call("busy", ToolRequest(method="echo", params={"n": 0}))
+        assert first.ok
+        pool = manager.pools[("busy", "stdio")]
+        assert len(pool) == 1
+
+        for _ in range(3):
+            responses = await asyncio.gather(
+                *(manager.call("busy", ToolRequest(method="echo", params={"delay": 0.2})) for _ in range(6))
+            )
+            assert all(r.ok for r in responses)
+            await asyncio.sleep(0.3)
+        assert len(pool) == 3
+        assert all(count == 0 for count in pool.active.values())
+        await manager.stop_all()
+
+    asyncio.run(_run())
+
+
+def test_least_loaded_runner_is_selected():
+    async def _run():
+        manager = LifecycleManager(MCPRegistry(_config(max_active=2, min_idle=2)))
+        await manager.prewarm()
+        pool = manager.pools[("busy", "stdio")]
+        assert len(pool) == 2
+        spec = manager.registry.get("busy")
+        first = await manager.ensure_runner(spec)
+        pool.acquire(first)
+        second = await manager.ensure_runner(spec)
+        assert second is not first
+        await manager.stop_all()
+
+    asyncio.run(_run())
+
+
+def test_idle_runners_are_reaped_down_to_min_idle():
+    async def _run():
+        manager = LifecycleManager(MCPRegistry(_config(max_active=3, min_idle=1, idle_ttl_s=60)))
+        pool = manager._pool_for(manager.registry.get("busy"))
+        for _ in range(3):
+            await manager._grow(pool)
+        assert len(pool) == 3
+        assert await manager.reap_idle() == 0
+        reaped = await manager.reap_idle(now=time.monotonic() + 3600)
+        assert reaped == 2
+        assert len(pool) == 1
+        await manager.stop_all()
+
+    asyncio.run(_run())
+
+
+def test_tool_without_pool_keeps_its_runner_when_idle():
+    async def _run():
+        config = _config()
+        config.tools["busy"].pool = None
+        manager = LifecycleManager(MCPRegistry(config))
+        assert (await manager.call("busy", ToolRequest(method="echo", params={"n": 0}))).ok
+        pool = manager.pools[("busy", "stdio")]
+        runner = pool.runners[0]
+        assert await manager.reap_idle(now=time.monotonic() + 3600) == 0
+        assert list(pool.runners) == [runner] and runner.is_healthy()
+        await manager.stop_all()
+
+    asyncio.run(_run())
+
+
+def test_pools_section_from_toml(tmp_path):
+    path = tmp_path / "mcp.toml"
+    path.write_text(
+        "[mcp.tools.echo]\ncommand = 'python'\npool = 'default'\n\n[mcp.pools.default]\nmax_active = 4\nidle_ttl_s = 30\n",
+        encoding="utf-8",
+    )
+    cfg = MCPConfig.from_toml(str(path))
+    assert cfg.pools["default"].name == "default"
+    assert cfg.pools["default"].max_active == 4
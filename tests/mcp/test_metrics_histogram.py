@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from cuga.mcp.telemetry.metrics import Histogram, Metrics
+
+
+def test_histogram_memory_is_bounded_and_percentiles_are_close():
+    histogram = Histogram("latency")
+    for value in range(1, 10001):
+        histogram.observe(value / 10)
+    assert histogram.count == 10000
+    assert len(histogram.counts) == len(histogram.buckets) + 1
+    assert histogram.percentile(0.5) == pytest.approx(500, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(990, rel=0.1)
+    assert histogram.percentile(1.0) == pytest.approx(1000)
+    snapshot = histogram.snapshot()
+    assert set(snapshot) == {"count", "sum", "p50", "p95", "p99"}
+
+
+def test_empty_histogram_has_no_percentiles():
+    assert Histogram("empty").percentile(0.5) is None
+
+
+def test_labeled_histograms_are_distinct_and_thread_safe():
+    registry = Metrics()
+
+    def _work(alias: str) -> None:
+        for _ in range(1000):
+            registry.histogram("mcp.latency_ms", {"alias": alias}).observe(1.0)
+            registry.counter("mcp.calls").inc()
+
+    threads = [threading.Thread(target=_work, args=(alias,)) for alias in ("a", "b") for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.histogram("mcp.latency_ms", {"alias": "a"}).count == 4000
+    assert registry.histogram("mcp.latency_ms", {"alias": "b"}).count == 4000
+    assert registry.counter("mcp.calls").count == 8000
+
+
+def test_prometheus_exposition():
+    registry = Metrics()
+    registry.counter("mcp.errors", {"kind": "timeout"}).inc(2)
+    histogram = registry.histogram("mcp.latency_ms", {"alias": "echo"}, buckets=[1, 10])
+    for value in (0.5, 5, 50):
+        histogram.observe(value)
+    text = registry.render_prometheus()
+    assert "# TYPE mcp_errors_total counter" in text
+    assert 'mcp_errors_total{kind="timeout"} 2' in text
+    assert "# TYPE mcp_latency_ms histogram" in text
+    assert 'mcp_latency_ms_bucket{alias="echo",le="1"} 1' in text
+    assert 'mcp_latency_ms_bucket{alias="echo",le="10"} 2' in text
+    assert 'mcp_latency_ms_bucket{alias="echo",le="+Inf"} 3' in text
+    assert 'mcp_latency_ms_count{alias="echo"} 3' in text
@@ -0,0 +1,103 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from cuga.mcp.errors import CallTimeout
+from cuga.mcp.runners.subprocess_stdio import SubprocessStdioRunner
+
+
+def _runner(*server_args: str, **kwargs) -> SubprocessStdioRunner:
+    return SubprocessStdioRunner(
+        sys.executable, args=["-m", "tests.mcp.concurrent_echo_server", *server_args], **kwargs
+    )
+
+
+def test_concurrent_requests_are_matched_by_id():
+    async def _run():
+        runner = _runner()
+        await runner.start()
+        delays = [0.3, 0.1, 0.2, 0.0]
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                runner.request({"method": "echo", "params": {"n": i, "delay": d}}, timeout=2)
+                for i, d in enumerate(delays)
+            )
+        )
+        elapsed = time.perf_counter() - started
+        assert [r["result"]["n"] for r in results] == [0, 1, 2, 3]
+        assert elapsed < sum(delays)
+        assert runner.in_flight == 0
+        await runner.stop()
+
+    asyncio.run(_run())
+
+
+def test_max_in_flight_bounds_outstanding_requests():
+    async def _run():
+        runner = _runner(max_in_flight=1)
+        await runner.start()
+        first = asyncio.create_task(runner.request({"method": "echo", "params": {"delay": 0.2}}, timeout=2))
+        await asyncio.sleep(0.05)
+        with pytest.raises(CallTimeout):
+            await runner.request({"method": "echo", "params": {"n": 1}}, timeout=0.05)
+        assert (await first)["result"] == {"delay": 0.2}
+        await runner.stop()
+
+    asyncio.run(_run())
+
+
+def test_cancelled_call_drops_late_response():
+    async def _run():
+        runner = _runner()
+        await runner.start()
+        slow = asyncio.create_task(
+            runner.request({"method": "echo", "params": {"delay": 0.1, "n": 0}}, timeout=2)
+        )
+        await asyncio.sleep(0.02)
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+        assert runner.in_flight == 0
+        await asyncio.sleep(0.15)
+        result = await runner.request({"method": "echo", "params": {"n": 1}}, timeout=1)
+        assert result["result"] == {"n": 1}
+        await runner.stop()
+
+    asyncio.run(_run())
+
+
+def test_responses_without_ids_resolve_in_order():
+    async def _run():
+        runner = _runner()
+        await runner.start()
+        results = await asyncio.gather(
+            *(
+                runner.request(
+                    {"method": "echo", "params": {"n": i, "no_id": True, "delay": 0.02 * i}}, timeout=2
+                )
+                for i in range(3)
+            )
+        )
+        assert [r["result"]["n"] for r in results] == [0, 1, 2]
+        await runner.stop()
+
+    asyncio.run(_run())
+
+
+def test_timed_out_call_without_echoed_ids_does_not_shift_responses():
+    async def _run():
+        runner = _runner("--no-ids")
+        await runner.start()
+        assert runner._echoes_ids is False
+        with pytest.raises(CallTimeout):
+            await runner.request({"method": "echo", "params": {"n": 0, "delay": 0.2}}, timeout=0.05)
+        # The late answer to the timed-out call arrives first and must be absorbed, not returned here.
+        result = await runner.request({"method": "echo", "params": {"n": 1, "delay": 0.3}}, timeout=2)
+        assert result["result"] == {"n": 1, "delay": 0.3}
+        assert runner.in_flight == 0
+        await runner.stop()
+
+    asyncio.run(_run())
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from cuga.backend.tools_env.registry.mcp_manager.api_catalog import ApiCatalog
+
+
+def _catalog(schemas: dict, calls: list) -> ApiCatalog:
+    def build(app_name: str, include_response_schema: bool) -> dict:
+        calls.append((app_name, include_response_schema))
+        apis = {f"{app_name}_{tool}": {"api_name": f"{app_name}_{tool}"} for tool in schemas[app_name]}
+        if include_response_schema:
+            for api in apis.values():
+                api["response_schemas"] = {"success": {"type": "string"}}
+        return apis
+
+    return ApiCatalog(build, lambda: list(schemas))
+
+
+def test_catalog_builds_each_variant_once():
+    calls: list = []
+    catalog = _catalog({"shop": ["list"]}, calls)
+
+    first = catalog.get("shop")
+    assert catalog.get("shop") is first
+    assert catalog.get("shop", True).apis["shop_list"]["response_schemas"]
+    assert catalog.get_all().apis == {"shop": first.apis}
+    assert calls == [("shop", False), ("shop", True)]
+
+
+def test_invalidate_rebuilds_only_the_changed_app():
+    calls: list = []
+    schemas = {"shop": ["list"], "crm": ["find"]}
+    catalog = _catalog(schemas, calls)
+    shop, crm, everything = catalog.get("shop"), catalog.get("crm"), catalog.get_all()
+
+    schemas["shop"] = ["list", "buy"]
+    catalog.invalidate("shop")
+
+    assert catalog.version == 1
+    assert catalog.get("crm") is crm
+    rebuilt = catalog.get("shop")
+    assert set(rebuilt.apis) == {"shop_list", "shop_buy"}
+    assert rebuilt.etag != shop.etag
+    assert catalog.get_all().etag != everything.etag
+
+
+def test_etag_matching():
+    catalog = _catalog({"shop": ["list"]}, [])
+    entry = catalog.get("shop")
+
+    assert entry.etag.startswith('"') and entry.etag.endswith('"')
+    assert entry.matches(entry.etag)
+    assert entry.matches(f'"stale", W/{entry.etag}')
+    assert entry.matches("*")
+    assert not entry.matches('"stale"')
+    assert not entry.matches(None)
+    # ETags are content hashes, so an unchanged rebuild keeps the same tag.
+    catalog.invalidate()
+    assert catalog.get("shop").etag == entry.etag
+
+
+def test_failed_build_is_not_cached():
+    calls: list = []
+    catalog = _catalog({}, calls)
+    for _ in range(2):
+        try:
+            catalog.get("missing")
+        except KeyError:
+            pass
+    assert calls == [("missing", False), ("missing", False)]
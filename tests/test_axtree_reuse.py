@@ -0,0 +1,91 @@
+import copy
+
+import pytest
+
+from cuga.backend.browser_env.page_understanding.tranformer_utils.transform_utils import flatten_axtree_to_str
+
+pytest.importorskip("playwright")
+
+from cuga.backend.browser_env.page_understanding import pu_transform  # noqa: E402
+from cuga.backend.browser_env.page_understanding.pu_extractor import PUExtracted  # noqa: E402
+
+
+def _page(items: int):
+    nodes = [{"nodeId": "root", "role": {"value": "RootWebArea"}, "name": {"value": "Shop"}, "childIds": []}]
+    extra = {}
+    for i in range(items):
+        bid, text_id = f"b{i}", f"t{i}"
+        nodes[0]["childIds"].append(bid)
+        nodes.append(
+            {
+                "nodeId": bid,
+                "role": {"value": "button"},
+                "name": {"value": f"Item {i}"},
+                "browsergym_id": bid,
+                "properties": [{"name": "focusable", "value": {"value": True}}],
+                "childIds": [text_id],
+            }
+        )
+        nodes.append(
+            {
+                "nodeId": text_id,
+                "role": {"value": "StaticText"},
+                "name": {"value": f"in stock {i}"},
+                "childIds": [],
+            }
+        )
+        extra[bid] = {"visibility": 1.0, "bbox": [0, i * 10, 50, 10], "clickable": True, "set_of_marks": True}
+    return {"nodes": nodes}, extra
+
+
+def _extracted(tree, extra) -> PUExtracted:
+    # a fresh extraction: equal to, but not the same objects as, the previous one
+    return PUExtracted(
+        accessibility_tree=copy.deepcopy(tree),
+        extra_properties=copy.deepcopy(extra),
+        screenshot="",
+        page_content_as_str="",
+    )
+
+
+@pytest.fixture
+def flattens(monkeypatch):
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return flatten_axtree_to_str(*args, **kwargs)
+
+    monkeypatch.setattr(pu_transform, "flatten_axtree_to_str", counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_unchanged_steps_reuse_the_flattened_text(flattens):
+    transformer = pu_transform.PageUnderstandingCached()
+    tree, extra = _page(3)
+    first = await transformer.transform(_extracted(tree, extra))
+    again = await transformer.transform(_extracted(tree, extra))
+    assert len(flattens) == 1
+    assert again.string_representation == first.string_representation
+    assert first.string_representation == flatten_axtree_to_str(tree, extra, filter_visible_only=True)
+
+    changed = copy.deepcopy(tree)
+    changed["nodes"][3]["name"]["value"] = "Item 1 renamed"
+    answer = await transformer.transform(_extracted(changed, extra))
+    assert len(flattens) == 2
+    assert answer.string_representation == flatten_axtree_to_str(changed, extra, filter_visible_only=True)
+
+    # the filter flag is part of what must match
+    await transformer.transform(_extracted(changed, extra), filter_visible_only=False)
+    assert len(flattens) == 3
+
+
+@pytest.mark.asyncio
+async def test_reset_forgets_the_previous_task(flattens):
+    transformer = pu_transform.PageUnderstandingCached()
+    tree, extra = _page(2)
+    await transformer.transform(_extracted(tree, extra))
+    transformer.reset()
+    await transformer.transform(_extracted(tree, extra))
+    assert len(flattens) == 2
@@ -0,0 +1,67 @@
+import json
+import multiprocessing
+from datetime import date
+
+import pytest
+
+from cuga.llm.budget import BudgetConfig, BudgetExceeded, BudgetManager
+from cuga.llm.types import Usage
+
+
+def _record_many(ledger_path, run_id, count):
+    manager = BudgetManager(BudgetConfig(run_id=run_id, tenant="acme"), ledger_path=ledger_path)
+    for _ in range(count):
+        manager.record(Usage(prompt_tokens=1000), model="gpt-4o-mini", is_local=False)
+    manager.close()
+
+
+def test_ledger_aggregates_by_run_tenant_and_model(tmp_path):
+    ledger = tmp_path / "billing.sqlite"
+    manager = BudgetManager(BudgetConfig(run_id="run-a", tenant="acme"), ledger_path=ledger)
+    manager.record(Usage(prompt_tokens=1000), model="gpt-4o-mini", is_local=False)
+    manager.record(Usage(completion_tokens=1000), model="gpt-4o-mini", is_local=False)
+    manager.record(Usage(prompt_tokens=1000), model="mistral", is_local=True, run_id="run-b", tenant="beta")
+
+    assert manager.run_total() == pytest.approx(0.75)
+    assert manager.totals(by="run_id") == pytest.approx({"run-a": 0.75, "run-b": 0.0})
+    assert manager.totals(by="tenant") == pytest.approx({"acme": 0.75, "beta": 0.0})
+    assert manager.totals(by="model", tenant="acme") == pytest.approx({"gpt-4o-mini": 0.75})
+    assert manager.totals(by="day") == pytest.approx({date.today().isoformat(): 0.75})
+    with pytest.raises(ValueError):
+        manager.totals(by="cost")
+
+
+def test_ledger_is_shared_across_processes(tmp_path):
+    ledger = tmp_path / "billing.sqlite"
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_record_many, args=(ledger, f"run-{i}", 20)) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    manager = BudgetManager(
+        BudgetConfig(daily_budget_usd=1.0, enforce="block"), ledger_path=ledger, refresh_interval_s=0
+    )
+    assert sum(manager.totals(by="run_id").values()) == pytest.approx(60 * 0.15)
+    with pytest.raises(BudgetExceeded):
+        manager.record(Usage(prompt_tokens=10), model="gpt-4o-mini", is_local=False)
+
+
+def test_run_budget_accumulates_across_calls(tmp_path):
+    manager = BudgetManager(
+        BudgetConfig(run_budget_usd=0.2, enforce="block"), ledger_path=tmp_path / "billing.sqlite"
+    )
+    manager.record(Usage(prompt_tokens=1000), model="gpt-4o-mini", is_local=False)
+    with pytest.raises(BudgetExceeded):
+        manager.record(Usage(prompt_tokens=1000), model="gpt-4o-mini", is_local=False)
+    assert manager.totals(by="run_id") == pytest.approx({manager.run_id: 0.15})
+
+
+def test_legacy_json_ledger_is_imported_once(tmp_path):
+    legacy = tmp_path / "billing.json"
+    legacy.write_text(json.dumps({"2024-01-01": 1.5}), encoding="utf-8")
+    BudgetManager(BudgetConfig(), ledger_path=legacy).close()
+    manager = BudgetManager(BudgetConfig(), ledger_path=legacy)
+    assert manager.totals(by="day") == pytest.approx({"2024-01-01": 1.5})
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+from playwright.async_api import Error as PlaywrightError  # noqa: E402
+
+from cuga.backend.browser_env.browser.gym_obs.cdp_sessions import CDPSessionManager  # noqa: E402
+
+
+class FakeCDP:
+    def __init__(self):
+        self.handlers = {}
+        self.sent = []
+        self.fail_with = None
+        self.detached = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def send(self, method, params):
+        await asyncio.sleep(0)
+        if self.fail_with:
+            raise PlaywrightError(self.fail_with)
+        self.sent.append(method)
+        return {"method": method, "params": params}
+
+    async def detach(self):
+        self.detached = True
+
+
+class FakePage:
+    url = "http://example.test"
+
+    def __init__(self):
+        self.sessions = []
+        self.handlers = {}
+        self.closed = False
+        self.context = self
+
+    async def new_cdp_session(self, page):
+        await asyncio.sleep(0)
+        self.sessions.append(FakeCDP())
+        return self.sessions[-1]
+
+    def once(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return self.closed
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_share_one_session():
+    manager, page = CDPSessionManager(), FakePage()
+    results = await asyncio.gather(
+        *(manager.send(page, "Accessibility.getFullAXTree", {"i": i}) for i in range(5))
+    )
+    assert [r["params"]["i"] for r in results] == list(range(5))
+    await manager.send(page, "Page.captureScreenshot")
+    assert len(page.sessions) == 1 and len(page.sessions[0].sent) == 6
+
+
+@pytest.mark.asyncio
+async def test_reattaches_after_detach():
+    manager, page = CDPSessionManager(), FakePage()
+    await manager.send(page, "Page.getFrameTree")
+    page.sessions[0].fail_with = "Target closed"
+    assert (await manager.send(page, "Page.getFrameTree"))["method"] == "Page.getFrameTree"
+    assert len(page.sessions) == 2 and page.sessions[0].detached
+
+    page.sessions[1].handlers["Inspector.detached"]({})
+    await manager.send(page, "Page.getFrameTree")
+    assert len(page.sessions) == 3
+
+
+@pytest.mark.asyncio
+async def test_other_errors_propagate_and_close_forgets_page():
+    manager, page = CDPSessionManager(), FakePage()
+    await manager.send(page, "Page.getFrameTree")
+    page.sessions[0].fail_with = "Frame with the given frameId is not found"
+    with pytest.raises(PlaywrightError):
+        await manager.send(page, "Accessibility.getFullAXTree", {"frameId": "x"})
+    assert len(page.sessions) == 1
+
+    page.closed = True
+    page.handlers["close"](page)
+    assert len(manager) == 0
+
+
+@pytest.mark.asyncio
+async def test_frame_errors_keep_the_session():
+    manager, page = CDPSessionManager(), FakePage()
+    await manager.send(page, "Page.getFrameTree")
+    for message in ("Frame has been detached.", "Frame was detached", "Execution context was destroyed"):
+        page.sessions[0].fail_with = message
+        with pytest.raises(PlaywrightError):
+            await manager.send(page, "DOMSnapshot.captureSnapshot")
+    assert len(page.sessions) == 1 and not page.sessions[0].detached and len(manager) == 1
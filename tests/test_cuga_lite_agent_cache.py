@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from cuga.backend.cuga_graph.nodes.cuga_lite.agent_cache import AgentCache, CatalogFingerprint
+from cuga.config import settings
+
+
+def _factory(built: list):
+    async def build():
+        await asyncio.sleep(0.01)
+        agent = object()
+        built.append(agent)
+        return agent
+
+    return build
+
+
+def _fingerprint(value, calls: list | None = None):
+    async def compute():
+        if calls is not None:
+            calls.append(value)
+        return value
+
+    return compute
+
+
+@pytest.mark.asyncio
+async def test_agents_are_reused_per_key_and_fingerprint():
+    cache = AgentCache(max_size=4)
+    built: list = []
+
+    first = await cache.get_or_create(("crm",), _fingerprint("v1"), _factory(built))
+    assert await cache.get_or_create(("crm",), _fingerprint("v1"), _factory(built)) is first
+    assert await cache.get_or_create(("shop",), _fingerprint("v1"), _factory(built)) is not first
+    rebuilt = await cache.get_or_create(("crm",), _fingerprint("v2"), _factory(built))
+
+    assert rebuilt is not first
+    assert len(built) == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_build_once():
+    cache = AgentCache(max_size=4)
+    built: list = []
+    agents = await asyncio.gather(
+        *(cache.get_or_create("k", _fingerprint("v1"), _factory(built)) for _ in range(5))
+    )
+    assert len(built) == 1
+    assert all(agent is built[0] for agent in agents)
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    cache = AgentCache(max_size=2)
+    built: list = []
+    a = await cache.get_or_create("a", _fingerprint(None), _factory(built))
+    await cache.get_or_create("b", _fingerprint(None), _factory(built))
+    await cache.get_or_create("a", _fingerprint(None), _factory(built))  # a is now most recent
+    await cache.get_or_create("c", _fingerprint(None), _factory(built))  # evicts b
+
+    assert len(cache) == 2
+    assert await cache.get_or_create("a", _fingerprint(None), _factory(built)) is a
+    await cache.get_or_create("b", _fingerprint(None), _factory(built))
+    assert len(built) == 4
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_builds_without_fingerprinting():
+    cache = AgentCache(max_size=0)
+    built: list = []
+    fingerprints: list = []
+    await cache.get_or_create("a", _fingerprint("v1", fingerprints), _factory(built))
+    await cache.get_or_create("a", _fingerprint("v1", fingerprints), _factory(built))
+    assert len(built) == 2 and len(cache) == 0
+    assert fingerprints == []
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_tracks_runtime_tools(monkeypatch):
+    monkeypatch.setattr(settings.advanced_features, "registry", False)
+    fingerprint = CatalogFingerprint()
+    tracker = SimpleNamespace(tools={"crm": [SimpleNamespace(name="find")]})
+
+    before = await fingerprint.compute(tracker)
+    assert await fingerprint.compute(tracker) == before
+    tracker.tools["crm"].append(SimpleNamespace(name="create"))
+    assert await fingerprint.compute(tracker) != before
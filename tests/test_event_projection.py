@@ -0,0 +1,35 @@
+import json
+
+from langchain_core.messages import AIMessage
+
+from cuga.backend.cuga_graph.utils import event_projection
+
+
+def test_last_message_accepts_objects_and_dicts():
+    message = AIMessage(content="hi", tool_calls=[{"name": "click", "args": {"bid": "1"}, "id": "c1"}])
+    assert event_projection.last_message({"messages": [AIMessage(content="old"), message]}) is message
+
+    projected = event_projection.last_message({"messages": [message.model_dump()]})
+    assert projected.content == "hi"
+    assert projected.tool_calls[0]["name"] == "click"
+
+    assert event_projection.last_message({"messages": []}) is None
+    assert event_projection.last_message({}) is None
+    assert event_projection.last_message(None) is None
+
+
+def test_event_data_per_node():
+    message = AIMessage(content="thinking", tool_calls=[{"name": "type", "args": {"text": "x"}, "id": "c1"}])
+    step = {"thoughts": ["t"], "next_agent": "ActionAgent", "instruction": "type x"}
+    # Unrelated keys are never touched, so they need not be valid state.
+    update = {"messages": [message], "previous_steps": [step], "variables_storage": object()}
+
+    assert event_projection.event_data("CugaLite", update) == "thinking"
+    assert json.loads(event_projection.event_data("BrowserPlannerAgent", update)) == step
+    assert json.loads(event_projection.event_data("ActionAgent", update))[0]["args"] == {"text": "x"}
+    assert event_projection.event_data("ChatAgent", {"messages": []}) == ""
+
+
+def test_final_answer_defaults_to_empty():
+    assert event_projection.final_answer({"final_answer": "42"}) == "42"
+    assert event_projection.final_answer({}) == ""
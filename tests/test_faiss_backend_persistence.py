@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cuga.modular.embeddings.hashing import HashingEmbedder
+from cuga.modular.types import MemoryRecord
+from cuga.modular.vector_backends.faiss_backend import FaissBackend
+
+pytest.importorskip("faiss")
+
+
+def _records(texts: list[str], start: int = 0) -> list[MemoryRecord]:
+    return [
+        MemoryRecord(text=text, metadata={"id": f"doc-{i}", "path": f"p{i % 2}"})
+        for i, text in enumerate(texts, start=start)
+    ]
+
+
+@pytest.mark.parametrize("index_type", ["flat", "ivf", "hnsw"])
+def test_save_load_upsert_and_delete_by_stable_id(tmp_path: Path, index_type: str) -> None:
+    embedder = HashingEmbedder()
+    texts = [f"alpha beta doc{i}" for i in range(60)] + ["gamma delta epsilon"]
+    backend = FaissBackend(path=str(tmp_path / "idx"), index_type=index_type, nlist=1)
+    backend.connect()
+    backend.upsert_many(embedder.embed_many(texts), _records(texts))
+    backend.save()
+
+    reopened = FaissBackend(path=str(tmp_path / "idx"), index_type=index_type, nlist=1)
+    reopened.connect()
+    query = embedder.embed("gamma delta epsilon")
+    assert reopened.search(query, top_k=1)[0].metadata["id"] == "doc-60"
+
+    # Upsert by the same stable id replaces the record instead of duplicating it.
+    replacement = MemoryRecord(text="zeta eta", metadata={"id": "doc-60"})
+    reopened.upsert_many(embedder.embed_many(["zeta eta"]), [replacement])
+    hits = reopened.search(embedder.embed("zeta eta"), top_k=3)
+    assert hits[0].text == "zeta eta"
+    assert sum(hit.metadata["id"] == "doc-60" for hit in hits) == 1
+
+    assert reopened.delete(["doc-60"]) == 1
+    assert all(hit.metadata["id"] != "doc-60" for hit in reopened.search(embedder.embed("zeta eta"), top_k=5))
+    assert reopened.delete_where("path", "p1") == 30
+    assert all(hit.metadata["path"] == "p0" for hit in reopened.search(query, top_k=10))
+
+
+def test_ivf_trains_once_enough_vectors(tmp_path: Path) -> None:
+    faiss = pytest.importorskip("faiss")
+    embedder = HashingEmbedder()
+    texts = [f"token{i} shared" for i in range(100)]
+    backend = FaissBackend(index_type="ivf", nlist=2)
+    backend.connect()
+    backend.upsert_many(embedder.embed_many(texts[:10]), _records(texts[:10]))
+    assert isinstance(faiss.downcast_index(backend._index.index), faiss.IndexFlatL2)
+    backend.upsert_many(embedder.embed_many(texts[10:]), _records(texts[10:], start=10))
+    assert isinstance(faiss.downcast_index(backend._index.index), faiss.IndexIVFFlat)
+    hit = backend.search(embedder.embed("token5 shared"), top_k=1)[0]
+    assert hit.score == pytest.approx(1.0)
+
+
+def test_hnsw_reupsert_does_not_resurrect_orphaned_vectors() -> None:
+    embedder = HashingEmbedder()
+    backend = FaissBackend(index_type="hnsw")
+    backend.connect()
+    backend.upsert_many(embedder.embed_many(["alpha beta"]), [MemoryRecord("alpha beta", {"id": "doc"})])
+    # HNSW keeps the replaced vector as an orphan; its row id must not be handed to the new record.
+    for text in ["gamma delta", "epsilon zeta"]:
+        backend.upsert_many(embedder.embed_many([text]), [MemoryRecord(text, {"id": "doc"})])
+
+    assert backend._index.ntotal == 3
+    for query in ["alpha beta", "gamma delta", "epsilon zeta"]:
+        hits = backend.search(embedder.embed(query), top_k=3)
+        assert [hit.text for hit in hits] == ["epsilon zeta"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import operator
+import sqlite3
+from typing import Annotated, List
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from pydantic import BaseModel
+
+from cuga.backend.cuga_graph.checkpointer import COMPRESSED_SUFFIX, SQLCheckpointSaver
+
+
+class CounterState(BaseModel):
+    steps: Annotated[List[str], operator.add] = []
+    note: str = ""
+
+
+def _graph(saver: SQLCheckpointSaver):
+    builder = StateGraph(CounterState)
+    builder.add_node("work", lambda state: {"steps": [f"step{len(state.steps)}"], "note": "x" * 4000})
+    builder.add_edge(START, "work")
+    builder.add_edge("work", END)
+    return builder.compile(checkpointer=saver)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_thread_state_is_shared_between_savers(tmp_path) -> None:
+    path = str(tmp_path / "checkpoints.sqlite")
+    first = SQLCheckpointSaver.from_sqlite(path)
+    _graph(first).invoke({"steps": []}, _config("t1"))
+
+    # A second process/worker opening the same database resumes the thread.
+    second = SQLCheckpointSaver.from_sqlite(path)
+    graph = _graph(second)
+    assert graph.get_state(_config("t1")).values["steps"] == ["step0"]
+    asyncio.run(graph.ainvoke({"steps": []}, _config("t1")))
+    assert first.get_tuple(_config("t1")).checkpoint["channel_values"]["steps"] == ["step0", "step1"]
+    assert len(list(second.list(_config("t1")))) >= 4
+    assert len(list(second.list(_config("t1"), limit=2))) == 2
+
+
+def test_large_values_are_compressed_and_versions_deduplicated(tmp_path) -> None:
+    saver = SQLCheckpointSaver.from_sqlite(str(tmp_path / "checkpoints.sqlite"))
+    _graph(saver).invoke({"steps": []}, _config("t1"))
+    rows = saver._execute("SELECT channel, type, length(value) FROM checkpoint_blobs WHERE channel = 'note'")
+    compressed = [row for row in rows if row[1].endswith(COMPRESSED_SUFFIX)]
+    assert compressed and all(length < 4000 for _, _, length in compressed)
+    checkpoints = saver._execute("SELECT COUNT(*) FROM checkpoints")[0][0]
+    blobs = saver._execute("SELECT COUNT(*) FROM checkpoint_blobs")[0][0]
+    assert blobs < checkpoints * 3
+
+
+def test_ttl_eviction_and_delete_thread(tmp_path) -> None:
+    saver = SQLCheckpointSaver.from_sqlite(str(tmp_path / "checkpoints.sqlite"), ttl_s=60)
+    graph = _graph(saver)
+    graph.invoke({"steps": []}, _config("old"))
+    graph.invoke({"steps": []}, _config("new"))
+    saver._execute("UPDATE checkpoint_threads SET updated_at = 0 WHERE thread_id = 'old'")
+
+    assert saver.evict_expired() == 1
+    assert saver.get_tuple(_config("old")) is None
+    assert saver.get_tuple(_config("new")) is not None
+    saver.delete_thread("new")
+    assert saver.get_tuple(_config("new")) is None
+    for table in ("checkpoints", "checkpoint_blobs", "checkpoint_writes", "checkpoint_threads"):
+        assert saver._execute(f"SELECT COUNT(*) FROM {table}")[0][0] == 0
+
+
+def test_postgres_dialect_uses_format_placeholders(tmp_path) -> None:
+    saver = SQLCheckpointSaver.from_sqlite(str(tmp_path / "checkpoints.sqlite"))
+    saver._param = "%s"
+    assert saver._sql("SELECT 1 WHERE a = ? AND b = ?") == "SELECT 1 WHERE a = %s AND b = %s"
+    with pytest.raises(ValueError):
+        SQLCheckpointSaver(saver.conn, dialect="oracle")
+
+
+def test_create_checkpointer_backends(tmp_path) -> None:
+    from langgraph.checkpoint.memory import MemorySaver
+
+    from cuga.backend.cuga_graph.checkpointer import close_checkpointers, create_checkpointer
+
+    assert isinstance(create_checkpointer("memory"), MemorySaver)
+    saver = create_checkpointer("sqlite", path=str(tmp_path / "cp.sqlite"), ttl_s=10)
+    assert isinstance(saver, SQLCheckpointSaver) and saver.ttl_s == 10
+    # Graphs are rebuilt per task; they must share one connection rather than open a new one each time.
+    assert create_checkpointer("sqlite", path=str(tmp_path / "cp.sqlite"), ttl_s=10) is saver
+    close_checkpointers()
+    with pytest.raises(sqlite3.ProgrammingError):
+        saver.conn.execute("SELECT 1")
+    assert create_checkpointer("sqlite", path=str(tmp_path / "cp.sqlite"), ttl_s=10) is not saver
+    close_checkpointers()
+    with pytest.raises(ValueError):
+        create_checkpointer("redis")
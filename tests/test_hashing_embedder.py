@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from cuga.modular.embeddings.hashing import HashingEmbedder
+from cuga.modular.memory import VectorMemory
+from cuga.modular.types import MemoryRecord
+
+np = pytest.importorskip("numpy")
+
+
+def test_embed_many_matches_embed_and_is_contiguous_float32() -> None:
+    embedder = HashingEmbedder()
+    texts = ["alpha beta beta", "", "Gamma delta"]
+    matrix = embedder.embed_many(texts)
+    assert matrix.shape == (3, 64)
+    assert matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+    for row, text in zip(matrix, texts):
+        assert np.allclose(row, embedder.embed(text), atol=1e-6)
+    assert not matrix[1].any()
+
+
+def test_configurable_dimension() -> None:
+    embedder = HashingEmbedder(dim=512)
+    assert len(embedder.embed("one two")) == 512
+    assert embedder.embed_many(["one two"]).shape == (1, 512)
+    with pytest.raises(ValueError):
+        HashingEmbedder(dim=0)
+
+
+class ArrayBackend:
+    def __init__(self) -> None:
+        self.batches: list = []
+
+    def connect(self) -> None:
+        return None
+
+    def upsert(self, records) -> None:
+        raise AssertionError("batch path should not fall back to per-record upsert")
+
+    def upsert_many(self, embeddings, records: list[MemoryRecord]) -> None:
+        self.batches.append((embeddings, records))
+
+    def search(self, query_vector, top_k):
+        return []
+
+
+def test_remember_many_upserts_one_array_batch() -> None:
+    memory = VectorMemory(profile="p", backend_name="faiss")
+    memory.backend = ArrayBackend()
+    ids = memory.remember_many(["a b", "c d"], [{"path": "1"}, None])
+    assert ids == [0, 1]
+    ((embeddings, records),) = memory.backend.batches
+    assert isinstance(embeddings, np.ndarray) and embeddings.shape == (2, 64)
+    assert [r.metadata.get("path") for r in records] == ["1", None]
+    assert all(r.metadata["profile"] == "p" for r in records)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from cuga.backend.tools_env.registry.mcp_manager.session_pool import MCPSessionPool
+
+
+class FakeClient:
+    """Speaks the subset of the FastMCP client API used by the pool."""
+
+    def __init__(self, registry: list):
+        self.connected = False
+        self.active = 0
+        self.peak = 0
+        registry.append(self)
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)  # handshake
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.connected = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def call_tool(self, name: str, args: dict):
+        if not self.connected:
+            raise RuntimeError("Client is not connected")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.05)
+            if name == "fail":
+                raise ValueError("tool failed")
+            return args["a"] + args["b"]
+        finally:
+            self.active -= 1
+
+
+def _pool(created: list, **kwargs) -> MCPSessionPool:
+    pool = MCPSessionPool(**kwargs)
+    pool.register("math", lambda: FakeClient(created))
+    return pool
+
+
+def test_session_is_reused_and_concurrent_calls_share_it():
+    async def _run():
+        created = []
+        pool = _pool(created, max_concurrency=4)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(pool.call_tool("math", "add", {"a": i, "b": 1}) for i in range(8)))
+        elapsed = time.perf_counter() - started
+        assert results == list(range(1, 9))
+        assert len(created) == 1
+        assert created[0].peak == 4
+        assert elapsed < 8 * 0.05
+        await pool.close()
+        assert not created[0].is_connected()
+
+    asyncio.run(_run())
+
+
+def test_dropped_session_is_reconnected_but_tool_errors_are_not_retried():
+    async def _run():
+        created = []
+        pool = _pool(created)
+        await pool.call_tool("math", "add", {"a": 1, "b": 2})
+        created[0].connected = False
+        assert await pool.call_tool("math", "add", {"a": 2, "b": 2}) == 4
+        assert len(created) == 2
+        with pytest.raises(ValueError):
+            await pool.call_tool("math", "fail", {})
+        assert len(created) == 2
+        await pool.close()
+
+    asyncio.run(_run())
+
+
+def test_idle_sessions_are_closed():
+    async def _run():
+        created = []
+        pool = _pool(created, idle_timeout_s=60)
+        await pool.call_tool("math", "add", {"a": 1, "b": 2})
+        assert await pool.close_idle() == 0
+        assert await pool.close_idle(now=time.monotonic() + 120) == 1
+        assert not created[0].is_connected()
+        await pool.call_tool("math", "add", {"a": 1, "b": 2})
+        assert len(created) == 2
+        await pool.close()
+
+    asyncio.run(_run())
+
+
+def test_unregistered_server_raises():
+    async def _run():
+        with pytest.raises(KeyError):
+            await MCPSessionPool().call_tool("missing", "add", {})
+
+    asyncio.run(_run())
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from cuga.backend.activity_tracker.memory_ingest import _STOP, MemoryIngestQueue, _Job
+
+
+class RecordingMemory:
+    def __init__(self, failures=None, gate: threading.Event | None = None):
+        self.calls = []
+        self.requests = []
+        self.failures = dict(failures or {})
+        self.gate = gate
+
+    def _maybe_fail(self, key):
+        if self.gate is not None:
+            self.gate.wait(5)
+        errors = self.failures.get(key)
+        if errors:
+            raise errors.pop(0)
+
+    def add_steps(self, namespace_id, run_id, steps):
+        for item in steps:
+            self._maybe_fail(item["step"]["name"])
+        self.requests.append([item["step"]["name"] for item in steps])
+        self.calls.extend(("step", run_id, item["step"]["name"]) for item in steps)
+
+    def end_run(self, namespace_id, run_id):
+        self._maybe_fail("end")
+        self.calls.append(("end_run", run_id, None))
+
+
+def test_jobs_are_sent_in_order_and_end_run_last() -> None:
+    memory = RecordingMemory()
+    ingest = MemoryIngestQueue(memory, batch_size=3)
+    for i in range(7):
+        assert ingest.submit_step("memory", "run", {"name": f"s{i}"}, "prompt")
+    ingest.submit_end_run("memory", "run")
+    assert ingest.flush(timeout=5)
+
+    assert [c[2] for c in memory.calls[:-1]] == [f"s{i}" for i in range(7)]
+    assert memory.calls[-1] == ("end_run", "run", None)
+    assert all(len(request) <= 3 for request in memory.requests)
+    stats = ingest.stats()
+    assert stats["processed"] == 8 and stats["depth"] == 0
+    ingest.close()
+
+
+def test_failed_jobs_are_retried_then_given_up() -> None:
+    memory = RecordingMemory(
+        failures={
+            "flaky": [ConnectionError("reset"), TimeoutError("slow")],
+            "down": [ConnectionError("refused")] * 3,
+        }
+    )
+    ingest = MemoryIngestQueue(memory, batch_size=1, max_retries=2, retry_backoff_s=0.01)
+    ingest.submit_step("memory", "run", {"name": "flaky"}, "prompt")
+    ingest.submit_step("memory", "run", {"name": "down"}, "prompt")
+    ingest.submit_end_run("memory", "run")
+    assert ingest.flush(timeout=5)
+
+    assert memory.calls == [("step", "run", "flaky"), ("end_run", "run", None)]
+    stats = ingest.stats()
+    assert stats["retries"] == 4 and stats["processed"] == 2 and stats["failed"] == 1
+    ingest.close()
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    gate = threading.Event()
+    memory = RecordingMemory(gate=gate)
+    ingest = MemoryIngestQueue(memory, max_queue_size=2, batch_size=1)
+    start = time.perf_counter()
+    results = [ingest.submit_step("memory", "run", {"name": f"s{i}"}, "prompt") for i in range(6)]
+
+    assert results.count(False) >= 1
+    # dropping must not wait for room in the queue
+    assert time.perf_counter() - start < 0.1
+    assert ingest.stats()["dropped"] == results.count(False)
+    gate.set()
+    ingest.close(timeout=5)
+    assert len(memory.calls) == results.count(True)
+
+
+def test_close_drains_pending_jobs() -> None:
+    memory = RecordingMemory()
+    ingest = MemoryIngestQueue(memory)
+    for i in range(20):
+        ingest.submit_step("memory", "run", {"name": f"s{i}"}, "prompt")
+    ingest.close(timeout=5)
+    assert len(memory.calls) == 20
+    assert ingest.stats()["max_lag_s"] >= ingest.stats()["last_lag_s"] >= 0
+
+
+def test_consecutive_steps_of_a_run_share_one_request() -> None:
+    memory = RecordingMemory()
+    ingest = MemoryIngestQueue(memory, batch_size=3)
+    # queue everything before the worker runs, so the grouping does not depend on thread timing
+    jobs = [_Job("step", "memory", "a", step={"name": f"a{i}"}, prompt="p") for i in range(4)]
+    jobs += [
+        _Job("step", "memory", "b", step={"name": "b0"}, prompt="p"),
+        _Job("end_run", "memory", "b"),
+        _Job("step", "memory", "b", step={"name": "b1"}, prompt="p"),
+    ]
+    for job in jobs:
+        ingest._queue.put(job)
+    ingest._queue.put(_STOP)
+    ingest._run()
+
+    assert memory.requests == [["a0", "a1", "a2"], ["a3"], ["b0"], ["b1"]]
+    assert [c[2] or c[0] for c in memory.calls][-2:] == ["end_run", "b1"]
+    assert ingest.stats()["processed"] == 7 and ingest.stats()["batches"] == 5
@@ -11,3 +11,27 @@ def test_local_search_whole_word_matching() -> None:
     assert len(results) == 1
     assert results[0].metadata["path"] == "p1"
     assert results[0].score > 0
+
+
+def test_local_search_ranks_with_bm25_and_filters_profile() -> None:
+    memory = VectorMemory(profile="local", backend_name="local")
+    memory.remember("beta beta beta report", metadata={"path": "dense"})
+    memory.remember("beta with a lot of other unrelated words in it", metadata={"path": "sparse"})
+    memory.remember("beta from another profile", metadata={"path": "other", "profile": "remote"})
+
+    results = memory.search("beta", top_k=3)
+    assert [hit.metadata["path"] for hit in results][0] == "dense"
+
+    filtered = memory.search("beta", top_k=3, profile="remote")
+    assert [hit.metadata["path"] for hit in filtered] == ["other"]
+
+
+def test_forget_removes_record_from_index_and_store() -> None:
+    memory = VectorMemory(profile="local", backend_name="local")
+    record_id = memory.remember("alpha only", metadata={"path": "p1"})
+    memory.remember("alpha again", metadata={"path": "p2"})
+
+    assert memory.forget(record_id)
+    assert not memory.forget(record_id)
+    assert [hit.metadata["path"] for hit in memory.search("alpha")] == ["p2"]
+    assert len(memory.store) == 1
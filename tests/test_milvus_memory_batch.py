@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import importlib
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from cuga.config import settings
+
+pytest.importorskip("pymilvus")
+pytest.importorskip("sentence_transformers")
+if not settings.advanced_features.enable_memory:
+    # The memory backends read their configuration at import time.
+    pytest.skip("memory settings are not loaded", allow_module_level=True)
+
+
+class FakeMilvus:
+    def __init__(self, drop_ids: int = 0) -> None:
+        self.inserts: list[list[dict]] = []
+        self.drop_ids = drop_ids
+        self._next_id = 100
+
+    def has_collection(self, name: str) -> bool:
+        return True
+
+    def insert(self, collection_name: str, data: list[dict]) -> dict:
+        self.inserts.append(data)
+        ids = list(range(self._next_id, self._next_id + len(data) - self.drop_ids))
+        self._next_id += len(data)
+        return {"ids": ids}
+
+
+class FakeEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, batch_size: int = 32):
+        self.calls.append(list(texts))
+        return [[float(len(text)), float(i)] for i, text in enumerate(texts)]
+
+
+class FakeLLM:
+    def invoke(self, messages):
+        step = json.loads(messages[0]["content"].split("working on:\n", 1)[1])
+        return SimpleNamespace(content=json.dumps({"summary": f"did {step['action']}"}))
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    utils = importlib.import_module("cuga.backend.memory.agentic_memory.utils.utils")
+    # The backend builds its client and embedder at class definition; keep the import offline.
+    monkeypatch.setattr(utils, "get_milvus_client", lambda: FakeMilvus())
+    monkeypatch.setattr(utils, "get_embedding_model", lambda name: FakeEmbedder())
+    milvus = importlib.import_module("cuga.backend.memory.agentic_memory.backend.milvus")
+    monkeypatch.setattr(milvus.MilvusMemoryBackend, "milvus", FakeMilvus())
+    monkeypatch.setattr(milvus.MilvusMemoryBackend, "embedding_model", FakeEmbedder())
+    monkeypatch.setattr(milvus, "milvus_config", SimpleNamespace(step_processing={}))
+    monkeypatch.setattr(milvus, "get_chat_model", lambda settings: FakeLLM())
+    return milvus.MilvusMemoryBackend()
+
+
+def test_facts_are_embedded_once_and_inserted_in_order(backend):
+    from cuga.backend.memory.agentic_memory.schema import Fact
+
+    facts = [Fact(content="likes tea"), Fact(content="lives in Paris", metadata={"source": "chat"})]
+    ids = backend.create_and_store_facts("ns", facts)
+
+    assert ids == ["100", "101"]
+    assert backend.embedding_model.calls == [["likes tea", "lives in Paris"]]
+    (rows,) = backend.milvus.inserts
+    assert [row["content"] for row in rows] == ["likes tea", "lives in Paris"]
+    assert [row["metadata"] for row in rows] == [{}, {"source": "chat"}]
+    assert [row["embedding"] for row in rows] == [[9.0, 0.0], [14.0, 1.0]]
+    assert backend.create_and_store_fact("ns", Fact(content="x")) == "102"
+
+
+def test_steps_keep_their_order_through_parallel_extraction(backend):
+    steps = [{"step": {"action": f"click {i}"}, "prompt": "summarize"} for i in range(12)]
+    ids = backend.add_steps("ns", "run_1", steps)
+
+    assert ids == [str(100 + i) for i in range(12)]
+    (rows,) = backend.milvus.inserts
+    assert [row["content"] for row in rows] == [f"did click {i}" for i in range(12)]
+    assert [row["metadata"]["step"] for row in rows] == [item["step"] for item in steps]
+    assert all(row["metadata"]["run_id"] == "run_1" for row in rows)
+    assert backend.embedding_model.calls == [[f"did click {i}" for i in range(12)]]
+
+
+def test_empty_input_skips_milvus_and_the_embedder(backend):
+    assert backend.create_and_store_facts("ns", []) == []
+    assert backend.add_steps("ns", "run_1", []) == []
+    assert backend.milvus.inserts == [] and backend.embedding_model.calls == []
+
+
+def test_bulk_inserts_raise_when_milvus_returns_fewer_ids(backend, monkeypatch):
+    from fastapi import HTTPException
+
+    from cuga.backend.memory.agentic_memory.schema import Fact
+
+    monkeypatch.setattr(type(backend), "milvus", FakeMilvus(drop_ids=1))
+    steps = [{"step": {"action": "a"}, "prompt": "p"}, {"step": {"action": "b"}, "prompt": "p"}]
+    with pytest.raises(HTTPException) as excinfo:
+        backend.add_steps("ns", "run_1", steps)
+    assert excinfo.value.status_code == 500
+    with pytest.raises(HTTPException) as excinfo:
+        backend.create_and_store_facts("ns", [Fact(content="a"), Fact(content="b")])
+    assert excinfo.value.status_code == 500
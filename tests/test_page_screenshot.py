@@ -0,0 +1,30 @@
+import base64
+import io
+
+import numpy as np
+import PIL.Image
+import pytest
+
+pytest.importorskip("playwright")
+
+from cuga.backend.browser_env.page_understanding.extractor_utils.extract_async import (  # noqa: E402
+    PageScreenshot,
+)
+
+
+def _png_base64(rgb: np.ndarray) -> str:
+    with io.BytesIO() as f:
+        PIL.Image.fromarray(rgb).save(f, format="PNG")
+        return base64.b64encode(f.getvalue()).decode()
+
+
+def test_decodes_lazily_and_once():
+    rgb = np.zeros((4, 6, 3), dtype=np.uint8)
+    rgb[:, :, 0] = 255
+    shot = PageScreenshot(_png_base64(rgb))
+    assert shot._array is None and shot._image_bytes is None
+
+    assert np.array_equal(np.asarray(shot), rgb)
+    assert shot.array is shot.array
+    assert shot.image_bytes.startswith(b"\x89PNG")
+    assert np.asarray(shot, dtype=np.float32).dtype == np.float32
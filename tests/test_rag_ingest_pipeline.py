@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cuga.modular import cli
+from cuga.modular.ingest import iter_chunks
+from cuga.modular.memory import VectorMemory
+from cuga.modular.rag import RagLoader
+from cuga.modular.vector_backends.chroma_backend import ChromaBackend
+
+
+def test_iter_chunks_overlaps_windows(tmp_path: Path) -> None:
+    doc = tmp_path / "doc.txt"
+    doc.write_text("w0 w1 w2\nw3 w4 w5 w6\n")
+    assert list(iter_chunks(doc, chunk_size=4, overlap=1)) == ["w0 w1 w2 w3", "w3 w4 w5 w6"]
+    assert list(iter_chunks(doc, chunk_size=3, overlap=0)) == ["w0 w1 w2", "w3 w4 w5", "w6"]
+    assert list(iter_chunks(doc, chunk_size=10, overlap=2)) == ["w0 w1 w2 w3 w4 w5 w6"]
+
+
+def test_ingest_batches_chunks(tmp_path: Path, monkeypatch) -> None:
+    doc = tmp_path / "doc.txt"
+    doc.write_text(" ".join(f"w{i}" for i in range(25)))
+    loader = RagLoader(chunk_size=5, chunk_overlap=0, batch_size=2)
+    calls = []
+    original = loader.memory.remember_many
+    monkeypatch.setattr(
+        loader.memory,
+        "remember_many",
+        lambda texts, metadatas, embeddings=None: calls.append(len(texts)) or original(texts, metadatas),
+    )
+    assert loader.ingest([doc]) == 1
+    assert calls == [2, 2, 1]
+    assert [record.metadata["chunk"] for record in loader.memory.store] == ["0", "1", "2", "3", "4"]
+
+
+def test_manifest_skips_unchanged_and_replaces_changed_files(tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.json"
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_text("alpha beta")
+    second.write_text("gamma delta")
+
+    loader = RagLoader(manifest_path=manifest)
+    assert loader.ingest([first, second]) == 2
+    assert manifest.exists()
+    assert loader.ingest([first, second]) == 0
+
+    second.write_text("gamma epsilon zeta")
+    assert loader.ingest([first, second]) == 1
+    texts = sorted(record.text for record in loader.memory.store)
+    assert texts == ["alpha beta", "gamma epsilon zeta"]
+
+    fresh = RagLoader(manifest_path=manifest)
+    assert fresh.ingest([first, second]) == 0
+
+
+def test_ingest_with_process_pool(tmp_path: Path) -> None:
+    files = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"document number{i} text")
+        files.append(path)
+    loader = RagLoader(workers=2)
+    assert loader.ingest(files) == 5
+    assert sorted(record.metadata["path"] for record in loader.memory.store) == sorted(str(p) for p in files)
+
+
+def test_manifest_prunes_deleted_files(tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.json"
+    kept, removed = tmp_path / "kept.txt", tmp_path / "removed.txt"
+    kept.write_text("alpha beta")
+    removed.write_text("gamma delta")
+
+    loader = RagLoader(manifest_path=manifest)
+    assert loader.ingest([kept, removed]) == 2
+    removed.unlink()
+    assert loader.ingest([kept]) == 0
+    assert [record.text for record in loader.memory.store] == ["alpha beta"]
+    assert list(loader.manifest.files) == [str(kept)]
+
+
+def test_cli_incremental_ingest_restores_state_without_re_embedding(tmp_path: Path, monkeypatch) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("alpha beta")
+    (docs / "b.txt").write_text("gamma delta")
+    argv = [
+        "--state",
+        str(tmp_path / "state.json"),
+        "ingest",
+        str(docs),
+        "--manifest",
+        str(tmp_path / "m.json"),
+    ]
+    cli.main(argv)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("restored records must not be re-embedded")
+
+    monkeypatch.setattr(VectorMemory, "remember", fail)
+    (docs / "b.txt").unlink()
+    (docs / "c.txt").write_text("epsilon zeta")
+    cli.main(argv)
+    records = cli._read_records(tmp_path / "state.json")
+    assert sorted(record.text for record in records) == ["alpha beta", "epsilon zeta"]
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.rows = {"1": {"path": "a"}, "2": {"path": "b"}, "3": {"path": "a"}}
+
+    def get(self, where, include):
+        ((key, value),) = where.items()
+        return {"ids": [row_id for row_id, meta in self.rows.items() if meta.get(key) == value]}
+
+    def delete(self, ids):
+        for row_id in ids:
+            del self.rows[row_id]
+
+
+def test_chroma_delete_where() -> None:
+    backend = ChromaBackend()
+    backend._collection = _FakeCollection()
+    assert backend.delete_where("path", "a") == 2
+    assert backend.delete_where("path", "missing") == 0
+    assert list(backend._collection.rows) == ["2"]
+
+
+def test_faiss_delete_where_via_forget_where() -> None:
+    pytest.importorskip("faiss")
+    memory = VectorMemory(backend_name="faiss")
+    memory.connect_backend()
+    memory.remember_many(["alpha", "beta", "gamma"], [{"path": "a"}, {"path": "b"}, {"path": "a"}])
+    assert memory.forget_where("path", "a") == 2
+    assert [hit.text for hit in memory.search("alpha", top_k=3)] == ["beta"]
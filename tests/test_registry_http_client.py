@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from cuga.backend.tools_env.registry.utils.http_client import (
+    SANDBOX_CLIENT_CODE,
+    call_registry_batch,
+    call_registry_function,
+    close_registry_session,
+    registry_session,
+)
+
+
+@pytest_asyncio.fixture
+async def registry():
+    peers = []
+
+    async def call(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        body = await request.json()
+        if body["function_name"] == "boom":
+            return web.Response(status=500, text="boom")
+        return web.json_response({"echo": body["args"]})
+
+    async def call_batch(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        body = await request.json()
+        return web.json_response(
+            {"results": [{"status_code": 200, "result": c["function_name"]} for c in body["calls"]]}
+        )
+
+    app = web.Application()
+    app.router.add_post("/functions/call", call)
+    app.router.add_post("/functions/call_batch", call_batch)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", peers
+    await close_registry_session()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_calls_reuse_one_connection(registry):
+    base, peers = registry
+    for i in range(5):
+        assert await call_registry_function(base, "app", "echo", {"i": i}) == {"echo": {"i": i}}
+    assert len(peers) == 5 and len(set(peers)) == 1
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises(registry):
+    base, _ = registry
+    with pytest.raises(Exception, match="HTTP Error: 500 - boom"):
+        await call_registry_function(base, "app", "boom")
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_results_in_order(registry):
+    base, _ = registry
+    calls = [{"app_name": "app", "function_name": name} for name in ("a", "b", "c")]
+    results = await call_registry_batch(base, calls)
+    assert [r["result"] for r in results] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_session_on_another_loop_is_closed_when_that_loop_shuts_down(registry):
+    base, _ = registry
+
+    async def call_from_worker_loop():
+        assert await call_registry_function(base, "app", "echo", {"x": 1}) == {"echo": {"x": 1}}
+        return registry_session()
+
+    session = await asyncio.to_thread(asyncio.run, call_from_worker_loop())
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_close_before_the_closer_started():
+    session = registry_session()
+    await close_registry_session()
+    await asyncio.sleep(0)
+    assert session.closed
+    assert registry_session() is not session
+    await close_registry_session()
+
+
+@pytest.mark.asyncio
+async def test_sandbox_client_keeps_connection_alive(registry):
+    base, peers = registry
+    namespace = {"json": json}
+    exec(SANDBOX_CLIENT_CODE, namespace)
+    post = namespace["_registry_post"]
+
+    def run():
+        payload = {"app_name": "app", "function_name": "echo", "args": {"x": 1}}
+        return [post(f"{base}/functions/call", payload) for _ in range(3)]
+
+    assert await asyncio.to_thread(run) == [{"echo": {"x": 1}}] * 3
+    assert len(set(peers)) == 1
+
+    with pytest.raises(Exception, match="HTTP Error: 500"):
+        await asyncio.to_thread(post, f"{base}/functions/call", {"function_name": "boom", "args": {}})
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import datetime
+
+import httpx
+import pytest
+import respx
+
+from cuga.backend.tools_env.registry.mcp_manager.schema_cache import SchemaCache, content_digest
+
+SPEC_URL = "http://specs.local/openapi.json"
+SPEC = '{"openapi": "3.0.0", "paths": {}}'
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_network(tmp_path):
+    cache = SchemaCache(tmp_path, ttl_s=3600)
+    with respx.mock(assert_all_called=False) as router:
+        route = router.get(SPEC_URL).mock(
+            return_value=httpx.Response(
+                200, text=SPEC, headers={"ETag": '"v1"', "Content-Type": "application/json"}
+            )
+        )
+        first = await cache.fetch(SPEC_URL)
+        second = await SchemaCache(tmp_path, ttl_s=3600).fetch(SPEC_URL)
+
+    assert route.call_count == 1
+    assert not first.from_cache and second.from_cache
+    assert second.text == SPEC and second.digest == content_digest(SPEC)
+    assert "json" in second.content_type
+    assert (tmp_path / "blobs" / content_digest(SPEC)).read_text() == SPEC
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_conditionally(tmp_path):
+    cache = SchemaCache(tmp_path, ttl_s=0)
+    with respx.mock() as router:
+        route = router.get(SPEC_URL)
+        route.side_effect = [
+            httpx.Response(200, text=SPEC, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+        await cache.fetch(SPEC_URL)
+        revalidated = await cache.fetch(SPEC_URL)
+
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert revalidated.from_cache and revalidated.text == SPEC
+
+
+@pytest.mark.asyncio
+async def test_changed_spec_replaces_entry(tmp_path):
+    cache = SchemaCache(tmp_path, ttl_s=0)
+    updated = '{"openapi": "3.1.0", "paths": {}}'
+    with respx.mock() as router:
+        router.get(SPEC_URL).side_effect = [
+            httpx.Response(200, text=SPEC, headers={"ETag": '"v1"'}),
+            httpx.Response(200, text=updated, headers={"ETag": '"v2"'}),
+        ]
+        await cache.fetch(SPEC_URL)
+        fetched = await cache.fetch(SPEC_URL)
+
+    assert fetched.text == updated and not fetched.from_cache
+    assert fetched.digest == content_digest(updated)
+
+
+@pytest.mark.asyncio
+async def test_offline_start_uses_cached_copy(tmp_path):
+    cache = SchemaCache(tmp_path, ttl_s=0)
+    with respx.mock() as router:
+        router.get(SPEC_URL).side_effect = [httpx.Response(200, text=SPEC), httpx.ConnectError("offline")]
+        await cache.fetch(SPEC_URL)
+        offline = await cache.fetch(SPEC_URL)
+    assert offline.from_cache and offline.text == SPEC
+
+    with respx.mock() as router:
+        router.get("http://specs.local/other.json").mock(side_effect=httpx.ConnectError("offline"))
+        with pytest.raises(httpx.ConnectError):
+            await cache.fetch("http://specs.local/other.json")
+
+
+def test_derived_entries_are_keyed_by_content_and_overrides(tmp_path):
+    cache = SchemaCache(tmp_path)
+    digest = content_digest(SPEC)
+    key = SchemaCache.derived_key(digest, {"include": ["a"], "api_overrides": None})
+
+    assert cache.load_derived(key) is None
+    cache.store_derived(key, {"schema": {"paths": {}}, "parser": {}, "server_url": None})
+    assert cache.load_derived(key)["schema"] == {"paths": {}}
+    assert key != SchemaCache.derived_key(digest, {"include": ["b"], "api_overrides": None})
+    assert key != SchemaCache.derived_key(
+        content_digest(SPEC + " "), {"include": ["a"], "api_overrides": None}
+    )
+
+
+def test_stored_derived_entry_matches_what_a_warm_start_loads(tmp_path):
+    cache = SchemaCache(tmp_path)
+    key = SchemaCache.derived_key(content_digest(SPEC), None)
+    # what yaml.safe_load gives for unquoted response codes and dates
+    value = {"schema": {"responses": {200: {"description": "ok"}}, "released": datetime.date(2024, 5, 1)}}
+
+    stored = cache.store_derived(key, value)
+    assert stored == cache.load_derived(key)
+    assert stored["schema"] == {"responses": {"200": {"description": "ok"}}, "released": "2024-05-01"}
+
+
+@pytest.mark.asyncio
+async def test_cold_and_warm_registry_loads_agree(tmp_path):
+    mcp_manager = pytest.importorskip("cuga.backend.tools_env.registry.mcp_manager.mcp_manager")
+    from cuga.backend.tools_env.registry.config.config_loader import ServiceConfig
+
+    spec = tmp_path / "shop.yaml"
+    spec.write_text(
+        "openapi: 3.0.0\n"
+        "info: {title: Shop, version: '1'}\n"
+        "servers: [{url: 'http://shop.local'}]\n"
+        "paths:\n"
+        "  /items:\n"
+        "    get:\n"
+        "      operationId: list_items\n"
+        "      responses:\n"
+        "        200:\n"
+        "          description: ok\n"
+        "          content: {application/json: {schema: {type: array}}}\n"
+    )
+    config = ServiceConfig(url=str(spec))
+    manager = mcp_manager.MCPManager({}, schema_cache=SchemaCache(tmp_path / "cache"))
+
+    cold_schema, cold_parser, cold_url = await manager._load_openapi_schema(config)
+    warm_schema, warm_parser, warm_url = await manager._load_openapi_schema(config)
+    assert cold_schema == warm_schema and cold_url == warm_url == "http://shop.local"
+    assert cold_parser.document == warm_parser.document
+    assert "200" in cold_schema["paths"]["/items"]["get"]["responses"]
@@ -0,0 +1,85 @@
+import base64
+import io
+
+import numpy as np
+import PIL.Image
+import PIL.ImageDraw
+import pytest
+
+pytest.importorskip("playwright")
+
+from cuga.backend.browser_env.page_understanding.extractor_utils.screenshot_encoding import (  # noqa: E402
+    ScreenshotEncoder,
+    ScreenshotOptions,
+    difference_hash,
+)
+
+
+def _frame(seed: int, width: int = 320, height: int = 200, image_format: str = "PNG") -> str:
+    rgb = np.full((height, width, 3), 255, dtype=np.uint8)
+    rng = np.random.default_rng(seed)
+    for _ in range(12):
+        x, y = rng.integers(0, width - 40), rng.integers(0, height - 20)
+        rgb[y : y + 20, x : x + 40] = rng.integers(0, 200, 3)
+    with io.BytesIO() as f:
+        PIL.Image.fromarray(rgb).save(f, format=image_format)
+        return base64.b64encode(f.getvalue()).decode()
+
+
+def test_defaults_pass_frames_through():
+    options = ScreenshotOptions()
+    assert options.cdp_params() == {"format": "png"}
+    frame = _frame(0)
+    shot = ScreenshotEncoder(options).encode(frame)
+    assert shot.base64 is frame and shot.mime_type == "image/png"
+
+
+def test_downscales_to_the_configured_size():
+    options = ScreenshotOptions(format="jpg", quality=60, max_width=160)
+    assert options.cdp_params() == {"format": "jpeg", "quality": 60}
+    frame = _frame(0, image_format="JPEG")
+    shot = ScreenshotEncoder(options).encode(frame)
+    assert shot.mime_type == "image/jpeg" and shot.data_url.startswith("data:image/jpeg;base64,")
+    assert shot.array.shape == (100, 160, 3)
+    assert len(shot.base64) < len(frame)
+
+    with pytest.raises(ValueError):
+        ScreenshotOptions(format="gif")
+
+
+def test_dedup_reuses_the_previous_frame_until_the_page_changes():
+    encoder = ScreenshotEncoder(ScreenshotOptions(dedup_distance=4))
+    first = encoder.encode(_frame(0))
+    assert not first.duplicate
+    again = encoder.encode(_frame(0, image_format="PNG"))
+    assert again.duplicate and again.base64 is first.base64
+    changed = encoder.encode(_frame(1))
+    assert not changed.duplicate and changed.base64 != first.base64
+    assert encoder.encode(_frame(1)).duplicate
+
+    # a new task starts from scratch
+    encoder.reset()
+    assert not encoder.encode(_frame(1)).duplicate
+
+
+def test_dedup_keeps_small_edits_the_hash_misses():
+    page = PIL.Image.new("RGB", (1280, 720), "white")
+    draw = PIL.ImageDraw.Draw(page)
+    draw.rectangle((100, 100, 113, 113), outline="black")
+    draw.rectangle((100, 200, 400, 224), outline="gray")
+
+    def encode(image: PIL.Image.Image) -> str:
+        with io.BytesIO() as f:
+            image.save(f, format="PNG")
+            return base64.b64encode(f.getvalue()).decode()
+
+    checked, typed = page.copy(), page.copy()
+    PIL.ImageDraw.Draw(checked).line((102, 107, 106, 111, 111, 102), fill="black", width=2)
+    PIL.ImageDraw.Draw(typed).text((104, 206), "a", fill="black")
+    for edited in (checked, typed):
+        # a few bits at most: the hash alone would reuse the stale frame
+        assert bin(difference_hash(page) ^ difference_hash(edited)).count("1") <= 4
+        encoder = ScreenshotEncoder(ScreenshotOptions(dedup_distance=4))
+        first = encoder.encode(encode(page))
+        assert encoder.encode(encode(page)).base64 is first.base64
+        assert not encoder.encode(encode(edited)).duplicate
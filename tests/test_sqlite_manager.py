@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+pytest.importorskip("pymilvus")
+
+from cuga.backend.memory.agentic_memory.db.sqlite_manager import SQLiteManager  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    yield str(tmp_path / "agentic.db")
+    SQLiteManager.close_all()
+
+
+def test_pool_is_shared_across_context_managers(db_path) -> None:
+    with SQLiteManager(db_path) as first:
+        first.create_namespace("ns", user_id="u")
+        pool = first._pool
+    with SQLiteManager(db_path) as second:
+        assert second._pool is pool
+        assert second.get_namespace("ns").user_id == "u"
+        assert [n.id for n in second.search_namespaces(user_id="u")] == ["ns"]
+
+
+def test_wal_mode_and_indexes(db_path) -> None:
+    with SQLiteManager(db_path):
+        pass
+    connection = sqlite3.connect(db_path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_runs_namespace_created" in indexes
+    connection.close()
+
+
+def test_batched_run_writes(db_path) -> None:
+    with SQLiteManager(db_path) as db:
+        db.create_namespace("ns")
+        runs = db.create_runs("ns", ["r1", "r2", "r3"])
+        assert [run.id for run in runs] == ["r1", "r2", "r3"]
+        db.end_runs("ns", ["r1", "r3"])
+        assert {run.id: bool(run.ended) for run in db.all_runs("ns")} == {"r1": True, "r2": False, "r3": True}
+
+        with pytest.raises(RuntimeError, match="already exists"):
+            db.create_runs("ns", ["r4", "r2"])
+        # The failed batch was rolled back as a whole.
+        assert db.get_run("ns", "r4") is None
+        db.create_run("ns", "r4")
+        assert db.get_run("ns", "r4").id == "r4"
+
+
+def test_concurrent_readers_and_writer(db_path) -> None:
+    with SQLiteManager(db_path) as db:
+        db.create_namespace("ns")
+    errors = []
+
+    def write(worker: int) -> None:
+        try:
+            with SQLiteManager(db_path) as db:
+                for i in range(20):
+                    db.create_run("ns", f"w{worker}_{i}")
+        except Exception as e:  # pragma: no cover - surfaced by the assertion below
+            errors.append(e)
+
+    def read() -> None:
+        try:
+            with SQLiteManager(db_path) as db:
+                for _ in range(50):
+                    db.all_runs("ns")
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(3)]
+    threads += [threading.Thread(target=read) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with SQLiteManager(db_path) as db:
+        assert len(db.all_runs("ns")) == 60
@@ -96,3 +96,13 @@ def test_fastapi_surface(monkeypatch):
     stream = client.post("/execute", headers={"X-Token": "t"}, json={"goal": "hi"})
     assert stream.status_code == 200
     assert any(line.startswith("data") for line in stream.iter_text().splitlines())
+
+
+def test_metrics_endpoint_renders_prometheus_text():
+    from cuga.backend.app import prometheus_metrics
+    from cuga.mcp.telemetry.metrics import metrics
+
+    metrics.counter("mcp.calls").inc()
+    response = asyncio.run(prometheus_metrics())
+    assert response.media_type.startswith("text/plain")
+    assert "mcp_calls_total" in response.content
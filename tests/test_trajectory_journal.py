@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+
+from cuga.backend.activity_tracker.trajectory_log import (
+    TrajectoryJournalWriter,
+    append_record,
+    compact_journal,
+    encode_record,
+    journal_path_for,
+    read_journal,
+)
+
+
+def test_journal_path_for_trajectory_file(tmp_path) -> None:
+    path = str(tmp_path / "task_1.json")
+    assert journal_path_for(path) == str(tmp_path / "task_1.jsonl")
+    assert journal_path_for(str(tmp_path / "task_1.jsonl")) == str(tmp_path / "task_1.jsonl")
+
+
+def test_writer_appends_and_compacts_to_json_layout(tmp_path) -> None:
+    journal = str(tmp_path / "task.jsonl")
+    output = str(tmp_path / "task.json")
+    writer = TrajectoryJournalWriter(fsync_interval=0.05)
+    writer.submit(journal, "meta", {"intent": "find", "task_id": "task", "score": 0.0})
+    for i in range(5):
+        writer.submit(journal, "step", {"step": {"name": f"s{i}", "data": str(i)}})
+    assert writer.flush(timeout=5)
+    writer.close()
+
+    with open(journal, encoding="utf-8") as f:
+        assert len(f.readlines()) == 6
+
+    count = compact_journal(journal, output, meta={"score": 1.0})
+    assert count == 5
+    with open(output, encoding="utf-8") as f:
+        data = json.load(f)
+    assert [step["name"] for step in data["steps"]] == ["s0", "s1", "s2", "s3", "s4"]
+    assert data["intent"] == "find"
+    assert data["score"] == 1.0
+
+
+def test_read_journal_orders_by_timestamp_and_skips_truncated_line(tmp_path) -> None:
+    journal = str(tmp_path / "task.jsonl")
+    append_record(journal, encode_record("step", {"step": {"name": "late"}}, ts=2.0))
+    append_record(journal, encode_record("step", {"step": {"name": "early"}}, ts=1.0))
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"kind": "step", "ts": 3.0, "step": {"na')
+
+    steps, meta = read_journal(journal)
+    assert [step["name"] for step in steps] == ["early", "late"]
+    assert meta == {}
+
+
+def test_tracker_flushes_json_at_final_answer_and_reset_drops_stale_files(tmp_path, monkeypatch) -> None:
+    from cuga.backend.activity_tracker.tracker import ActivityTracker, Step
+    from cuga.config import settings
+
+    monkeypatch.setattr(settings.advanced_features, "tracker_enabled", True)
+    monkeypatch.setattr(settings.advanced_features, "enable_memory", False)
+    tracker = ActivityTracker()
+    monkeypatch.setattr(tracker, "_base_dir", str(tmp_path))
+    monkeypatch.setattr(tracker, "experiment_folder", "exp")
+    tracker.reset(intent="find", task_id="task")
+    trajectory = tmp_path / "exp" / "task.json"
+
+    tracker.collect_step(Step(name="PlannerAgent", data="{}"))
+    assert tracker.reload_steps("task") and [step.name for step in tracker.steps] == ["PlannerAgent"]
+    assert not trajectory.exists()  # the JSON is only written at flush points
+
+    tracker.collect_step(Step(name="FinalAnswerAgent", data="{}"))
+    with open(trajectory, encoding="utf-8") as f:
+        assert [step["name"] for step in json.load(f)["steps"]] == ["PlannerAgent", "FinalAnswerAgent"]
+
+    tracker.reset(intent="find again", task_id="task")
+    assert not trajectory.exists() and not (tmp_path / "exp" / "task.jsonl").exists()
+    assert tracker._journaled_meta == set() and "_journaled_meta" not in ActivityTracker.__dict__
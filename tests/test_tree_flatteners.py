@@ -0,0 +1,67 @@
+from cuga.backend.browser_env.page_understanding.tranformer_utils.dom_transform_utils import (
+    flatten_domtree_to_str,
+)
+from cuga.backend.browser_env.page_understanding.tranformer_utils.transform_utils import flatten_axtree_to_str
+from cuga.backend.browser_env.page_understanding.types.dom_tree_types import DomTreeResult
+
+
+def _ax_node(node_id, role, name=None, children=(), **extra):
+    node = {"nodeId": node_id, "role": {"value": role}, "childIds": list(children), **extra}
+    if name is not None:
+        node["name"] = {"value": name}
+    return node
+
+
+def test_axtree_lines_in_document_order():
+    tree = {
+        "nodes": [
+            _ax_node("1", "RootWebArea", "Shop", ["2", "5", "missing"], browsergym_id="r"),
+            _ax_node("2", "generic", None, ["3"]),
+            _ax_node(
+                "3",
+                "link",
+                "Home",
+                ["4"],
+                browsergym_id="a",
+                properties=[
+                    {"name": "url", "value": {"value": "/"}},
+                    {"name": "focusable", "value": {"value": True}},
+                ],
+            ),
+            _ax_node("4", "StaticText", "Home"),
+            _ax_node("5", "textbox", "Search", [], browsergym_id="t", value={"value": "shoes"}),
+        ]
+    }
+    extra = {"t": {"visibility": 0.0, "bbox": [0, 0, 10, 10], "clickable": True, "set_of_marks": False}}
+
+    assert flatten_axtree_to_str(tree, extra, with_clickable=True) == (
+        "[r] RootWebArea 'Shop'\n\t[a] link 'Home', url='/'\n\t[t] textbox 'Search' value='shoes', clickable"
+    )
+    assert flatten_axtree_to_str(tree, extra, filter_visible_only=True) == (
+        "[r] RootWebArea 'Shop'\n\t[a] link 'Home', url='/'"
+    )
+
+
+def test_flatteners_handle_pages_deeper_than_the_recursion_limit():
+    depth = 3000
+    nodes = [_ax_node(str(i), "group", f"g{i}", [str(i + 1)]) for i in range(depth)]
+    nodes.append(_ax_node(str(depth), "button", "Deep", browsergym_id="deep"))
+    ax_text = flatten_axtree_to_str({"nodes": nodes})
+    assert ax_text.splitlines()[-1] == "\t" * depth + "[deep] button 'Deep'"
+
+    node_map = {
+        str(i): {
+            "tagName": "DIV",
+            "attributes": {"id": f"d{i}"},
+            "xpath": f"/div[{i}]",
+            "domTreeId": i,
+            "children": [str(i + 1)],
+            "highlightIndex": i + 1,
+        }
+        for i in range(depth)
+    }
+    node_map[str(depth)] = {"type": "TEXT_NODE", "text": " bottom ", "isVisible": True}
+    dom_tree = DomTreeResult.model_validate({"rootId": "0", "map": node_map})
+    dom_text = flatten_domtree_to_str(dom_tree)
+    assert dom_text.splitlines()[0] == "[0] div 'd0'"
+    assert dom_text.splitlines()[-1] == "\t" * depth + 'text "bottom"'